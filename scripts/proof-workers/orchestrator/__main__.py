@@ -6,6 +6,7 @@ import argparse
 import shutil
 import sys
 import time
+from operator import attrgetter
 from pathlib import Path
 
 from .config import (
@@ -39,7 +40,7 @@ def _resolve_configs(args: argparse.Namespace) -> list["RunConfig"]:
 def cmd_launch(args: argparse.Namespace) -> None:
     """Launch unified parallel workers in a tmux session."""
     from . import git, tmux
-    from .issues import next_available_issue_global
+    from .issues import fetch_issue_bodies, next_available_issue_global, status_counts
     from .prompt import generate_prompt
 
     configs = _resolve_configs(args)
@@ -98,9 +99,10 @@ def cmd_launch(args: argparse.Namespace) -> None:
     # Show config info
     for cfg in configs:
         total = len(cfg.issues)
-        pending = sum(1 for i in cfg.issues if i.status in ("pending", "in_progress"))
-        completed = sum(1 for i in cfg.issues if i.status == "completed")
-        failed = sum(1 for i in cfg.issues if i.status == "failed")
+        counts = status_counts(cfg)
+        pending = counts["pending"] + counts["in_progress"]
+        completed = counts["completed"]
+        failed = counts["failed"]
         print(f"  {cfg.project}: {total} issues ({completed} done, {pending} pending, {failed} failed)")
         print(f"    Pipeline: {' -> '.join(cfg.pipeline)}")
     print(f"  Workers: {num_workers}")
@@ -174,6 +176,14 @@ def cmd_launch(args: argparse.Namespace) -> None:
                 from .models import Worker
                 idle_worker = Worker(worker_id=wid, status="idle")
                 state.save_worker(idle_worker)
+        # Prefetch issue bodies for all initial assignments: one platform
+        # request per repo instead of one per worker prompt. Bodies cached
+        # by an earlier run are revalidated (ETag) in case they were edited.
+        by_config: dict[str, tuple["RunConfig", list["Issue"]]] = {}
+        for _, issue_cfg, issue in assignments:
+            by_config.setdefault(str(issue_cfg.config_path), (issue_cfg, []))[1].append(issue)
+        for issue_cfg, issues in by_config.values():
+            fetch_issue_bodies(issues, issue_cfg, StateManager(issue_cfg), revalidate=True)
     for worker_id, issue_cfg, issue in assignments:
         repo_cfg = issue_cfg.repo_for_issue(issue)
         branch = f"{repo_cfg.branch_prefix}{issue.number}"
@@ -217,7 +227,6 @@ def cmd_launch(args: argparse.Namespace) -> None:
         wt_path = f"{repo_cfg.worktree_base}/issue-{issue.number}"
         log_file = state.log_path(worker_id)
         signal_file = state.signal_path(worker_id)
-        prompt_path = state.prompt_path(worker_id)
 
         print(f"  Worker {worker_id}: #{issue.number} [{issue_cfg.project}] -> {log_file}")
 
@@ -229,8 +238,6 @@ def cmd_launch(args: argparse.Namespace) -> None:
             prompt = generate_prompt(
                 stage_name, issue, worker_id, wt_path, repo_cfg, issue_cfg, issue_state,
             )
-            prompt_path.write_text(prompt)
-
             # Update worker state
             worker = state.load_worker(worker_id)
             if worker:
@@ -243,14 +250,9 @@ def cmd_launch(args: argparse.Namespace) -> None:
             issue_state.update_issue_status(issue.number, "in_progress", assigned_worker=worker_id)
 
             # Launch in tmux
-            from .monitor import _build_claude_cmd
-            tmux.send_command(
-                tmux_session,
-                f"worker-{worker_id}",
-                _build_claude_cmd(wt_path, str(prompt_path), str(log_file),
-                                  str(signal_file), worker_id, issue.number,
-                                  stage_name),
-            )
+            from .monitor import _launch_claude
+            _launch_claude(tmux_session, state, worker_id, wt_path, issue.number, stage_name,
+                           prompt)
 
         # Stagger launches
         if idx < len(assignments) - 1:
@@ -341,7 +343,7 @@ def cmd_cleanup(args: argparse.Namespace) -> None:
 
 def cmd_status(args: argparse.Namespace) -> None:
     """Display one-shot status."""
-    from .issues import get_completed_count, get_failed_count, get_pending_count
+    from .issues import status_counts
 
     configs = _resolve_configs(args)
     num_workers = getattr(args, "workers", None) or NUM_WORKERS
@@ -364,9 +366,10 @@ def cmd_status(args: argparse.Namespace) -> None:
 
     for cfg in configs:
         total = len(cfg.issues)
-        completed = get_completed_count(cfg)
-        pending = get_pending_count(cfg)
-        failed = get_failed_count(cfg)
+        counts = status_counts(cfg)
+        completed = counts["completed"]
+        pending = counts["pending"] + counts["in_progress"]
+        failed = counts["failed"]
         total_all += total
         completed_all += completed
         pending_all += pending
@@ -400,19 +403,19 @@ def cmd_status(args: argparse.Namespace) -> None:
 
     # Pending issues across all projects
     for cfg in configs:
-        pending_issues = [i for i in cfg.issues if i.status == "pending"]
+        pending_issues = cfg.issues_with_status("pending")
         if pending_issues:
             print(f"Pending [{cfg.project}]:")
-            for issue in sorted(pending_issues, key=lambda i: (i.wave, i.priority)):
-                deps = f" (depends on: {issue.depends_on})" if issue.depends_on else ""
+            for issue in sorted(pending_issues, key=attrgetter("sort_key")):
+                deps = f" (depends on: {sorted(issue.depends_on)})" if issue.depends_on else ""
                 print(f"  #{issue.number}: {issue.title} [wave {issue.wave}]{deps}")
 
     # Failed issues across all projects
     for cfg in configs:
-        failed_issues = [i for i in cfg.issues if i.status == "failed"]
+        failed_issues = cfg.issues_with_status("failed")
         if failed_issues:
             print(f"Failed [{cfg.project}]:")
-            for issue in sorted(failed_issues, key=lambda i: (i.wave, i.priority)):
+            for issue in sorted(failed_issues, key=attrgetter("sort_key")):
                 print(f"  #{issue.number}: {issue.title}")
 
 
@@ -430,8 +433,6 @@ def cmd_dashboard(args: argparse.Namespace) -> None:
 
 def cmd_add_issue(args: argparse.Namespace) -> None:
     """Add an issue mid-run."""
-    import json
-
     cfg = load_config(args.config)
 
     # Check if issue already exists
@@ -441,8 +442,8 @@ def cmd_add_issue(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Add to config file
-    with open(cfg.config_path) as f:
-        raw = json.load(f)
+    from .state import atomic_write, read_json
+    raw = read_json(cfg.config_path)
 
     new_issue = {
         "number": args.number,
@@ -455,7 +456,6 @@ def cmd_add_issue(args: argparse.Namespace) -> None:
     }
     raw["issues"].append(new_issue)
 
-    from .state import atomic_write
     atomic_write(cfg.config_path, raw)
 
     print(f"Added issue #{args.number}: {new_issue['title']} (wave {args.wave}, priority {args.priority})")
@@ -4,15 +4,37 @@ from __future__ import annotations
 
 import json
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import Issue, ProjectContext, RepoConfig
 
 # Global worker count — easy to change: 1, 2, 5, etc.
 NUM_WORKERS = 5
 
+# What load_config raises for a config file that vanished or is malformed
+# (bad JSON, missing keys, wrong types); it sys.exit()s only if the file
+# is missing before it starts
+CONFIG_LOAD_ERRORS = (OSError, ValueError, KeyError, TypeError, AttributeError)
+
+
+def read_json(path: Path):
+    """Parse a JSON file, using orjson when it's installed.
+
+    Raises json.JSONDecodeError on bad input either way (orjson's error
+    subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
 
 @dataclass
 class RunConfig:
@@ -37,6 +59,20 @@ class RunConfig:
     orch_root: Optional[Path] = None
     state_dir: Optional[Path] = None
 
+    # Lazily built {number: Issue} index; rebuilt if `issues` is replaced or resized
+    _issue_index: Optional[dict[int, Issue]] = field(default=None, init=False, repr=False, compare=False)
+    _issue_index_src: Optional[list[Issue]] = field(default=None, init=False, repr=False, compare=False)
+    _issue_index_len: int = field(default=-1, init=False, repr=False, compare=False)
+    # Scheduler dependency table, owned by issues._remaining_indegree
+    _dep_table: Optional[object] = field(default=None, init=False, repr=False, compare=False)
+    # Lazily built {status: {id(issue): issue}}; kept current by
+    # set_issue_status(), which every status change must go through, and
+    # rebuilt if `issues` is replaced or resized
+    _status_index: Optional[dict[str, dict[int, Issue]]] = field(default=None, init=False, repr=False, compare=False)
+    _status_index_src: Optional[list[Issue]] = field(default=None, init=False, repr=False, compare=False)
+    _status_index_len: int = field(default=-1, init=False, repr=False, compare=False)
+    _issue_pos: dict[int, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def primary_repo(self) -> RepoConfig:
         """Return the first (or only) repo config."""
         if not self.repos:
@@ -51,9 +87,68 @@ class RunConfig:
 
     def get_issue(self, number: int) -> Optional[Issue]:
         """Find an issue by number."""
-        for issue in self.issues:
-            if issue.number == number:
-                return issue
+        if (self._issue_index is None
+                or self._issue_index_src is not self.issues
+                or self._issue_index_len != len(self.issues)):
+            index: dict[int, Issue] = {}
+            for issue in self.issues:
+                index.setdefault(issue.number, issue)
+            self._issue_index = index
+            self._issue_index_src = self.issues
+            self._issue_index_len = len(self.issues)
+        return self._issue_index.get(number)
+
+    def _status_index_current(self) -> bool:
+        return (self._status_index is not None
+                and self._status_index_src is self.issues
+                and self._status_index_len == len(self.issues))
+
+    def _by_status(self) -> dict[str, dict[int, Issue]]:
+        """Return the status index, rebuilding it if it may be stale."""
+        if not self._status_index_current():
+            index: dict[str, dict[int, Issue]] = {}
+            for issue in self.issues:
+                index.setdefault(issue.status, {})[id(issue)] = issue
+            self._status_index = index
+            self._issue_pos = {id(issue): pos for pos, issue in enumerate(self.issues)}
+            self._status_index_src = self.issues
+            self._status_index_len = len(self.issues)
+        return self._status_index
+
+    def status_counts(self) -> Counter[str]:
+        """Return {status: issue count}."""
+        return Counter({status: len(members) for status, members in self._by_status().items()
+                        if members})
+
+    def issues_with_status(self, status: str) -> list[Issue]:
+        """Return the issues in `status`, in config order."""
+        members = self._by_status().get(status)
+        if not members:
+            return []
+        return sorted(members.values(), key=lambda issue: self._issue_pos[id(issue)])
+
+    def issue_numbers_with_status(self, status: str) -> set[int]:
+        """Return the numbers of the issues in `status` (a fresh set)."""
+        return {issue.number for issue in self._by_status().get(status, {}).values()}
+
+    def set_issue_status(self, issue: Issue, status: str) -> None:
+        """Set one of this config's issues' status, updating the index in place.
+
+        Assigning issue.status directly leaves the index stale.
+        """
+        old = issue.status
+        issue.status = status
+        if old == status or not self._status_index_current():
+            return
+        if self._status_index.get(old, {}).pop(id(issue), None) is None:
+            self._status_index = None  # not where the index had it; rebuild
+            return
+        self._status_index.setdefault(status, {})[id(issue)] = issue
+
+    def next_stage_name(self, stage_idx: int) -> Optional[str]:
+        """Return the pipeline stage after stage_idx, or None if stage_idx is the last."""
+        if 0 <= stage_idx + 1 < len(self.pipeline):
+            return self.pipeline[stage_idx + 1]
         return None
 
     def repo_for_issue_by_number(self, issue_number: int) -> Optional[RepoConfig]:
@@ -75,8 +170,7 @@ def load_config(config_path: str | Path) -> RunConfig:
         print(f"ERROR: Config not found: {config_path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(config_path) as f:
-        raw = json.load(f)
+    raw = read_json(config_path)
 
     cfg = RunConfig()
     cfg.config_path = config_path.resolve()
@@ -195,7 +289,7 @@ def validate_config(cfg: RunConfig) -> list[str]:
                 errors.append(f"Issue #{issue.number} depends on #{dep} which is not in the issue list")
 
     # Detect circular dependencies using DFS
-    dep_map = {i.number: set(i.depends_on) for i in cfg.issues}
+    dep_map = {i.number: i.depends_on for i in cfg.issues}
 
     def has_cycle(node: int, visited: set, stack: set) -> bool:
         visited.add(node)
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from .config import RunConfig, load_config
-from .issues import get_completed_count, get_failed_count, get_pending_count
+from .issues import next_available_issue, status_counts
 from .state import StateManager
 
 
@@ -69,7 +69,6 @@ def _run_rich_dashboard(cfg: RunConfig, state: StateManager) -> None:
         with Live(console=console, refresh_per_second=0.5, screen=True) as live:
             while True:
                 # Reload config from disk to get fresh issue statuses
-                from .config import load_config
                 fresh_cfg = load_config(cfg.config_path)
                 cfg.issues = fresh_cfg.issues
 
@@ -91,8 +90,9 @@ def _build_all_progress(cfg: RunConfig) -> list[str]:
             other_cfg = load_config(config_path)
         except (SystemExit, Exception):
             continue
-        c = get_completed_count(other_cfg)
-        f = get_failed_count(other_cfg)
+        counts = status_counts(other_cfg)
+        c = counts["completed"]
+        f = counts["failed"]
         t = len(other_cfg.issues)
         if t == 0:
             continue
@@ -115,10 +115,11 @@ def _build_rich_display(cfg: RunConfig, state: StateManager,
     from rich import box
 
     elapsed = time.time() - start_time
-    completed = get_completed_count(cfg)
+    counts = status_counts(cfg)
+    completed = counts["completed"]
     total = len(cfg.issues)
-    failed = get_failed_count(cfg)
-    pending = get_pending_count(cfg)
+    failed = counts["failed"]
+    pending = counts["pending"] + counts["in_progress"]
 
     # Worker table
     worker_table = Table(box=box.SIMPLE_HEAVY, show_edge=False, pad_edge=False)
@@ -178,16 +179,15 @@ def _build_rich_display(cfg: RunConfig, state: StateManager,
     ]
 
     # Find current wave
-    in_progress_issues = [i for i in cfg.issues if i.status == "in_progress"]
+    in_progress_issues = cfg.issues_with_status("in_progress")
     if in_progress_issues:
         waves = sorted(set(i.wave for i in in_progress_issues))
         wave_str = ", ".join(str(w) for w in waves)
         status_lines.append(f"  Active waves: {wave_str}")
 
     # Next blocked issue
-    from .issues import next_available_issue
-    completed_set = {i.number for i in cfg.issues if i.status == "completed"}
-    in_progress_set = {i.number for i in cfg.issues if i.status == "in_progress"}
+    completed_set = cfg.issue_numbers_with_status("completed")
+    in_progress_set = cfg.issue_numbers_with_status("in_progress")
     next_issue = next_available_issue(cfg, completed_set, in_progress_set)
     if next_issue:
         status_lines.append(f"  Next available: #{next_issue.number} ({next_issue.title[:40]})")
@@ -228,9 +228,10 @@ def _run_plain_dashboard(cfg: RunConfig, state: StateManager) -> None:
             print("\033[2J\033[H", end="")
 
             elapsed = time.time() - start_time
-            completed = get_completed_count(cfg)
+            counts = status_counts(cfg)
+            completed = counts["completed"]
             total = len(cfg.issues)
-            failed = get_failed_count(cfg)
+            failed = counts["failed"]
 
             print(f"=== Orchestrator: {cfg.project} ===")
             print(f"Running for {_format_duration(elapsed)} | {completed}/{total} issues complete")
@@ -261,7 +262,6 @@ def _run_plain_dashboard(cfg: RunConfig, state: StateManager) -> None:
             print("\nPress Ctrl-C to exit dashboard")
 
             # Reload config to get fresh status
-            from .config import load_config
             fresh_cfg = load_config(cfg.config_path)
             cfg.issues = fresh_cfg.issues
 
@@ -2,22 +2,129 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import re
 import subprocess
 import time
 from typing import Optional
 
-from .config import RunConfig
+from .config import CONFIG_LOAD_ERRORS, RunConfig
 from .issues import (
+    effective_config,
+    load_source_config,
     next_available_issue,
     next_available_issue_global,
     next_available_cross_project,
     next_retriable_issue_global,
 )
-from .models import Decision, WorkerSnapshot
+from .models import Decision, Issue, WorkerSnapshot
 from .state import StateManager
 
 
+@functools.lru_cache(maxsize=256)
+def _noop(worker: int, reason: str) -> Decision:
+    """Return a shared noop decision for (worker, reason)."""
+    return Decision(action="noop", worker=worker, reason=reason)
+
+
+@functools.lru_cache(maxsize=256)
+def _idle(worker: int, reason: str) -> Decision:
+    """Return a shared idle decision for (worker, reason)."""
+    return Decision(action="idle", worker=worker, reason=reason)
+
+
+# Noop decisions for an unchanged snapshot are reused for this long (seconds)
+DECISION_CACHE_TTL = 1.0
+
+# A running worker whose log is still empty after this long hit an API error (seconds)
+EMPTY_LOG_TIMEOUT = 120
+# A log written this recently buys a worker past its wall-clock timeout more time (seconds)
+LOG_ACTIVE_WINDOW = 120
+# Worktree edits this recent mean a quiet worker is still busy (seconds)
+WORKTREE_ACTIVE_WINDOW = 300
+
+# (function, state_dir, worker_id) -> (snapshot fingerprint, monotonic expiry, decisions)
+_decision_cache: dict[tuple[str, str, int], tuple[tuple, float, list[Decision]]] = {}
+
+
+def _snapshot_fingerprint(snapshot: WorkerSnapshot) -> tuple:
+    """The snapshot fields a noop decision depends on."""
+    return (
+        snapshot.status,
+        snapshot.issue_number,
+        snapshot.signal_exists,
+        snapshot.exit_code,
+        snapshot.claude_running,
+        snapshot.retry_count,
+        snapshot.log_size,
+        int(snapshot.log_mtime or 0),
+        # The HEAD/index stamp stands in for the commit list when known, so
+        # fingerprinting doesn't force the lazy git log
+        snapshot.git_stamp if snapshot.git_stamp is not None else bool(snapshot.new_commits.strip()),
+    )
+
+
+def _quiet_noop_ttl(snapshot: WorkerSnapshot, configs: list[RunConfig]) -> float:
+    """How long a noop for this unchanged snapshot stays right (seconds).
+
+    A running worker's noop only turns into an action when one of
+    _handle_running_worker's clocks runs out: wall-clock, stale or empty
+    log, or worktree activity. Until the nearest of those it can be reused
+    for as long as the snapshot stays the same. Any other noop (an idle
+    worker waiting on other workers' issues, say) gets DECISION_CACHE_TTL.
+    """
+    if not snapshot.claude_running or snapshot.signal_exists:
+        return DECISION_CACHE_TTL
+    now = time.time()
+    remaining = []
+    if snapshot.elapsed_seconds is not None:
+        remaining.append(min(c.wall_clock_timeout for c in configs) - snapshot.elapsed_seconds)
+    if snapshot.log_mtime is not None:
+        log_age = now - snapshot.log_mtime
+        limit = EMPTY_LOG_TIMEOUT if snapshot.log_size == 0 else min(c.stall_timeout for c in configs)
+        remaining += [limit - log_age, LOG_ACTIVE_WINDOW - log_age]
+    if snapshot.worktree_mtime is not None:
+        remaining.append(WORKTREE_ACTIVE_WINDOW - (now - snapshot.worktree_mtime))
+    # Thresholds already crossed stay crossed; only the next one can flip the noop
+    upcoming = [r for r in remaining if r > 0]
+    return max(DECISION_CACHE_TTL, min(upcoming)) if upcoming else DECISION_CACHE_TTL
+
+
+def _skip_unchanged(fn):
+    """Reuse a worker's noop decision while its snapshot hasn't changed.
+
+    Only all-noop results are memoized: they have no side effects, so
+    recomputing them for an identical snapshot would just repeat the same
+    state reads. A running worker's noop is kept until its next timeout
+    could fire (see _quiet_noop_ttl), so a steady cycle decides nothing anew.
+    A worker with an entry in idle_assignments always decides afresh, so it
+    takes the issue it was just handed.
+    """
+    @functools.wraps(fn)
+    def wrapper(snapshot: WorkerSnapshot, *args, **kwargs) -> list[Decision]:
+        state = args[1] if len(args) > 1 else kwargs["state"]
+        key = (fn.__name__, str(state.state_dir), snapshot.worker_id)
+        fingerprint = _snapshot_fingerprint(snapshot)
+        now = time.monotonic()
+
+        cached = _decision_cache.get(key)
+        if (cached and cached[0] == fingerprint and now < cached[1]
+                and snapshot.worker_id not in (kwargs.get("idle_assignments") or ())):
+            return list(cached[2])
+
+        decisions = fn(snapshot, *args, **kwargs)
+        if decisions and all(d.action == "noop" for d in decisions):
+            configs = args[0] if isinstance(args[0], list) else [args[0]]
+            expiry = now + _quiet_noop_ttl(snapshot, configs)
+            _decision_cache[key] = (fingerprint, expiry, decisions)
+        else:
+            _decision_cache.pop(key, None)
+        return decisions
+
+    return wrapper
+
+
 def _resolve_effective_config(
     worker_id: int,
     cfg: RunConfig,
@@ -27,29 +134,32 @@ def _resolve_effective_config(
 
     Returns (effective_cfg, effective_state, is_cross_project).
     """
-    from .config import load_config
-
     worker = state.load_worker(worker_id)
     if worker and worker.source_config:
         try:
-            other_cfg = load_config(worker.source_config)
-            other_state = StateManager(other_cfg)
-            return other_cfg, other_state, True
-        except (SystemExit, Exception):
+            other_cfg, other_state = load_source_config(worker.source_config)
+        except CONFIG_LOAD_ERRORS:
             pass
+        else:
+            return other_cfg, other_state, True
     return cfg, state, False
 
 
+@_skip_unchanged
 def compute_decision_global(
     snapshot: WorkerSnapshot,
     configs: list[RunConfig],
     state: StateManager,
     claimed_issues: Optional[set[tuple[str, int]]] = None,
+    *,
+    idle_assignments: Optional[dict[int, tuple[RunConfig, Issue]]] = None,
 ) -> list[Decision]:
     """Compute decisions using global scheduling across all configs.
 
     This is the unified version that replaces per-config + cross-project fallback.
     claimed_issues: set of (config_path_str, issue_number) already claimed this cycle.
+    idle_assignments: {worker_id: (cfg, issue)} from issues.assign_issues; when
+    given, idle workers take their entry instead of searching themselves.
     """
     worker_id = snapshot.worker_id
 
@@ -59,7 +169,10 @@ def compute_decision_global(
     # Worker is idle and not assigned
     if snapshot.status == "idle" or snapshot.issue_number is None:
         # Find highest-priority issue globally
-        result = next_available_issue_global(configs, claimed_issues)
+        if idle_assignments is not None:
+            result = idle_assignments.get(worker_id)
+        else:
+            result = next_available_issue_global(configs, claimed_issues)
         if result:
             issue_cfg, issue = result
             return [Decision(
@@ -80,11 +193,7 @@ def compute_decision_global(
                 reason=f"retrying failed #{retry_issue.number} from {retry_cfg.project}",
                 source_config=str(retry_cfg.config_path),
             )]
-        return [Decision(
-            action="noop",
-            worker=worker_id,
-            reason="idle, no pending or retriable issues",
-        )]
+        return [_noop(worker_id, "idle, no pending or retriable issues")]
 
     # For non-idle workers, find which config owns the current issue
     cfg = _find_owning_config(snapshot.issue_number, configs, state, worker_id)
@@ -106,7 +215,7 @@ def compute_decision_global(
     if snapshot.claude_running:
         return _handle_running_worker(snapshot, cfg, state,
                                        state.get_completed_issues(),
-                                       {i.number for i in cfg.issues if i.status == "in_progress"})
+                                       cfg.issue_numbers_with_status("in_progress"))
 
     # Not running, no signal: process crashed or was killed externally
     if snapshot.status == "running":
@@ -137,11 +246,7 @@ def compute_decision_global(
                 reason="exceeded retry limit after process crash (no progress)",
             )]
 
-    return [Decision(
-        action="noop",
-        worker=worker_id,
-        reason=f"status={snapshot.status}, no action needed",
-    )]
+    return [_noop(worker_id, f"status={snapshot.status}, no action needed")]
 
 
 def _find_owning_config(
@@ -157,10 +262,9 @@ def _find_owning_config(
     # Check worker state for source_config
     worker = state.load_worker(worker_id)
     if worker and worker.source_config:
-        from .config import load_config
         try:
-            return load_config(worker.source_config)
-        except (SystemExit, Exception):
+            return load_source_config(worker.source_config)[0]
+        except CONFIG_LOAD_ERRORS:
             pass
 
     # Search configs
@@ -214,12 +318,14 @@ def _handle_finished_worker_global(
         pipeline = eff_cfg.pipeline
         current_stage_idx = issue.pipeline_stage if issue else 0
 
-        if current_stage_idx + 1 < len(pipeline):
+        next_stage = eff_cfg.next_stage_name(current_stage_idx)
+
+        if next_stage is not None:
             decisions.append(Decision(
                 action="advance_stage",
                 worker=worker_id,
                 issue=issue_num,
-                reason=f"stage {pipeline[current_stage_idx]} done, advancing to {pipeline[current_stage_idx + 1]}",
+                reason=f"stage {pipeline[current_stage_idx]} done, advancing to {next_stage}",
                 source_config=str(eff_cfg.config_path) if is_cross else None,
             ))
         else:
@@ -257,16 +363,12 @@ def _handle_finished_worker_global(
                         source_config=str(retry_cfg.config_path),
                     ))
                 else:
-                    decisions.append(Decision(
-                        action="idle",
-                        worker=worker_id,
-                        reason="no more issues available",
-                    ))
+                    decisions.append(_idle(worker_id, "no more issues available"))
 
     else:
         # Non-zero exit code
         has_progress = bool(snapshot.new_commits.strip())
-        has_output = _has_meaningful_output(snapshot.log_tail)
+        has_output = _has_meaningful_output(snapshot.log_tail, snapshot.log_tail_stripped_len)
 
         # Empty output + non-zero exit = API crash. Defer instead of skip.
         if not has_output and not has_progress and snapshot.retry_count >= 3:
@@ -293,6 +395,7 @@ def _handle_finished_worker_global(
     return decisions
 
 
+@_skip_unchanged
 def compute_decision(
     snapshot: WorkerSnapshot,
     cfg: RunConfig,
@@ -310,7 +413,7 @@ def compute_decision(
     claimed_cross: (config_path, issue_number) pairs already claimed cross-project.
     """
     completed = state.get_completed_issues()
-    in_progress = {i.number for i in cfg.issues if i.status == "in_progress"}
+    in_progress = cfg.issue_numbers_with_status("in_progress")
     if claimed_issues:
         in_progress = in_progress | claimed_issues
     worker_id = snapshot.worker_id
@@ -338,11 +441,7 @@ def compute_decision(
                 reason=f"idle, borrowing #{other_issue.number} from {other_cfg.project}",
                 source_config=str(other_cfg.config_path),
             )]
-        return [Decision(
-            action="noop",
-            worker=worker_id,
-            reason="idle, no pending issues",
-        )]
+        return [_noop(worker_id, "idle, no pending issues")]
 
     # Resolve the effective config (may be cross-project)
     eff_cfg, eff_state, is_cross = _resolve_effective_config(worker_id, cfg, state)
@@ -387,11 +486,7 @@ def compute_decision(
                 reason="exceeded retry limit after process crash (no progress)",
             )]
 
-    return [Decision(
-        action="noop",
-        worker=worker_id,
-        reason=f"status={snapshot.status}, no action needed",
-    )]
+    return [_noop(worker_id, f"status={snapshot.status}, no action needed")]
 
 
 def _handle_finished_worker(
@@ -441,13 +536,15 @@ def _handle_finished_worker(
         pipeline = eff_cfg.pipeline
         current_stage_idx = issue.pipeline_stage if issue else 0
 
-        if current_stage_idx + 1 < len(pipeline):
+        next_stage = eff_cfg.next_stage_name(current_stage_idx)
+
+        if next_stage is not None:
             # More stages to go — advance instead of completing
             decisions.append(Decision(
                 action="advance_stage",
                 worker=worker_id,
                 issue=issue_num,
-                reason=f"stage {pipeline[current_stage_idx]} done, advancing to {pipeline[current_stage_idx + 1]}",
+                reason=f"stage {pipeline[current_stage_idx]} done, advancing to {next_stage}",
                 source_config=str(eff_cfg.config_path) if is_cross else None,
             ))
         else:
@@ -486,16 +583,12 @@ def _handle_finished_worker(
                         source_config=str(other_cfg.config_path),
                     ))
                 else:
-                    decisions.append(Decision(
-                        action="idle",
-                        worker=worker_id,
-                        reason="no more issues available",
-                    ))
+                    decisions.append(_idle(worker_id, "no more issues available"))
 
     else:
         # Non-zero exit code
         has_progress = bool(snapshot.new_commits.strip())
-        has_output = _has_meaningful_output(snapshot.log_tail)
+        has_output = _has_meaningful_output(snapshot.log_tail, snapshot.log_tail_stripped_len)
 
         # Empty output + non-zero exit = API crash. Use tight retry limit.
         if not has_output and not has_progress and snapshot.retry_count >= 3:
@@ -537,8 +630,7 @@ def _handle_running_worker(
 
         # DEADMAN EXIT in log — signal recovery handled in monitor; wait for next cycle
         if "[DEADMAN] EXIT" in snapshot.log_tail:
-            return [Decision(action="noop", worker=worker_id,
-                             reason="DEADMAN EXIT in log — signal recovery pending")]
+            return [_noop(worker_id, "DEADMAN EXIT in log — signal recovery pending")]
 
         # Work is done but signal was never written — push directly
         if has_commits:
@@ -550,12 +642,12 @@ def _handle_running_worker(
             )]
 
         # Log is still being written (active within last 2 min) — give more time
-        if snapshot.log_mtime and (time.time() - snapshot.log_mtime) < 120:
+        if snapshot.log_mtime and (time.time() - snapshot.log_mtime) < LOG_ACTIVE_WINDOW:
             return [Decision(action="noop", worker=worker_id,
                              reason=f"wall-clock timeout {elapsed_min}m but log active — extending")]
 
         # Worktree files being modified (active within last 5 min) — give more time
-        if snapshot.worktree_mtime and (time.time() - snapshot.worktree_mtime) < 300:
+        if snapshot.worktree_mtime and (time.time() - snapshot.worktree_mtime) < WORKTREE_ACTIVE_WINDOW:
             return [Decision(action="noop", worker=worker_id,
                              reason=f"wall-clock timeout {elapsed_min}m but worktree active — extending")]
 
@@ -572,7 +664,7 @@ def _handle_running_worker(
         age = time.time() - snapshot.log_mtime
 
         # Empty log = claude started but produced nothing (API error).
-        if snapshot.log_size == 0 and age > 120:
+        if snapshot.log_size == 0 and age > EMPTY_LOG_TIMEOUT:
             if snapshot.retry_count < MAX_EMPTY_RETRIES:
                 return [Decision(
                     action="restart",
@@ -592,7 +684,7 @@ def _handle_running_worker(
             worktree_active = False
             if snapshot.worktree_mtime is not None:
                 worktree_age = time.time() - snapshot.worktree_mtime
-                if worktree_age < 300:  # Active within last 5 minutes
+                if worktree_age < WORKTREE_ACTIVE_WINDOW:
                     worktree_active = True
 
             if worktree_active:
@@ -613,11 +705,7 @@ def _handle_running_worker(
             else:
                 return _advance_or_skip(snapshot, cfg, state)
 
-    return [Decision(
-        action="noop",
-        worker=worker_id,
-        reason="still running normally",
-    )]
+    return [_noop(worker_id, "still running normally")]
 
 
 def _advance_or_skip(
@@ -634,21 +722,15 @@ def _advance_or_skip(
     issue_num = snapshot.issue_number
 
     # Resolve effective config for cross-project workers
-    eff_cfg = cfg
     worker = state.load_worker(worker_id)
-    if worker and worker.source_config:
-        from .config import load_config
-        try:
-            eff_cfg = load_config(worker.source_config)
-        except (SystemExit, Exception):
-            pass
+    eff_cfg, _ = effective_config(worker and worker.source_config, cfg, state)
 
     issue = eff_cfg.get_issue(issue_num)
 
     if issue:
         pipeline = eff_cfg.pipeline
-        if issue.pipeline_stage + 1 < len(pipeline):
-            next_stage = pipeline[issue.pipeline_stage + 1]
+        next_stage = eff_cfg.next_stage_name(issue.pipeline_stage)
+        if next_stage is not None:
             cur_stage = pipeline[issue.pipeline_stage] if issue.pipeline_stage < len(pipeline) else "?"
             return [Decision(
                 action="advance_stage",
@@ -667,30 +749,76 @@ def _advance_or_skip(
     )]
 
 
-def _has_meaningful_output(log_tail: str) -> bool:
+# Log heuristics. Both signal lists are matched in a single pass over the
+# tail: an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+# one compiled regex alternation.
+_ERROR_SIGNALS = (
+    "FAIL", "panic:", "fatal:", "Error:", "error:",
+    "compilation failed", "build failed",
+)
+# Claude API / runtime errors that mean no real work was done
+_API_CRASH_SIGNALS = (
+    "No messages returned",
+    "promise rejected",
+    "processTicksAndRejections",
+    "ENOMEM",
+    "killed",
+    "Segmentation fault",
+)
+_SIGNAL_KIND = {
+    **{s: "error" for s in _ERROR_SIGNALS},
+    **{s: "crash" for s in _API_CRASH_SIGNALS},
+}
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _SIGNAL_AUTOMATON = ahocorasick.Automaton()
+    for _sig, _kind in _SIGNAL_KIND.items():
+        _SIGNAL_AUTOMATON.add_word(_sig, _kind)
+    _SIGNAL_AUTOMATON.make_automaton()
+    _SIGNAL_RE = None
+else:
+    _SIGNAL_AUTOMATON = None
+    _SIGNAL_RE = re.compile("|".join(map(re.escape, _SIGNAL_KIND)))
+
+
+@functools.lru_cache(maxsize=64)
+def _log_signal_kinds(log_tail: str) -> frozenset[str]:
+    """Return which signal kinds ("error", "crash") appear in the log tail."""
+    kinds: set[str] = set()
+    if _SIGNAL_AUTOMATON is not None:
+        matches = (kind for _, kind in _SIGNAL_AUTOMATON.iter(log_tail))
+    else:
+        matches = (_SIGNAL_KIND[m.group()] for m in _SIGNAL_RE.finditer(log_tail))
+    for kind in matches:
+        kinds.add(kind)
+        if len(kinds) == 2:
+            break
+    return frozenset(kinds)
+
+
+def _has_meaningful_output(log_tail: str, stripped_len: Optional[int] = None) -> bool:
     """Check if the log contains meaningful Claude output (not just API errors).
 
     Returns False for cases like 'No messages returned', token limit crashes,
     or empty logs — where continuation context would just add noise.
+
+    stripped_len: precomputed len(log_tail.strip()), if the caller has it.
     """
-    if not log_tail.strip():
+    if stripped_len is None:
+        stripped_len = len(log_tail.strip())
+    if not stripped_len:
         return False
 
-    # Claude API / runtime errors that mean no real work was done
-    api_crash_signals = [
-        "No messages returned",
-        "promise rejected",
-        "processTicksAndRejections",
-        "ENOMEM",
-        "killed",
-        "Segmentation fault",
-    ]
-    for signal in api_crash_signals:
-        if signal in log_tail:
-            return False
+    if "crash" in _log_signal_kinds(log_tail):
+        return False
 
     # If the log is very short (< 200 chars), probably no meaningful work
-    if len(log_tail.strip()) < 200:
+    if stripped_len < 200:
         return False
 
     return True
@@ -698,14 +826,7 @@ def _has_meaningful_output(log_tail: str) -> bool:
 
 def _log_has_errors(log_tail: str) -> bool:
     """Heuristic: check if log tail contains error indicators."""
-    error_signals = [
-        "FAIL", "panic:", "fatal:", "Error:", "error:",
-        "compilation failed", "build failed",
-    ]
-    for signal in error_signals:
-        if signal in log_tail:
-            return True
-    return False
+    return "error" in _log_signal_kinds(log_tail)
 
 
 def _claude_fallback_decision(
@@ -719,7 +840,7 @@ def _claude_fallback_decision(
     """
     worker_id = snapshot.worker_id
     issue_num = snapshot.issue_number
-    log_tail = snapshot.log_tail[-2000:]  # Last 2000 chars max
+    log_tail = snapshot.log_tail_tail[-2000:]  # Last 2000 chars max
 
     prompt = f"""A Claude Code worker (worker {worker_id}) working on issue #{issue_num} exited with code 0 and made commits, but the log shows possible errors.
 
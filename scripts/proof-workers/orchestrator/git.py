@@ -2,22 +2,59 @@
 
 from __future__ import annotations
 
+import os
+import select
+import shutil
 import subprocess
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 GIT_TIMEOUT = 60  # seconds
 
+# Absolute path to git. subprocess only uses the posix_spawn fast path
+# (no fork of the orchestrator's address space) when the executable has a
+# directory component, cwd is None and close_fds is False.
+_GIT = shutil.which("git") or "git"
+
 
 def _run(args: list[str], cwd: Optional[str] = None,
-         timeout: int = GIT_TIMEOUT, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a git command with timeout."""
+         timeout: int = GIT_TIMEOUT, check: bool = True,
+         read_only: bool = False,
+         discard_output: bool = False) -> subprocess.CompletedProcess:
+    """Run a git command with timeout.
+
+    read_only: set GIT_OPTIONAL_LOCKS=0 so inspection commands never take
+    .git/index.lock (and never block on a worker's concurrent git write).
+    discard_output: send stdout/stderr to /dev/null instead of capturing
+    them, for callers that only look at the return code.
+
+    git invocations are rewritten to the absolute binary with `-C <cwd>`
+    so they stay eligible for posix_spawn.
+    """
+    env = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"} if read_only else None
+    if args and args[0] == "git":
+        args = [_GIT, *(["-C", cwd] if cwd else []), *args[1:]]
+        cwd = None
+    if discard_output:
+        return subprocess.run(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=cwd,
+            env=env,
+            close_fds=False,
+            timeout=timeout,
+            check=check,
+        )
     return subprocess.run(
         args,
         capture_output=True,
         text=True,
         cwd=cwd,
+        env=env,
+        close_fds=False,
         timeout=timeout,
         check=check,
     )
@@ -26,7 +63,7 @@ def _run(args: list[str], cwd: Optional[str] = None,
 def fetch(repo_path: str, remote: str = "origin") -> bool:
     """Fetch from remote. Returns True on success."""
     try:
-        _run(["git", "fetch", remote], cwd=repo_path)
+        _run(["git", "fetch", remote], cwd=repo_path, discard_output=True)
         return True
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False
@@ -39,6 +76,7 @@ def branch_exists(repo_path: str, branch: str) -> bool:
             ["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"],
             cwd=repo_path,
             check=False,
+            discard_output=True,
         )
         return result.returncode == 0
     except subprocess.SubprocessError:
@@ -58,11 +96,13 @@ def create_worktree(repo_path: str, worktree_path: str, branch: str,
             _run(
                 ["git", "worktree", "add", worktree_path, branch],
                 cwd=repo_path,
+                discard_output=True,
             )
         else:
             _run(
                 ["git", "worktree", "add", "-b", branch, worktree_path, base_branch],
                 cwd=repo_path,
+                discard_output=True,
             )
         return True
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
@@ -75,7 +115,7 @@ def remove_worktree(repo_path: str, worktree_path: str, force: bool = False) ->
         cmd = ["git", "worktree", "remove", worktree_path]
         if force:
             cmd.append("--force")
-        _run(cmd, cwd=repo_path)
+        _run(cmd, cwd=repo_path, discard_output=True)
         return True
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False
@@ -84,7 +124,8 @@ def remove_worktree(repo_path: str, worktree_path: str, force: bool = False) ->
 def prune_worktrees(repo_path: str) -> None:
     """Prune stale worktree references."""
     try:
-        _run(["git", "worktree", "prune"], cwd=repo_path, check=False)
+        _run(["git", "worktree", "prune"], cwd=repo_path, check=False,
+             discard_output=True)
     except subprocess.SubprocessError:
         pass
 
@@ -98,6 +139,7 @@ def validate_worktree(worktree_path: str, expected_branch: Optional[str] = None)
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
             cwd=worktree_path,
             check=False,
+            read_only=True,
         )
         if result.returncode != 0:
             return False
@@ -115,19 +157,100 @@ def push_branch(worktree_path: str, remote: str = "origin",
         cmd = ["git", "push", remote]
         if branch:
             cmd.append(branch)
-        _run(cmd, cwd=worktree_path)
+        _run(cmd, cwd=worktree_path, discard_output=True)
         return True
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False
 
 
+def _git_dirs(worktree_path: str) -> Optional[tuple[str, str]]:
+    """Return (git dir, common dir) for a checkout, or None.
+
+    A linked worktree's `.git` is a file pointing at its private git dir,
+    whose `commondir` in turn points back at the shared repository.
+    """
+    dot_git = os.path.join(worktree_path, ".git")
+    try:
+        if os.path.isdir(dot_git):
+            return dot_git, dot_git
+        with open(dot_git) as f:
+            line = f.readline().strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir: "):
+        return None
+    git_dir = os.path.join(worktree_path, line[len("gitdir: "):])
+    try:
+        with open(os.path.join(git_dir, "commondir")) as f:
+            common = os.path.join(git_dir, f.read().strip())
+    except OSError:
+        common = git_dir
+    return git_dir, common
+
+
+def _read_ref(git_dir: str, common: str, ref: str, depth: int = 0) -> Optional[str]:
+    """Resolve a full ref name (or HEAD) to a sha from loose/packed refs."""
+    per_worktree = ref == "HEAD" or ref.startswith(("refs/worktree/", "refs/bisect/"))
+    try:
+        with open(os.path.join(git_dir if per_worktree else common, ref)) as f:
+            value = f.read().strip()
+    except OSError:
+        value = None
+    if value is None:
+        try:
+            with open(os.path.join(common, "packed-refs")) as f:
+                for line in f:
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
+        return None
+    if value.startswith("ref: "):
+        return _read_ref(git_dir, common, value[5:], depth + 1) if depth < 5 else None
+    return value or None
+
+
+def rev_parse(worktree_path: str, name: str = "HEAD") -> Optional[str]:
+    """Resolve HEAD or a branch/remote ref to a sha by reading .git directly.
+
+    No subprocess is spawned. Returns None for anything this doesn't
+    understand (sha expressions, reftable repos), so callers can fall
+    back to asking git.
+    """
+    dirs = _git_dirs(worktree_path)
+    if dirs is None:
+        return None
+    git_dir, common = dirs
+    if name == "HEAD" or name.startswith("refs/"):
+        return _read_ref(git_dir, common, name)
+    for ref in (f"refs/{name}", f"refs/tags/{name}", f"refs/heads/{name}", f"refs/remotes/{name}"):
+        sha = _read_ref(git_dir, common, ref)
+        if sha:
+            return sha
+    return None
+
+
+def index_mtime_ns(worktree_path: str) -> Optional[int]:
+    """Return the mtime of a checkout's index file, or None."""
+    dirs = _git_dirs(worktree_path)
+    if dirs is None:
+        return None
+    try:
+        return os.stat(os.path.join(dirs[0], "index")).st_mtime_ns
+    except OSError:
+        return None
+
+
 def get_status(worktree_path: str) -> str:
     """Get short git status output."""
     try:
         result = _run(
-            ["git", "status", "--short"],
+            ["git", "--no-optional-locks", "-c", "core.preloadIndex=true",
+             "status", "--porcelain=v1"],
             cwd=worktree_path,
             check=False,
+            read_only=True,
         )
         lines = result.stdout.strip().splitlines()
         return "\n".join(lines[:10])
@@ -143,6 +266,7 @@ def get_recent_commits(worktree_path: str, count: int = 5,
             ["git", "log", "--oneline", f"-{count}", f"{since_ref}..HEAD"],
             cwd=worktree_path,
             check=False,
+            read_only=True,
         )
         return result.stdout.strip()
     except subprocess.SubprocessError:
@@ -156,12 +280,27 @@ def get_log(worktree_path: str, count: int = 5) -> str:
             ["git", "log", "--oneline", f"-{count}"],
             cwd=worktree_path,
             check=False,
+            read_only=True,
         )
         return result.stdout.strip()
     except subprocess.SubprocessError:
         return ""
 
 
+def get_remote_url(repo_path: str, remote: str = "origin") -> str:
+    """Get the URL of a remote, or "" if it isn't configured."""
+    try:
+        result = _run(
+            ["git", "remote", "get-url", remote],
+            cwd=repo_path,
+            check=False,
+            read_only=True,
+        )
+        return result.stdout.strip() if result.returncode == 0 else ""
+    except subprocess.SubprocessError:
+        return ""
+
+
 def get_diff_stat(worktree_path: str, since_ref: str = "origin/main") -> str:
     """Get diff --stat summary of changed files since a reference."""
     try:
@@ -169,6 +308,7 @@ def get_diff_stat(worktree_path: str, since_ref: str = "origin/main") -> str:
             ["git", "diff", "--stat", f"{since_ref}..HEAD"],
             cwd=worktree_path,
             check=False,
+            read_only=True,
         )
         return result.stdout.strip()
     except subprocess.SubprocessError:
@@ -177,13 +317,24 @@ def get_diff_stat(worktree_path: str, since_ref: str = "origin/main") -> str:
 
 def has_commits(worktree_path: str, since_ref: str = "origin/main") -> bool:
     """Check if there are any commits since the reference."""
-    return bool(get_recent_commits(worktree_path, count=1, since_ref=since_ref))
+    try:
+        result = _run(
+            ["git", "rev-list", "--count", f"{since_ref}..HEAD"],
+            cwd=worktree_path,
+            check=False,
+            read_only=True,
+        )
+        return result.returncode == 0 and result.stdout.strip() not in ("", "0")
+    except subprocess.SubprocessError:
+        return False
 
 
-def is_claude_running(pane_pid: Optional[int]) -> bool:
-    """Check if a claude process is a child of the given PID."""
-    if pane_pid is None:
-        return False
+# pane pid -> (claude pid, pidfd) for the claude process last found in a pane
+_claude_pidfds: dict[int, tuple[int, int]] = {}
+
+
+def _find_claude(pane_pid: int) -> Optional[int]:
+    """Return the pid of a claude child of the pane's shell, or None."""
     try:
         result = subprocess.run(
             ["pgrep", "-P", str(pane_pid), "-f", "claude"],
@@ -192,21 +343,104 @@ def is_claude_running(pane_pid: Optional[int]) -> bool:
             timeout=10,
             check=False,
         )
-        return result.returncode == 0
     except subprocess.SubprocessError:
+        return None
+    pids = result.stdout.split()
+    return int(pids[0]) if result.returncode == 0 and pids else None
+
+
+def find_claude_children(pane_pids: Iterable[int]) -> Optional[dict[int, int]]:
+    """Map pane shell PIDs to a claude child's PID with a single ps call.
+
+    Panes whose claude is already tracked by pidfd are left out (they need
+    no lookup). Panes with no claude child are absent from the result.
+    Returns None if ps couldn't be run, so callers fall back to pgrep.
+    """
+    wanted = sorted({p for p in pane_pids if p not in _claude_pidfds})
+    if not wanted:
+        return {}
+    try:
+        result = subprocess.run(
+            ["ps", "-o", "pid=,ppid=,args=", "--ppid", ",".join(map(str, wanted))],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode not in (0, 1):  # 1: no matching processes
+        return None
+    children: dict[int, int] = {}
+    for line in result.stdout.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) == 3 and "claude" in fields[2]:
+            children.setdefault(int(fields[1]), int(fields[0]))
+    return children
+
+
+def is_claude_running(pane_pid: Optional[int],
+                      claude_children: Optional[dict[int, int]] = None) -> bool:
+    """Check if a claude process is a child of the given PID.
+
+    Once a claude process is found, a pidfd for it is kept and later checks
+    just poll that fd (readable means the process exited), so a long-running
+    claude costs no pgrep per cycle. Without pidfd support every check
+    runs pgrep.
+
+    claude_children: this cycle's find_claude_children() result, used in
+    place of a per-pane pgrep for panes that weren't being tracked.
+    """
+    if pane_pid is None:
+        return False
+    cached = _claude_pidfds.get(pane_pid)
+    if cached is not None:
+        ready, _, _ = select.select([cached[1]], [], [], 0)
+        if not ready:
+            return True
+        _claude_pidfds.pop(pane_pid, None)
+        os.close(cached[1])
+        # The batch lookup skipped this pane, so it can't say whether a new
+        # claude has started in it since
+        pid = _find_claude(pane_pid)
+    elif claude_children is not None:
+        pid = claude_children.get(pane_pid)
+    else:
+        pid = _find_claude(pane_pid)
+    if pid is None:
         return False
+    if hasattr(os, "pidfd_open"):
+        try:
+            _claude_pidfds[pane_pid] = (pid, os.pidfd_open(pid))
+        except OSError:
+            pass  # exited already, or no pidfd support in this kernel
+    return True
+
+
+def claude_exit_fds() -> list[int]:
+    """Return the pidfds of the claude processes currently being tracked."""
+    return [fd for _, fd in _claude_pidfds.values()]
+
+
+def prune_claude_pidfds(pane_pids: Iterable[int]) -> None:
+    """Close and forget the pidfds of panes that are no longer in the session.
+
+    A pane that is killed or respawned gets a new pid, so its old entry
+    would otherwise keep an fd open (and in every wait) indefinitely.
+    """
+    live = set(pane_pids)
+    for pane_pid in [p for p in _claude_pidfds if p not in live]:
+        os.close(_claude_pidfds.pop(pane_pid)[1])
 
 
 def get_worktree_mtime(worktree_path: str) -> Optional[float]:
-    """Get the most recent file modification time in a worktree.
+    """Get the most recent file or directory modification time in a worktree.
 
     Scans common working directories (docs-dev/, docs/, internal/, pkg/, etc.)
     to detect if Claude is actively writing files, even if the log isn't updating.
     Returns Unix timestamp of most recent modification, or None if nothing found.
     """
-    import os
-
-    if not worktree_path or not Path(worktree_path).is_dir():
+    if not worktree_path or not os.path.isdir(worktree_path):
         return None
 
     # Directories to check for recent activity
@@ -221,37 +455,43 @@ def get_worktree_mtime(worktree_path: str) -> Optional[float]:
     ]
 
     most_recent = 0.0
-    now = __import__("time").time()
+    now = time.time()
     max_age = 3600  # Only consider files modified in last hour
+    max_depth = 3   # Limit depth to avoid expensive scans
 
     for check_dir in check_dirs:
-        dir_path = Path(worktree_path) / check_dir
-        if not dir_path.exists():
+        top = worktree_path + os.sep + check_dir
+        if not os.path.isdir(top):
             continue
 
+        # Iterative scandir walk on plain strings; depth travels with each dir.
+        # Directory mtimes count too: they move when a file is deleted or
+        # renamed, which leaves no newer file behind.
         try:
-            # Walk directory but limit depth to avoid expensive scans
-            for root, dirs, files in os.walk(dir_path):
-                # Skip .git and other hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-                # Limit depth
-                depth = len(Path(root).relative_to(dir_path).parts)
-                if depth > 3:
-                    dirs.clear()
-                    continue
-
-                for f in files:
-                    if f.startswith('.'):
-                        continue
-                    fpath = Path(root) / f
-                    try:
-                        mtime = fpath.stat().st_mtime
-                        if now - mtime < max_age and mtime > most_recent:
-                            most_recent = mtime
-                    except OSError:
-                        continue
+            mtime = os.stat(top).st_mtime
+            if now - mtime < max_age and mtime > most_recent:
+                most_recent = mtime
         except OSError:
             continue
+        stack = [(top, 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        # Skip .git and other hidden files/directories
+                        if entry.name.startswith('.'):
+                            continue
+                        try:
+                            if (entry.is_dir() and depth < max_depth
+                                    and not entry.is_symlink()):
+                                stack.append((entry.path, depth + 1))
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            continue
+                        if now - mtime < max_age and mtime > most_recent:
+                            most_recent = mtime
+            except OSError:
+                continue
 
     return most_recent if most_recent > 0 else None
@@ -0,0 +1,156 @@
+"""Pooled HTTPS client for the GitHub/GitLab issue REST APIs.
+
+Optional: needs `requests`. When it isn't installed (or no token can be
+read from the gh/glab CLI) every call returns None and callers fall back
+to spawning gh/glab per issue.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import threading
+import time
+from typing import Optional
+from urllib.parse import quote
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+HTTP_TIMEOUT = 10  # seconds
+RATE_LIMIT_FLOOR = 50  # back off when fewer requests than this remain
+MAX_RATE_LIMIT_BACKOFF = 60  # seconds
+
+# get_issue() result when an If-None-Match revalidation gets a 304
+NOT_MODIFIED = object()
+
+# Guards the lazy _session/_tokens setup; fetch_issue_bodies calls in from threads
+_init_lock = threading.Lock()
+_session = None
+_tokens: dict[tuple[str, str], Optional[str]] = {}  # (platform, host) -> token
+# (platform, host) -> time.time() before which get_issue() returns None
+_backoff_until: dict[tuple[str, str], float] = {}
+
+
+def available() -> bool:
+    """Return True if the HTTP client can be used at all."""
+    return requests is not None
+
+
+def _get_session():
+    """Return the shared keep-alive session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+                _session = session
+    return _session
+
+
+def _token(platform: str, host: str) -> Optional[str]:
+    """Return the CLI's auth token for a host, read once per run."""
+    key = (platform, host)
+    if key not in _tokens:
+        with _init_lock:
+            if key not in _tokens:
+                _tokens[key] = _read_cli_token(platform, host)
+    return _tokens[key]
+
+
+def _read_cli_token(platform: str, host: str) -> Optional[str]:
+    """Ask gh/glab for the token it is logged in with."""
+    if platform == "github":
+        cmd = ["gh", "auth", "token", "--hostname", host]
+    elif platform == "gitlab":
+        cmd = ["glab", "auth", "status", "-t", "--hostname", host]
+    else:
+        return None
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=False)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+
+    if platform == "github":
+        token = result.stdout.strip() if result.returncode == 0 else ""
+        return token or None
+    # glab prints "Token: <value>" among its status lines (on stderr)
+    m = re.search(r"Token:\s*(\S+)", result.stdout + result.stderr)
+    return m.group(1) if m else None
+
+
+def _note_rate_limit(resp, key: tuple[str, str]) -> None:
+    """Stop using a host until its rate-limit window resets, if we're close to the floor.
+
+    Nothing sleeps here: get_issue() is on the launch path, so it returns
+    None in the meantime and callers fall back to the CLI.
+    """
+    headers = resp.headers
+    remaining = headers.get("X-RateLimit-Remaining") or headers.get("RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset") or headers.get("RateLimit-Reset")
+    now = time.time()
+    try:
+        if remaining is None or int(remaining) >= RATE_LIMIT_FLOOR:
+            return
+        wait = float(reset) - now if reset else MAX_RATE_LIMIT_BACKOFF
+    except ValueError:
+        return
+    if wait > 0:
+        _backoff_until[key] = now + min(wait, MAX_RATE_LIMIT_BACKOFF)
+
+
+def get_issue(platform: str, host: str, project_path: str,
+              number: int, etag: Optional[str] = None):
+    """Fetch one issue over REST.
+
+    Returns {"title", "state", "body", "etag"} or None on any failure (no
+    requests, no token, HTTP error, host backing off from its rate limit),
+    leaving the caller to fall back to the CLI. With `etag`, the request is
+    conditional and NOT_MODIFIED is returned if the issue hasn't changed.
+    """
+    if requests is None:
+        return None
+    if time.time() < _backoff_until.get((platform, host), 0.0):
+        return None
+    token = _token(platform, host)
+    if not token:
+        return None
+
+    if platform == "github":
+        api = "https://api.github.com" if host == "github.com" else f"https://{host}/api/v3"
+        url = f"{api}/repos/{project_path}/issues/{number}"
+        headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
+        body_key = "body"
+    elif platform == "gitlab":
+        url = f"https://{host}/api/v4/projects/{quote(project_path, safe='')}/issues/{number}"
+        headers = {"PRIVATE-TOKEN": token}
+        body_key = "description"
+    else:
+        return None
+
+    if etag:
+        headers["If-None-Match"] = etag
+
+    try:
+        resp = _get_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    except requests.RequestException:
+        return None
+    _note_rate_limit(resp, (platform, host))
+    if resp.status_code == 304 and etag:
+        return NOT_MODIFIED
+    if resp.status_code != 200:
+        return None
+    try:
+        data = resp.json()
+    except ValueError:
+        return None
+    return {
+        "title": data.get("title") or "",
+        "state": data.get("state") or "",
+        "body": data.get(body_key) or "",
+        "etag": resp.headers.get("ETag"),
+    }
@@ -2,67 +2,361 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
+import json
+import random
+import shutil
 import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
-from .config import RunConfig
+from . import git, http_client
+from .config import RunConfig, load_config
 from .models import Issue
 from .state import StateManager
 
+# Max issues per batched GraphQL request (GitLab pages connections at 100)
+FETCH_BATCH_SIZE = 50
+# Max concurrent per-issue fetches when batching isn't possible
+FETCH_WORKERS = 8
+# Per-attempt timeout (seconds) and extra attempts for a single gh/glab fetch
+FETCH_TIMEOUT = 8
+FETCH_RETRIES = 2
+# stderr fragments that mean retrying a fetch is pointless
+_PERMANENT_FETCH_ERRORS = (
+    "not found", "404", "could not resolve", "401", "403", "authenticat",
+)
+
+# Absolute gh/glab paths (None if not installed), resolved once at import
+_CLI: dict[str, Optional[str]] = {
+    "github": shutil.which("gh"),
+    "gitlab": shutil.which("glab"),
+}
+
+# Parsed configs for cross-project lookups: path -> ((mtime_ns, size), cfg)
+_CFG_CACHE: dict[Path, tuple[tuple[int, int], RunConfig]] = {}
+# *-issues.json listings: config dir -> (dir mtime_ns, [(path, resolved)])
+_DIR_CACHE: dict[Path, tuple[int, list[tuple[Path, Path]]]] = {}
+# StateManagers for cross-project configs: resolved config path -> state
+_STATE_CACHE: dict[Path, StateManager] = {}
+
 
 def fetch_issue_body(issue: Issue, cfg: RunConfig, state: StateManager) -> str:
     """Fetch an issue body from the remote platform, using cache if available.
 
     If the issue has a local description, use that instead of fetching.
     """
-    # If issue has local description, use it directly
-    if issue.description:
-        return issue.description
+    return fetch_issue_bodies([issue], cfg, state)[issue.number]
 
-    cached = state.get_cached_issue(issue.number)
-    if cached is not None:
-        return cached
 
-    repo_cfg = cfg.repo_for_issue(issue)
-    body = _fetch_from_platform(issue.number, repo_cfg.path, repo_cfg.platform)
-    if body and not body.startswith("(Could not fetch"):
-        state.cache_issue(issue.number, body)
-    return body
+def fetch_issue_bodies(issues: list[Issue], cfg: RunConfig,
+                       state: StateManager,
+                       revalidate: bool = False) -> dict[int, str]:
+    """Fetch bodies for several issues, batching uncached ones per repo.
 
+    Local descriptions and cached bodies are used as-is. The rest are
+    grouped by (repo path, platform) and fetched with one GraphQL request
+    per group; anything the batch didn't return falls back to a per-issue
+    fetch. Successful fetches are cached. Returns {issue_number: body}.
+
+    With `revalidate`, cached bodies are checked against the platform with
+    a conditional (ETag) request when the HTTP client is usable; unchanged
+    issues cost a body-less 304.
+    """
+    bodies: dict[int, str] = {}
+    groups: dict[tuple[str, str], list[int]] = {}
+    stale: list[Issue] = []
+    for issue in issues:
+        if issue.description:
+            bodies[issue.number] = issue.description
+            continue
+        cached = state.get_cached_issue(issue.number)
+        if cached is not None:
+            bodies[issue.number] = cached
+            if revalidate:
+                stale.append(issue)
+            continue
+        repo_cfg = cfg.repo_for_issue(issue)
+        numbers = groups.setdefault((repo_cfg.path, repo_cfg.platform), [])
+        if issue.number not in numbers:
+            numbers.append(issue.number)
+
+    for (repo_path, platform), numbers in groups.items():
+        fetched: dict[int, str] = {}
+        if len(numbers) > 1:
+            for start in range(0, len(numbers), FETCH_BATCH_SIZE):
+                fetched.update(_fetch_batch_from_platform(
+                    numbers[start:start + FETCH_BATCH_SIZE], repo_path, platform,
+                ))
+        missing = [n for n in numbers if n not in fetched]
+        if len(missing) > 1:
+            # No batch result (no GraphQL, or partial): fetch the rest in
+            # parallel — each fetch just waits on a subprocess or socket.
+            with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(missing))) as pool:
+                fetched.update(zip(missing, pool.map(
+                    functools.partial(_fetch_from_platform, repo_path=repo_path, platform=platform),
+                    missing,
+                )))
+        elif missing:
+            fetched[missing[0]] = _fetch_from_platform(missing[0], repo_path, platform)
+
+        # Cache writes stay on this thread
+        for number in numbers:
+            body = fetched[number]
+            if body and not body.startswith("(Could not fetch"):
+                state.cache_issue(number, body)
+            bodies[number] = body
+
+    if stale and http_client.available():
+        _revalidate_cached(stale, cfg, state, bodies)
+
+    return bodies
+
+
+def _revalidate_cached(issues: list[Issue], cfg: RunConfig, state: StateManager,
+                       bodies: dict[int, str]) -> None:
+    """Refresh cached bodies that changed upstream, using If-None-Match."""
+    checks: list[tuple[int, str, tuple[str, str], Optional[str]]] = []
+    for issue in issues:
+        repo_cfg = cfg.repo_for_issue(issue)
+        location = _remote_location(repo_cfg.path)
+        if location:
+            checks.append((issue.number, repo_cfg.platform, location,
+                              state.get_cached_etag(issue.number)))
+    if not checks:
+        return
+
+    def check(req):
+        number, platform, location, etag = req
+        return http_client.get_issue(platform, *location, number, etag=etag)
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(checks))) as pool:
+        results = list(pool.map(check, checks))
+    for (number, *_), data in zip(checks, results):
+        if data is None or data is http_client.NOT_MODIFIED:
+            continue
+        body = _format_issue(number, data["title"], data["state"], data["body"])
+        state.cache_issue(number, body, etag=data.get("etag"))
+        bodies[number] = body
+
+
+def _remote_location(repo_path: str) -> Optional[tuple[str, str]]:
+    """Return (host, project path) of a repo's origin remote.
+
+    The project path is "owner/name" on GitHub and the full group path on
+    GitLab.
+    """
+    url = git.get_remote_url(repo_path)
+    if not url:
+        return None
+    if "://" in url:
+        parsed = urlparse(url)
+        host, path = parsed.hostname or "", parsed.path
+    elif ":" in url:
+        # scp-like: git@host:group/repo.git
+        host, path = url.split(":", 1)
+        host = host.rsplit("@", 1)[-1]
+    else:
+        return None
+    path = path.strip("/").removesuffix(".git")
+    if not host or not path:
+        return None
+    return host, path
+
+
+def _format_issue(number: int, title: str, state: str, body: str) -> str:
+    """Render a batched issue the way `gh issue view` prints its header."""
+    return f"title:\t{title}\nstate:\t{state}\nnumber:\t{number}\n--\n{body or ''}\n"
+
+
+def _fetch_batch_from_platform(numbers: list[int], repo_path: str,
+                               platform: str) -> dict[int, str]:
+    """Fetch several issue bodies with a single GraphQL call.
+
+    Returns whatever issues could be read; an empty dict on any failure,
+    leaving callers to fall back to per-issue fetches.
+    """
+    location = _remote_location(repo_path)
+    if not location:
+        return {}
+    project_path = location[1]
+
+    if platform == "github":
+        if project_path.count("/") != 1:
+            return {}
+        owner, name = project_path.split("/")
+        fields = " ".join(
+            f"i{n}: issue(number: {n}) {{ number title state body }}" for n in numbers
+        )
+        query = (
+            "query($owner: String!, $name: String!) { "
+            f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+        cmd = [_CLI["github"], "api", "graphql", "-f", f"query={query}",
+               "-f", f"owner={owner}", "-f", f"name={name}"]
+    elif platform == "gitlab":
+        iids = ", ".join(f'"{n}"' for n in numbers)
+        query = (
+            "query($fullPath: ID!) { project(fullPath: $fullPath) { "
+            f"issues(iids: [{iids}]) {{ nodes {{ iid title state description }} }} }} }}"
+        )
+        cmd = [_CLI["gitlab"], "api", "graphql", "-f", f"query={query}",
+               "-f", f"fullPath={project_path}"]
+    else:
+        return {}
+    if cmd[0] is None:
+        return {}
 
-def _fetch_from_platform(issue_number: int, repo_path: str, platform: str) -> str:
-    """Fetch issue body from GitLab or GitHub."""
     try:
-        if platform == "gitlab":
-            result = subprocess.run(
-                ["glab", "issue", "view", str(issue_number)],
-                capture_output=True,
-                text=True,
-                cwd=repo_path,
-                timeout=30,
-                check=False,
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=repo_path,
+            timeout=30,
+            check=False,
+        )
+        # GraphQL reports missing issues as errors alongside partial data,
+        # so parse stdout even on a non-zero exit.
+        data = json.loads(result.stdout or "null")
+    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    bodies: dict[int, str] = {}
+    if platform == "github":
+        repo = (data.get("data") or {}).get("repository") or {}
+        nodes = [node for node in repo.values() if node]
+        for node in nodes:
+            bodies[int(node["number"])] = _format_issue(
+                node["number"], node.get("title", ""), node.get("state", ""), node.get("body", ""),
             )
-        elif platform == "github":
+    else:
+        project = (data.get("data") or {}).get("project") or {}
+        for node in ((project.get("issues") or {}).get("nodes") or []):
+            bodies[int(node["iid"])] = _format_issue(
+                node["iid"], node.get("title", ""), node.get("state", ""), node.get("description", ""),
+            )
+    return bodies
+
+
+def _fetch_from_platform(issue_number: int, repo_path: str, platform: str) -> str:
+    """Fetch issue body from GitLab or GitHub.
+
+    Uses the pooled REST client when it's available and authenticated,
+    otherwise spawns glab/gh.
+    """
+    if http_client.available():
+        location = _remote_location(repo_path)
+        data = http_client.get_issue(platform, *location, issue_number) if location else None
+        if data is not None:
+            return _format_issue(issue_number, data["title"], data["state"], data["body"])
+
+    if platform not in _CLI:
+        return f"(Unknown platform '{platform}' for issue #{issue_number})"
+    cli = _CLI[platform]
+    if cli is None:
+        name = "gh" if platform == "github" else "glab"
+        return f"(Could not fetch issue #{issue_number}: {name} is not installed. Work from the title and context below.)"
+    cmd = [cli, "issue", "view", str(issue_number)]
+
+    error = ""
+    for attempt in range(FETCH_RETRIES + 1):
+        if attempt:
+            time.sleep(random.uniform(0.5, 1.0) * (2 ** (attempt - 1)))
+        try:
             result = subprocess.run(
-                ["gh", "issue", "view", str(issue_number)],
+                cmd,
                 capture_output=True,
                 text=True,
                 cwd=repo_path,
-                timeout=30,
+                timeout=FETCH_TIMEOUT,
                 check=False,
             )
-        else:
-            return f"(Unknown platform '{platform}' for issue #{issue_number})"
+        except FileNotFoundError as e:
+            return f"(Could not fetch issue #{issue_number}: {e}. Work from the title and context below.)"
+        except subprocess.TimeoutExpired as e:
+            error = f"(Could not fetch issue #{issue_number}: {e}. Work from the title and context below.)"
+            continue
 
         if result.returncode == 0:
             return result.stdout
-        return (
+        stderr = result.stderr.strip()
+        error = (
             f"(Could not fetch issue #{issue_number} from {platform}. "
-            f"Error: {result.stderr.strip()}. "
+            f"Error: {stderr}. "
             f"Work from the title and context below.)"
         )
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return f"(Could not fetch issue #{issue_number}: {e}. Work from the title and context below.)"
+        # Missing issue/repo or bad auth won't fix itself — don't retry
+        if any(marker in stderr.lower() for marker in _PERMANENT_FETCH_ERRORS):
+            break
+
+    return error
+
+
+@dataclass
+class _DependencyTable:
+    """Reverse dependency edges and unmet-dependency counts for one config."""
+    issues: list[Issue]
+    size: int
+    dependents: dict[int, list[int]]  # issue -> issues that depend on it
+    indegree: dict[int, int]  # issue -> dependencies not yet completed
+    done: set[int]  # completed set the indegrees reflect
+    position: dict[int, int]  # issue -> index in `issues` (first occurrence)
+    # Heap of (sort_key, position, number) for issues with no unmet deps;
+    # completed entries are dropped lazily when they reach the top
+    ready: list[tuple[tuple[int, int], int, int]]
+
+
+def _dependency_table(cfg: RunConfig, completed: set[int]) -> _DependencyTable:
+    """Return the config's dependency table, brought up to date with `completed`.
+
+    The table is kept on the config and updated incrementally: issues that
+    have become completed since the last call decrement their dependents,
+    and any dependent that reaches zero is pushed onto the ready heap.
+    It's rebuilt if the issue list changes or an issue leaves `completed`.
+    """
+    table = cfg._dep_table
+    if (table is None or table.issues is not cfg.issues
+            or table.size != len(cfg.issues) or not table.done <= completed):
+        dependents: dict[int, list[int]] = {}
+        indegree: dict[int, int] = {}
+        position: dict[int, int] = {}
+        ready: list[tuple[tuple[int, int], int, int]] = []
+        for pos, issue in enumerate(cfg.issues):
+            if issue.number in position:
+                continue
+            position[issue.number] = pos
+            indegree[issue.number] = len(issue.depends_on.difference(completed))
+            for dep in issue.depends_on:
+                dependents.setdefault(dep, []).append(issue.number)
+            if indegree[issue.number] == 0 and issue.number not in completed:
+                ready.append((issue.sort_key, pos, issue.number))
+        heapq.heapify(ready)
+        table = _DependencyTable(cfg.issues, len(cfg.issues), dependents, indegree,
+                                 set(completed), position, ready)
+        cfg._dep_table = table
+    elif len(table.done) != len(completed):
+        for number in completed - table.done:
+            for succ in table.dependents.get(number, ()):
+                table.indegree[succ] -= 1
+                if table.indegree[succ] == 0:
+                    pos = table.position[succ]
+                    heapq.heappush(table.ready, (table.issues[pos].sort_key, pos, succ))
+        table.done |= completed
+    return table
+
+
+def _remaining_indegree(cfg: RunConfig, completed: set[int]) -> dict[int, int]:
+    """Return {issue number: unmet dependency count} for the given completed set."""
+    return _dependency_table(cfg, completed).indegree
 
 
 def next_available_issue(cfg: RunConfig, completed: set[int],
@@ -77,31 +371,61 @@ def next_available_issue(cfg: RunConfig, completed: set[int],
     if in_progress is None:
         in_progress = set()
 
-    for issue in sorted(cfg.issues, key=lambda i: (i.wave, i.priority)):
+    table = _dependency_table(cfg, completed)
+    heap = table.ready
+    skipped: list[tuple[tuple[int, int], int, int]] = []
+    found: Optional[Issue] = None
+    while heap:
+        entry = heap[0]
+        if entry[2] in table.done:
+            heapq.heappop(heap)  # completed for good (un-completing forces a rebuild)
+            continue
+        issue = table.issues[entry[1]]
         if issue.status == "pending" and issue.number not in in_progress:
-            if all(dep in completed for dep in issue.depends_on):
-                return issue
-    return None
+            found = issue
+            break
+        # Running, failed or claimed this cycle -- may become eligible again
+        skipped.append(heapq.heappop(heap))
+    for entry in skipped:
+        heapq.heappush(heap, entry)
+    return found
+
+
+def status_counts(cfg: RunConfig) -> Counter[str]:
+    """Return {status: issue count}, from the config's status index."""
+    return cfg.status_counts()
+
+
+def _completed_and_in_progress(cfg: RunConfig) -> tuple[set[int], set[int]]:
+    """Return (completed, in_progress) issue numbers from the status index."""
+    return (cfg.issue_numbers_with_status("completed"),
+            cfg.issue_numbers_with_status("in_progress"))
 
 
 def get_in_progress_issues(cfg: RunConfig) -> set[int]:
     """Return set of issue numbers currently in progress."""
-    return {i.number for i in cfg.issues if i.status == "in_progress"}
+    return cfg.issue_numbers_with_status("in_progress")
 
 
 def get_pending_count(cfg: RunConfig) -> int:
     """Return count of pending + in_progress issues."""
-    return sum(1 for i in cfg.issues if i.status in ("pending", "in_progress"))
+    counts = status_counts(cfg)
+    return counts["pending"] + counts["in_progress"]
 
 
 def get_completed_count(cfg: RunConfig) -> int:
     """Return count of completed issues."""
-    return sum(1 for i in cfg.issues if i.status == "completed")
+    return status_counts(cfg)["completed"]
 
 
 def get_failed_count(cfg: RunConfig) -> int:
     """Return count of failed issues."""
-    return sum(1 for i in cfg.issues if i.status == "failed")
+    return status_counts(cfg)["failed"]
+
+
+def _claimed_numbers(claimed_issues: set[tuple[str, int]], cfg_path: str) -> set[int]:
+    """Issue numbers claimed this cycle from the config at cfg_path."""
+    return {num for path, num in claimed_issues if path == cfg_path}
 
 
 def next_available_issue_global(
@@ -123,29 +447,75 @@ def next_available_issue_global(
     best_key = (999, 999)  # (wave, priority)
 
     for cfg in configs:
-        completed = {i.number for i in cfg.issues if i.status == "completed"}
-        in_progress = {i.number for i in cfg.issues if i.status == "in_progress"}
-        cfg_path = str(cfg.config_path)
+        completed = cfg.issue_numbers_with_status("completed")
+        # The ready heap's top bounds this config's best key from below;
+        # skip the config outright if it can't beat what we already have
+        ready = _dependency_table(cfg, completed).ready
+        if not ready or ready[0][0] >= best_key:
+            continue
 
         # Exclude issues already claimed this cycle
-        for claim_path, claim_num in claimed_issues:
-            if claim_path == cfg_path:
-                in_progress.add(claim_num)
+        in_progress = cfg.issue_numbers_with_status("in_progress")
+        in_progress |= _claimed_numbers(claimed_issues, str(cfg.config_path))
 
-        for issue in sorted(cfg.issues, key=lambda i: (i.wave, i.priority)):
-            if issue.status != "pending" or issue.number in in_progress:
-                continue
-            if not all(dep in completed for dep in issue.depends_on):
-                continue
-            key = (issue.wave, issue.priority)
-            if key < best_key:
-                best = (cfg, issue)
-                best_key = key
-                break  # This config's best; compare with other configs
+        # This config's best; compare with other configs
+        issue = next_available_issue(cfg, completed, in_progress)
+        if issue is not None and issue.sort_key < best_key:
+            best = (cfg, issue)
+            best_key = issue.sort_key
 
     return best
 
 
+def assign_issues(
+    configs: list[RunConfig],
+    worker_ids: list[int],
+    claimed_issues: Optional[set[tuple[str, int]]] = None,
+) -> list[tuple[int, RunConfig, Issue]]:
+    """Hand out the best available issues to several idle workers at once.
+
+    Equivalent to calling next_available_issue_global once per worker and
+    claiming each result, but each config's completed/in-progress sets are
+    built once and the configs' best candidates are merged through a heap.
+    Returns [(worker_id, cfg, issue)] in worker order; workers left over
+    when issues run out are omitted. New claims are added to claimed_issues.
+    """
+    if not worker_ids:
+        return []  # every worker busy: skip the per-config candidate scan
+    if claimed_issues is None:
+        claimed_issues = set()
+
+    completed: list[set[int]] = []
+    excluded: list[set[int]] = []
+    heap: list[tuple[tuple[int, int], int, int]] = []  # (sort_key, cfg index, number)
+    candidates: dict[int, Issue] = {}  # cfg index -> its current best issue
+    for idx, cfg in enumerate(configs):
+        cfg_path = str(cfg.config_path)
+        done, in_progress = _completed_and_in_progress(cfg)
+        completed.append(done)
+        excluded.append(in_progress | _claimed_numbers(claimed_issues, cfg_path))
+        issue = next_available_issue(cfg, completed[idx], excluded[idx])
+        if issue is not None:
+            candidates[idx] = issue
+            heap.append((issue.sort_key, idx, issue.number))
+    heapq.heapify(heap)
+
+    assignments: list[tuple[int, RunConfig, Issue]] = []
+    for worker_id in worker_ids:
+        if not heap:
+            break
+        _, idx, _ = heapq.heappop(heap)
+        cfg, issue = configs[idx], candidates.pop(idx)
+        assignments.append((worker_id, cfg, issue))
+        claimed_issues.add((str(cfg.config_path), issue.number))
+        excluded[idx].add(issue.number)
+        nxt = next_available_issue(cfg, completed[idx], excluded[idx])
+        if nxt is not None:
+            candidates[idx] = nxt
+            heapq.heappush(heap, (nxt.sort_key, idx, nxt.number))
+    return assignments
+
+
 def next_retriable_issue_global(
     configs: list[RunConfig],
     claimed_issues: Optional[set[tuple[str, int]]] = None,
@@ -162,26 +532,19 @@ def next_retriable_issue_global(
     best_score = -1
 
     for cfg in configs:
-        cfg_path = str(cfg.config_path)
-
-        # Build map: issue -> how many issues depend on it (directly or transitively)
-        dependents: dict[int, int] = {}
-        for issue in cfg.issues:
-            for dep in issue.depends_on:
-                dependents[dep] = dependents.get(dep, 0) + 1
+        claimed = _claimed_numbers(claimed_issues, str(cfg.config_path))
+        failed = [i for i in cfg.issues_with_status("failed") if i.number not in claimed]
+        if not failed:
+            continue
+        completed = cfg.issue_numbers_with_status("completed")
+        table = _dependency_table(cfg, completed)
 
-        for issue in cfg.issues:
-            if issue.status != "failed":
-                continue
-            # Skip if already claimed
-            if (cfg_path, issue.number) in claimed_issues:
-                continue
-            # Score: number of downstream dependents (higher = more critical)
-            score = dependents.get(issue.number, 0)
+        for issue in failed:
+            # Score: number of direct dependents (higher = more critical)
+            score = len(table.dependents.get(issue.number, ()))
             # Tiebreak: lower wave first, then lower priority number
             if score > best_score or (score == best_score and best is not None
-                                       and (issue.wave, issue.priority)
-                                       < (best[1].wave, best[1].priority)):
+                                       and issue.sort_key < best[1].sort_key):
                 best = (cfg, issue)
                 best_score = score
 
@@ -198,30 +561,94 @@ def next_available_cross_project(
     Returns (other_cfg, issue) or None. Skips the config at exclude_config path
     (the caller's own project). Respects claimed_cross to avoid duplicates.
     """
-    from pathlib import Path
-    from .config import load_config
-
     if claimed_cross is None:
         claimed_cross = set()
 
-    config_dir = cfg.config_path.parent
-    for config_path in sorted(config_dir.glob("*-issues.json")):
-        resolved = config_path.resolve()
-        if exclude_config and resolved == Path(exclude_config).resolve():
+    excluded = _resolved(str(exclude_config)) if exclude_config else None
+    claimed_resolved = {(_resolved(str(p)), n) for p, n in claimed_cross}
+
+    for config_path, resolved in _list_configs(cfg.config_path.parent):
+        if resolved == excluded:
             continue
         try:
-            other_cfg = load_config(config_path)
+            other_cfg = load_config_cached(config_path)
         except (SystemExit, Exception):
             continue
 
-        completed = {i.number for i in other_cfg.issues if i.status == "completed"}
-        in_progress = {i.number for i in other_cfg.issues if i.status == "in_progress"}
+        completed, in_progress = _completed_and_in_progress(other_cfg)
         # Also exclude issues already claimed this cycle
-        for claim_path, claim_num in claimed_cross:
-            if Path(claim_path).resolve() == resolved:
+        for claim_path, claim_num in claimed_resolved:
+            if claim_path == resolved:
                 in_progress.add(claim_num)
         issue = next_available_issue(other_cfg, completed, in_progress)
         if issue:
             return other_cfg, issue
 
     return None
+
+
+def _list_configs(config_dir: Path) -> list[tuple[Path, Path]]:
+    """Return sorted (path, resolved path) pairs for *-issues.json in config_dir.
+
+    The listing is reused until the directory's mtime changes (a file
+    being added, removed or renamed).
+    """
+    stamp = config_dir.stat().st_mtime_ns
+    entry = _DIR_CACHE.get(config_dir)
+    if entry and entry[0] == stamp:
+        return entry[1]
+    listing = [(p, p.resolve()) for p in sorted(config_dir.glob("*-issues.json"))]
+    _DIR_CACHE[config_dir] = (stamp, listing)
+    return listing
+
+
+def load_config_cached(path: Path) -> RunConfig:
+    """load_config, reusing the last result while the file's mtime and size hold.
+
+    The RunConfig is shared by every caller until the file changes.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _CFG_CACHE.get(path)
+    if entry and entry[0] == stamp:
+        return entry[1]
+    cfg = load_config(path)
+    _CFG_CACHE[path] = (stamp, cfg)
+    return cfg
+
+
+def load_source_config(path: str | Path) -> tuple[RunConfig, StateManager]:
+    """Load a cross-project config and a StateManager for it.
+
+    Both are reused until the file's mtime or size changes. Raises whatever
+    load_config would (SystemExit, or OSError if the file is gone).
+    """
+    cfg = load_config_cached(Path(path))
+    state = _STATE_CACHE.get(cfg.config_path)
+    if state is None or state.cfg is not cfg:
+        state = StateManager(cfg)
+        _STATE_CACHE[cfg.config_path] = state
+    return cfg, state
+
+
+def effective_config(
+    source_config: Optional[str],
+    cfg: RunConfig,
+    state: StateManager,
+) -> tuple[RunConfig, StateManager]:
+    """Return the config/state a cross-project worker belongs to.
+
+    Falls back to (cfg, state) when source_config is empty or can't be loaded.
+    """
+    if source_config:
+        try:
+            return load_source_config(source_config)
+        except (SystemExit, Exception):
+            pass
+    return cfg, state
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved(path: str) -> Path:
+    """Memoized Path.resolve(); config paths don't move during a run."""
+    return Path(path).resolve()
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
+# Most log text the decision helpers ever look at, per snapshot
+LOG_TAIL_MAX_CHARS = 4096
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectContext:
     """Project-specific context injected into prompts."""
     language: str = ""              # go, python, javascript, rust, etc.
@@ -28,7 +32,7 @@ class ProjectContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoConfig:
     """Configuration for a single repository."""
     name: str
@@ -43,13 +47,13 @@ class RepoConfig:
             self.worktree_base = self.path + "-worktrees"
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """An issue to be worked on."""
     number: int
     title: str
     priority: int = 1
-    depends_on: list[int] = field(default_factory=list)
+    depends_on: frozenset[int] = field(default_factory=frozenset)
     wave: int = 1
     status: str = "pending"  # pending | in_progress | completed | failed
     assigned_worker: Optional[int] = None
@@ -57,13 +61,21 @@ class Issue:
     task_type: str = "implement"  # implement | review | test
     pipeline_stage: int = 0  # index into the pipeline list (0 = first stage)
     description: str = ""  # local description (used instead of fetching from platform)
+    # (wave, priority), fixed at construction; scheduling order key
+    sort_key: tuple[int, int] = field(default=(1, 1), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Stored as a frozenset so readiness checks are C-level subset tests
+        if not isinstance(self.depends_on, frozenset):
+            self.depends_on = frozenset(self.depends_on)
+        self.sort_key = (self.wave, self.priority)
 
     def to_dict(self) -> dict:
         d = {
             "number": self.number,
             "title": self.title,
             "priority": self.priority,
-            "depends_on": self.depends_on,
+            "depends_on": sorted(self.depends_on),
             "wave": self.wave,
             "status": self.status,
             "assigned_worker": self.assigned_worker,
@@ -82,7 +94,7 @@ class Issue:
             number=data["number"],
             title=data.get("title", ""),
             priority=data.get("priority", 1),
-            depends_on=data.get("depends_on", []),
+            depends_on=frozenset(data.get("depends_on", ())),
             wave=data.get("wave", 1),
             status=data.get("status", "pending"),
             assigned_worker=data.get("assigned_worker"),
@@ -93,7 +105,7 @@ class Issue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Worker:
     """State of a single worker."""
     worker_id: int
@@ -110,24 +122,14 @@ class Worker:
     stage: str = ""  # current pipeline stage name (for display/logging)
     source_config: Optional[str] = None  # path to config that owns this issue (cross-project)
 
+    # Always serialized / serialized only when truthy
+    _FIELDS = ("worker_id", "issue_number", "branch", "worktree", "status", "started_at",
+               "last_log_size", "last_log_update", "retry_count", "commits", "claude_pid")
+    _OPT_FIELDS = ("stage", "source_config")
+
     def to_dict(self) -> dict:
-        d = {
-            "worker_id": self.worker_id,
-            "issue_number": self.issue_number,
-            "branch": self.branch,
-            "worktree": self.worktree,
-            "status": self.status,
-            "started_at": self.started_at,
-            "last_log_size": self.last_log_size,
-            "last_log_update": self.last_log_update,
-            "retry_count": self.retry_count,
-            "commits": self.commits,
-            "claude_pid": self.claude_pid,
-        }
-        if self.stage:
-            d["stage"] = self.stage
-        if self.source_config:
-            d["source_config"] = self.source_config
+        d = {k: getattr(self, k) for k in self._FIELDS}
+        d.update((k, v) for k in self._OPT_FIELDS if (v := getattr(self, k)))
         return d
 
     @classmethod
@@ -149,9 +151,12 @@ class Worker:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Decision:
-    """A decision made by the orchestrator."""
+    """A decision made by the orchestrator.
+
+    Frozen so that common decisions (noop/idle) can be shared between cycles.
+    """
     action: str  # noop | push | mark_complete | reassign | reassign_cross | restart | skip | idle | advance_stage | defer | retry_failed
     worker: int
     issue: Optional[int] = None
@@ -160,24 +165,25 @@ class Decision:
     continuation: bool = False
     source_config: Optional[str] = None  # config path for cross-project assignments
 
+    # Serialized only when not None / only when truthy
+    _NULLABLE_FIELDS = ("issue", "new_issue")
+    _OPT_FIELDS = ("reason", "continuation", "source_config")
+
     def to_dict(self) -> dict:
         d: dict = {"action": self.action, "worker": self.worker}
-        if self.issue is not None:
-            d["issue"] = self.issue
-        if self.new_issue is not None:
-            d["new_issue"] = self.new_issue
-        if self.reason:
-            d["reason"] = self.reason
-        if self.continuation:
-            d["continuation"] = True
-        if self.source_config:
-            d["source_config"] = self.source_config
+        d.update((k, v) for k in self._NULLABLE_FIELDS if (v := getattr(self, k)) is not None)
+        d.update((k, v) for k in self._OPT_FIELDS if (v := getattr(self, k)))
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerSnapshot:
-    """Point-in-time snapshot of worker state for decision-making."""
+    """Point-in-time snapshot of worker state for decision-making.
+
+    log_tail and new_commits may be given as None along with a loader; they
+    are then read on first access, so a decision that never looks at them
+    costs no log read or git log.
+    """
     worker_id: int
     issue_number: Optional[int]
     status: str
@@ -186,9 +192,56 @@ class WorkerSnapshot:
     exit_code: Optional[int]
     log_size: int
     log_mtime: Optional[float]  # unix timestamp
-    log_tail: str
+    log_tail: Optional[str]
     git_status: str
-    new_commits: str
+    new_commits: Optional[str]
     retry_count: int
     elapsed_seconds: Optional[float] = None  # seconds since worker.started_at
     worktree_mtime: Optional[float] = None  # most recent file modification in worktree
+    stage: str = ""  # worker.stage when the snapshot was taken
+    # (index mtime_ns, HEAD sha) the git fields were read at
+    git_stamp: Optional[tuple[int, str]] = field(default=None, repr=False, compare=False)
+    # Produce log_tail / new_commits when they were passed as None
+    tail_loader: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+    commits_loader: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+    # Derived on first use so decision helpers don't re-slice/strip:
+    # the last LOG_TAIL_MAX_CHARS of log_tail, and len(log_tail.strip())
+    log_tail_tail: str = field(init=False, repr=False, compare=False)
+    log_tail_stripped_len: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # An empty slot sends the first read through __getattr__
+        if self.log_tail is None:
+            del self.log_tail
+        if self.new_commits is None:
+            del self.new_commits
+
+    def __getattr__(self, name: str):
+        # Only reached for lazy slots that haven't been filled yet
+        if name == "log_tail":
+            value = self.tail_loader() if self.tail_loader else ""
+        elif name == "new_commits":
+            value = self.commits_loader() if self.commits_loader else ""
+        elif name == "log_tail_tail":
+            value = self.log_tail[-LOG_TAIL_MAX_CHARS:]
+        elif name == "log_tail_stripped_len":
+            value = len(self.log_tail.strip())
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    def loaded(self, name: str) -> bool:
+        """True if the lazy field `name` has been read already."""
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def refreshed(self, **changes) -> WorkerSnapshot:
+        """dataclasses.replace() that leaves unread lazy fields unread."""
+        for name in ("log_tail", "new_commits"):
+            if not self.loaded(name):
+                changes.setdefault(name, None)
+        return dataclasses.replace(self, **changes)
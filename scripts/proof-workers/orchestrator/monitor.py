@@ -2,31 +2,85 @@
 
 from __future__ import annotations
 
+import functools
+import re
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from collections import Counter
+from typing import Callable, Optional
 
 from . import git, tmux
-from .config import RunConfig, NUM_WORKERS
+from .config import CONFIG_LOAD_ERRORS, RunConfig, NUM_WORKERS
 from .decisions import compute_decision, compute_decision_global
 from .issues import (
-    get_completed_count,
-    get_failed_count,
-    get_pending_count,
+    assign_issues,
+    effective_config,
+    fetch_issue_bodies,
+    load_config_cached,
+    load_source_config,
+    status_counts,
 )
 from .models import Decision, WorkerSnapshot
 from .prompt import (
+    extract_retry_context,
     generate_prompt,
     generate_failure_analysis_prompt,
     generate_explore_options_prompt,
 )
-from .state import StateManager
+from .state import StateManager, now_iso
+from .watch import SignalWatcher
+
+
+# Workers not running are re-snapshotted only every N cycles; in between the
+# previous snapshot is reused. Running workers are polled every cycle.
+WARM_POLL_EVERY = 5    # status "unknown"
+COLD_POLL_EVERY = 60   # status "idle" / "failed"
+SNAPSHOT_WORKERS = 32  # max snapshot threads; they mostly wait on subprocesses, not the CPU
+WARMUP_SECONDS = 60    # initial wait for freshly launched workers
+# Longest sleep quiet cycles back off to; the shortest decision clock
+# (EMPTY_LOG_TIMEOUT) is noticed at most this much late
+QUIET_INTERVAL_MAX = 120
+
+# Markers _build_claude_cmd's shell writes around claude; EXIT carries its code
+_DEADMAN_START = "[DEADMAN] START"
+_DEADMAN_EXIT_RE = re.compile(r'\[DEADMAN\] EXIT.*?code=(\d+)')
+
+
+# Banner and summary rules
+_HDR_BOX = "+" + "=" * 40 + "+"
+_HR50 = "=" * 50
+
+# (epoch second, "HH:MM:SS") of the last log line, so the stamp is
+# formatted once per second rather than per message
+_log_stamp: tuple[int, str] = (-1, "")
 
 
 def log_msg(msg: str) -> None:
-    """Print a timestamped log message."""
-    now = datetime.now().strftime("%H:%M:%S")
-    print(f"[{now}] {msg}", flush=True)
+    """Write a timestamped log message.
+
+    Output is not flushed per line; the monitor loops flush once per cycle
+    before waiting (set PYTHONUNBUFFERED=1 to see every line immediately).
+    """
+    global _log_stamp
+    sec = int(time.time())
+    if _log_stamp[0] != sec:
+        _log_stamp = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+    sys.stdout.write(f"[{_log_stamp[1]}] {msg}\n")
+
+
+def _buffer_stdout() -> None:
+    """Turn off line buffering so log_msg lines reach the terminal per flush.
+
+    On a tty (the monitor's tmux pane) Python line-buffers stdout, which
+    makes every log_msg its own write despite the once-per-cycle flush.
+    PYTHONUNBUFFERED still writes each line through.
+    """
+    try:
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        pass  # not a TextIOWrapper (replaced or captured stream)
 
 
 def _build_claude_cmd(
@@ -65,15 +119,88 @@ def _build_claude_cmd(
     return f'cd {worktree} && {start_marker} && {claude}; {exit_marker}'
 
 
+def _launch_claude(session: str, state: StateManager, worker_id: int, worktree: str,
+                   issue_num: int, stage: str, prompt: str, append: bool = False,
+                   batch: Optional[tmux.CommandBatch] = None) -> None:
+    """Write the worker's prompt file and run claude on it in its tmux window.
+
+    With `batch`, the keystrokes are queued on it instead of sent now.
+    """
+    state.write_prompt(worker_id, prompt)
+    (batch or tmux).send_command(
+        session,
+        f"worker-{worker_id}",
+        _build_claude_cmd(worktree, str(state.prompt_path(worker_id)),
+                          str(state.log_path(worker_id)), str(state.signal_path(worker_id)),
+                          worker_id, issue_num, stage, append=append),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_commits(worktree: str, head: str, base: str, base_ref: str) -> str:
+    """git log base_ref..HEAD, re-run only when either end moves."""
+    return git.get_recent_commits(worktree, count=5, since_ref=base_ref)
+
+
+def _new_commits(worktree: str, head: Optional[str], base_ref: str) -> str:
+    """Commits on the worktree's branch since base_ref."""
+    base = git.rev_parse(worktree, base_ref) if head else None
+    if base:
+        return _cached_commits(worktree, head, base, base_ref)
+    return git.get_recent_commits(worktree, count=5, since_ref=base_ref)
+
+
+@functools.lru_cache(maxsize=256)
+def _terminal_snapshot(worker_id: int, status: str, issue_number: Optional[int],
+                       retry_count: int, stage: str = "") -> WorkerSnapshot:
+    """Snapshot for an idle/failed worker; its decision never looks further."""
+    return WorkerSnapshot(
+        worker_id=worker_id,
+        issue_number=issue_number,
+        status=status,
+        claude_running=False,
+        signal_exists=False,
+        exit_code=None,
+        log_size=0,
+        log_mtime=None,
+        log_tail="",
+        git_status="",
+        new_commits="",
+        retry_count=retry_count,
+        stage=stage,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _started_epoch(started_at: str) -> Optional[float]:
+    """Parse a worker's started_at once; naive stamps are taken as UTC."""
+    try:
+        start = datetime.fromisoformat(started_at)
+    except (TypeError, ValueError):
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.timestamp()
+
+
 def collect_worker_snapshot(
     worker_id: int,
     cfg: RunConfig,
     state: StateManager,
     tmux_session: Optional[str] = None,
+    pane_pids: Optional[dict[str, int]] = None,
+    claude_children: Optional[dict[int, int]] = None,
+    prev: Optional[WorkerSnapshot] = None,
 ) -> WorkerSnapshot:
     """Collect a point-in-time snapshot of a worker's state.
 
     tmux_session: override the tmux session name (for unified monitor).
+    pane_pids: {window name: pane pid} from tmux.list_pane_pids for this
+    cycle; looked up per worker when not given.
+    claude_children: {pane pid: claude pid} from git.find_claude_children
+    for this cycle; claude is looked up per worker when not given.
+    prev: this worker's previous snapshot. If its log, signal and git
+    stamps still hold, it is reused with only the live fields refreshed.
     """
     worker = state.load_worker(worker_id)
     if worker is None:
@@ -92,11 +219,20 @@ def collect_worker_snapshot(
             retry_count=0,
         )
 
+    # Idle and failed workers need no tmux, git or log probes
+    if worker.status in ("idle", "failed"):
+        return _terminal_snapshot(worker_id, worker.status, worker.issue_number,
+                                  worker.retry_count, worker.stage)
+
     session = tmux_session or cfg.tmux_session
 
     # Check if claude is running in this tmux window
-    pane_pid = tmux.get_pane_pid(session, f"worker-{worker_id}")
-    claude_running = git.is_claude_running(pane_pid)
+    window = f"worker-{worker_id}"
+    if pane_pids is not None:
+        pane_pid = pane_pids.get(window)
+    else:
+        pane_pid = tmux.get_pane_pid(session, window)
+    claude_running = git.is_claude_running(pane_pid, claude_children)
 
     # Check signal file
     exit_code = state.read_signal(worker_id)
@@ -105,43 +241,57 @@ def collect_worker_snapshot(
     # Log file stats
     log_size, log_mtime = state.get_log_stats(worker_id)
 
-    # Log tail
-    log_tail = state.get_log_tail(worker_id, lines=20)
+    # Compute elapsed_seconds from worker.started_at
+    elapsed_seconds = None
+    if worker.started_at:
+        start = _started_epoch(worker.started_at)
+        if start is not None:
+            elapsed_seconds = time.time() - start
 
-    # Git status in worktree — resolve repo from effective config
-    git_status = ""
-    new_commits = ""
+    # git status always runs: the worktree scan is depth-limited, so an edit
+    # to a deeply nested tracked file can leave every cheaper stamp unchanged
     worktree_mtime = None
+    git_stamp = None
+    git_status = ""
     if worker.worktree:
-        git_status = git.get_status(worker.worktree)
         worktree_mtime = git.get_worktree_mtime(worker.worktree)
+        head = git.rev_parse(worker.worktree)
+        index_mtime = git.index_mtime_ns(worker.worktree)
+        if head and index_mtime:
+            git_stamp = (index_mtime, head)
+        git_status = git.get_status(worker.worktree)
+
+    # Nothing the log and git fields derive from has moved: reuse them
+    if (prev is not None and git_stamp is not None and not signal_exists
+            and not prev.signal_exists and prev.git_stamp == git_stamp
+            and (prev.status, prev.issue_number) == (worker.status, worker.issue_number)
+            and (prev.log_size, prev.log_mtime) == (log_size, log_mtime)
+            and prev.worktree_mtime == worktree_mtime and prev.git_status == git_status):
+        return prev.refreshed(claude_running=claude_running,
+                              retry_count=worker.retry_count,
+                              elapsed_seconds=elapsed_seconds,
+                              stage=worker.stage)
+
+    # Log tail and branch commits are read only if the decision asks for them
+    tail_loader = functools.partial(state.tail_log, worker_id, lines=20,
+                                    stat=(log_size, log_mtime))
+    commits_loader = None
+
+    # Branch commits — resolve repo from effective config
+    if worker.worktree:
         # Try effective config first (cross-project), fall back to cfg
-        eff_cfg = cfg
-        if worker.source_config:
-            from .config import load_config as _load_config
-            try:
-                eff_cfg = _load_config(worker.source_config)
-            except (SystemExit, Exception):
-                pass
+        eff_cfg, _ = effective_config(worker.source_config, cfg, state)
         repo = eff_cfg.repo_for_issue_by_number(worker.issue_number) if worker.issue_number else None
         base_ref = f"origin/{repo.default_branch}" if repo else "origin/main"
-        new_commits = git.get_recent_commits(worker.worktree, count=5, since_ref=base_ref)
-
-    # Compute elapsed_seconds from worker.started_at
-    elapsed_seconds = None
-    if worker.started_at:
-        try:
-            start = datetime.fromisoformat(worker.started_at)
-            if start.tzinfo is None:
-                start = start.replace(tzinfo=timezone.utc)
-            elapsed_seconds = time.time() - start.timestamp()
-        except Exception:
-            pass
+        commits_loader = functools.partial(_new_commits, worker.worktree, head, base_ref)
 
     # Auto-recover missing signal file from DEADMAN EXIT in log
-    if not signal_exists and not claude_running and log_tail:
-        import re
-        m = re.search(r'\[DEADMAN\] EXIT.*?code=(\d+)', log_tail)
+    log_tail = None
+    if not signal_exists and not claude_running:
+        log_tail = tail_loader()
+        # Appended logs keep earlier phases' markers; only an EXIT after
+        # the last START belongs to the current run
+        m = _DEADMAN_EXIT_RE.search(log_tail, max(log_tail.rfind(_DEADMAN_START), 0))
         if m:
             recovered_code = int(m.group(1))
             sig = state.signal_path(worker_id)
@@ -162,496 +312,541 @@ def collect_worker_snapshot(
         log_mtime=log_mtime,
         log_tail=log_tail,
         git_status=git_status,
-        new_commits=new_commits,
+        new_commits=None,
         retry_count=worker.retry_count,
         elapsed_seconds=elapsed_seconds,
         worktree_mtime=worktree_mtime,
+        stage=worker.stage,
+        git_stamp=git_stamp,
+        tail_loader=tail_loader,
+        commits_loader=commits_loader,
     )
 
 
-def execute_decision(
+def _do_noop(
     decision: Decision,
     cfg: RunConfig,
     state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
 ) -> None:
-    """Execute a single decision."""
-    action = decision.action
+    """Log a decision to leave the worker alone."""
     worker_id = decision.worker
+    log_msg(f"Worker {worker_id}: noop — {decision.reason}")
+
+
+def _do_push(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Push the worker's branch."""
+    worker_id = decision.worker
+    issue_num = decision.issue
+    worker = state.load_worker(worker_id)
+    if worker and worker.worktree:
+        branch = worker.branch
+        log_msg(f"Worker {worker_id}: pushing branch {branch}")
+        success = git.push_branch(worker.worktree, branch=branch)
+        if not success:
+            log_msg(f"WARNING: push failed for issue #{issue_num}")
+    state.log_event({"action": "push", "worker": worker_id, "issue": issue_num})
+
 
-    if action == "noop":
-        log_msg(f"Worker {worker_id}: noop — {decision.reason}")
+def _do_mark_complete(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Mark the worker's issue completed, in its own project's config."""
+    worker_id = decision.worker
+    issue_num = decision.issue
+    if decision.source_config:
+        # Cross-project: update the source project's config
+        try:
+            src_cfg, src_state = load_source_config(decision.source_config)
+            log_msg(f"Marking issue #{issue_num} as completed (in {src_cfg.project})")
+            src_state.update_issue_status(issue_num, "completed")
+        except (SystemExit, Exception) as e:
+            log_msg(f"WARNING: failed to update source config: {e}")
+    else:
+        log_msg(f"Marking issue #{issue_num} as completed")
+        state.update_issue_status(issue_num, "completed")
+    state.clear_signal(worker_id)
+    # Clear cross-project tracking on the worker
+    worker = state.load_worker(worker_id)
+    if worker:
+        worker.source_config = None
+        state.save_worker(worker)
+    state.log_event({"action": "mark_complete", "issue": issue_num})
+
+
+def _do_reassign(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Move the worker onto another issue of this project and launch it."""
+    worker_id = decision.worker
+    new_issue_num = decision.new_issue
+    if new_issue_num is None:
+        log_msg(f"Worker {worker_id}: no new issue to assign")
         return
 
-    if action == "push":
-        issue_num = decision.issue
-        worker = state.load_worker(worker_id)
-        if worker and worker.worktree:
-            branch = worker.branch
-            log_msg(f"Worker {worker_id}: pushing branch {branch}")
-            success = git.push_branch(worker.worktree, branch=branch)
-            if not success:
-                log_msg(f"WARNING: push failed for issue #{issue_num}")
-        state.log_event({"action": "push", "worker": worker_id, "issue": issue_num})
-
-    elif action == "mark_complete":
-        issue_num = decision.issue
-        if decision.source_config:
-            # Cross-project: update the source project's config
-            from .config import load_config as _load_config
-            try:
-                src_cfg = _load_config(decision.source_config)
-                src_state = StateManager(src_cfg)
-                log_msg(f"Marking issue #{issue_num} as completed (in {src_cfg.project})")
-                src_state.update_issue_status(issue_num, "completed")
-            except (SystemExit, Exception) as e:
-                log_msg(f"WARNING: failed to update source config: {e}")
-        else:
-            log_msg(f"Marking issue #{issue_num} as completed")
-            state.update_issue_status(issue_num, "completed")
-        state.clear_signal(worker_id)
-        # Clear cross-project tracking on the worker
-        worker = state.load_worker(worker_id)
-        if worker:
-            worker.source_config = None
-            state.save_worker(worker)
-        state.log_event({"action": "mark_complete", "issue": issue_num})
-
-    elif action == "reassign":
-        new_issue_num = decision.new_issue
-        if new_issue_num is None:
-            log_msg(f"Worker {worker_id}: no new issue to assign")
-            return
-
-        new_issue = cfg.get_issue(new_issue_num)
-        if new_issue is None:
-            log_msg(f"Worker {worker_id}: issue #{new_issue_num} not found")
-            return
-
-        repo = cfg.repo_for_issue(new_issue)
-        new_branch = f"{repo.branch_prefix}{new_issue_num}"
-        new_wt = f"{repo.worktree_base}/issue-{new_issue_num}"
-
-        log_msg(f"Worker {worker_id}: reassigning to issue #{new_issue_num}")
-
-        # Create worktree if needed
-        git.create_worktree(
-            repo.path, new_wt, new_branch,
-            base_branch=f"origin/{repo.default_branch}",
-        )
+    new_issue = cfg.get_issue(new_issue_num)
+    if new_issue is None:
+        log_msg(f"Worker {worker_id}: issue #{new_issue_num} not found")
+        return
 
-        # Update worker state
-        worker = state.load_worker(worker_id)
-        if worker:
-            worker.issue_number = new_issue_num
-            worker.branch = new_branch
-            worker.worktree = new_wt
-            worker.status = "running"
-            worker.started_at = _now_iso()
-            worker.retry_count = 0
-            worker.last_log_size = 0
-            worker.commits = []
-            worker.source_config = None  # home project assignment
-            state.save_worker(worker)
-
-        # Update issue status
-        state.update_issue_status(new_issue_num, "in_progress", assigned_worker=worker_id)
-
-        # Clear signal and truncate log
-        state.clear_signal(worker_id)
-        state.truncate_log(worker_id)
+    repo = cfg.repo_for_issue(new_issue)
+    new_branch = f"{repo.branch_prefix}{new_issue_num}"
+    new_wt = f"{repo.worktree_base}/issue-{new_issue_num}"
 
-        # Determine pipeline stage for the new issue
-        stage_name = cfg.pipeline[new_issue.pipeline_stage] if cfg.pipeline else "implement"
+    log_msg(f"Worker {worker_id}: reassigning to issue #{new_issue_num}")
 
-        # Update worker stage
-        if worker:
-            worker.stage = stage_name
-            state.save_worker(worker)
+    # Create worktree if needed
+    git.create_worktree(
+        repo.path, new_wt, new_branch,
+        base_branch=f"origin/{repo.default_branch}",
+    )
 
-        # Generate prompt and launch worker
-        prompt_path = state.prompt_path(worker_id)
-        prompt = generate_prompt(
-            stage_name, new_issue, worker_id, new_wt, repo, cfg, state,
-        )
-        prompt_path.write_text(prompt)
+    # Determine pipeline stage for the new issue
+    stage_name = cfg.pipeline[new_issue.pipeline_stage] if cfg.pipeline else "implement"
 
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
+    # Update worker state
+    worker = state.load_worker(worker_id)
+    if worker:
+        worker.issue_number = new_issue_num
+        worker.branch = new_branch
+        worker.worktree = new_wt
+        worker.status = "running"
+        worker.started_at = now_iso()
+        worker.retry_count = 0
+        worker.last_log_size = 0
+        worker.commits = []
+        worker.source_config = None  # home project assignment
+        worker.stage = stage_name
+        state.save_worker(worker)
 
-        tmux.send_command(
-            cfg.tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(new_wt, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, new_issue_num, stage_name),
-        )
+    # Update issue status
+    state.update_issue_status(new_issue_num, "in_progress", assigned_worker=worker_id)
 
-        state.log_event({"action": "reassign", "worker": worker_id, "new_issue": new_issue_num})
+    # Clear signal and truncate log
+    state.clear_signal(worker_id)
+    state.truncate_log(worker_id)
 
-    elif action == "restart":
-        log_msg(f"Worker {worker_id}: restarting — {decision.reason}")
-        worker = state.load_worker(worker_id)
-        if not worker or not worker.issue_number:
-            log_msg(f"Worker {worker_id}: no worker state for restart")
-            return
+    # Generate prompt and launch worker
+    prompt = generate_prompt(
+        stage_name, new_issue, worker_id, new_wt, repo, cfg, state,
+    )
+    _launch_claude(cfg.tmux_session, state, worker_id, new_wt, new_issue_num, stage_name,
+                   prompt, batch=batch)
 
-        # Resolve effective config (may be cross-project)
-        eff_cfg = cfg
-        eff_state = state
-        if worker.source_config:
-            from .config import load_config as _load_config
-            try:
-                eff_cfg = _load_config(worker.source_config)
-                eff_state = StateManager(eff_cfg)
-            except (SystemExit, Exception):
-                pass
+    state.log_event({"action": "reassign", "worker": worker_id, "new_issue": new_issue_num})
 
-        issue_num = worker.issue_number
-        issue = eff_cfg.get_issue(issue_num)
-        if not issue:
-            log_msg(f"Worker {worker_id}: issue #{issue_num} not found")
-            return
 
-        repo = eff_cfg.repo_for_issue(issue)
+def _do_restart(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Relaunch the worker's current stage, counting a retry."""
+    worker_id = decision.worker
+    log_msg(f"Worker {worker_id}: restarting — {decision.reason}")
+    worker = state.load_worker(worker_id)
+    if not worker or not worker.issue_number:
+        log_msg(f"Worker {worker_id}: no worker state for restart")
+        return
 
-        # Determine current pipeline stage
-        stage_name = eff_cfg.pipeline[issue.pipeline_stage] if eff_cfg.pipeline else "implement"
+    # Resolve effective config (may be cross-project)
+    eff_cfg, eff_state = effective_config(worker.source_config, cfg, state)
 
-        # Generate prompt BEFORE clearing log (continuation reads it)
-        prompt_path = state.prompt_path(worker_id)
-        prompt = generate_prompt(
-            stage_name, issue, worker_id, worker.worktree, repo, eff_cfg, eff_state,
-            continuation=decision.continuation,
-        )
-        prompt_path.write_text(prompt)
+    issue_num = worker.issue_number
+    issue = eff_cfg.get_issue(issue_num)
+    if not issue:
+        log_msg(f"Worker {worker_id}: issue #{issue_num} not found")
+        return
 
-        # Update retry count
-        worker.retry_count += 1
-        worker.status = "running"
-        worker.stage = stage_name
-        state.save_worker(worker)
+    repo = eff_cfg.repo_for_issue(issue)
 
-        # Kill any existing claude process
-        tmux.send_ctrl_c(cfg.tmux_session, f"worker-{worker_id}")
-        time.sleep(2)
+    # Determine current pipeline stage
+    stage_name = eff_cfg.pipeline[issue.pipeline_stage] if eff_cfg.pipeline else "implement"
 
-        # Clear signal
-        state.clear_signal(worker_id)
+    # Generate prompt BEFORE clearing log (continuation reads it)
+    prompt = generate_prompt(
+        stage_name, issue, worker_id, worker.worktree, repo, eff_cfg, eff_state,
+        continuation=decision.continuation,
+    )
+    # Update retry count
+    worker.retry_count += 1
+    worker.status = "running"
+    worker.stage = stage_name
+    state.save_worker(worker)
 
-        # Fresh log — the previous log was already compressed into the prompt
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
+    # Kill any existing claude process
+    tmux.send_ctrl_c(cfg.tmux_session, f"worker-{worker_id}")
+    time.sleep(2)
 
-        tmux.send_command(
-            cfg.tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(worker.worktree, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, issue_num, stage_name),
-        )
+    # Clear signal
+    state.clear_signal(worker_id)
 
-        state.log_event({
-            "action": "restart", "worker": worker_id,
-            "issue": issue_num, "retry_count": worker.retry_count,
-        })
+    # Fresh log — the previous log was already compressed into the prompt
+    _launch_claude(cfg.tmux_session, state, worker_id, worker.worktree, issue_num,
+                   stage_name, prompt, batch=batch)
 
-    elif action == "advance_stage":
-        issue_num = decision.issue
-        worker = state.load_worker(worker_id)
-        if not worker or not worker.issue_number:
-            log_msg(f"Worker {worker_id}: no worker state for advance_stage")
-            return
-
-        # Resolve effective config (may be cross-project)
-        eff_cfg = cfg
-        eff_state = state
-        if decision.source_config or worker.source_config:
-            from .config import load_config as _load_config
-            src_path = decision.source_config or worker.source_config
-            try:
-                eff_cfg = _load_config(src_path)
-                eff_state = StateManager(eff_cfg)
-            except (SystemExit, Exception):
-                pass
+    state.log_event({
+        "action": "restart", "worker": worker_id,
+        "issue": issue_num, "retry_count": worker.retry_count,
+    })
 
-        issue = eff_cfg.get_issue(issue_num)
-        if not issue:
-            log_msg(f"Worker {worker_id}: issue #{issue_num} not found")
-            return
 
-        repo = eff_cfg.repo_for_issue(issue)
-        old_stage = eff_cfg.pipeline[issue.pipeline_stage] if issue.pipeline_stage < len(eff_cfg.pipeline) else "?"
+def _do_advance_stage(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Move the worker's issue to its next pipeline stage and launch it."""
+    worker_id = decision.worker
+    issue_num = decision.issue
+    worker = state.load_worker(worker_id)
+    if not worker or not worker.issue_number:
+        log_msg(f"Worker {worker_id}: no worker state for advance_stage")
+        return
 
-        # Advance the pipeline stage
-        issue.pipeline_stage += 1
-        eff_state.update_issue_stage(issue.number, issue.pipeline_stage)
+    # Resolve effective config (may be cross-project)
+    eff_cfg, eff_state = effective_config(decision.source_config or worker.source_config,
+                                          cfg, state)
 
-        next_stage = eff_cfg.pipeline[issue.pipeline_stage]
-        log_msg(f"Worker {worker_id}: advancing issue #{issue_num} from {old_stage} to {next_stage}")
+    issue = eff_cfg.get_issue(issue_num)
+    if not issue:
+        log_msg(f"Worker {worker_id}: issue #{issue_num} not found")
+        return
 
-        # Update worker state — keep same branch/worktree, reset retry count
-        worker.status = "running"
-        worker.started_at = _now_iso()
-        worker.retry_count = 0
-        worker.stage = next_stage
-        state.save_worker(worker)
+    repo = eff_cfg.repo_for_issue(issue)
+    old_stage = eff_cfg.pipeline[issue.pipeline_stage] if issue.pipeline_stage < len(eff_cfg.pipeline) else "?"
 
-        # Clear signal (do NOT truncate log — append for continuity)
-        state.clear_signal(worker_id)
+    # Advance the pipeline stage
+    issue.pipeline_stage += 1
+    eff_state.update_issue_stage(issue.number, issue.pipeline_stage)
 
-        # Generate next stage prompt and relaunch
-        prompt_path = state.prompt_path(worker_id)
-        prompt = generate_prompt(
-            next_stage, issue, worker_id, worker.worktree, repo, eff_cfg, eff_state,
-        )
-        prompt_path.write_text(prompt)
+    next_stage = eff_cfg.pipeline[issue.pipeline_stage]
+    log_msg(f"Worker {worker_id}: advancing issue #{issue_num} from {old_stage} to {next_stage}")
 
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
-
-        tmux.send_command(
-            cfg.tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(worker.worktree, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, issue_num, next_stage,
-                              append=True),
-        )
+    # Update worker state — keep same branch/worktree, reset retry count
+    worker.status = "running"
+    worker.started_at = now_iso()
+    worker.retry_count = 0
+    worker.stage = next_stage
+    state.save_worker(worker)
 
-        state.log_event({
-            "action": "advance_stage", "worker": worker_id,
-            "issue": issue_num, "stage": next_stage,
-        })
+    # Clear signal (do NOT truncate log — append for continuity)
+    state.clear_signal(worker_id)
 
-    elif action == "skip":
-        issue_num = decision.issue
-        log_msg(f"Worker {worker_id}: skipping issue #{issue_num} (exceeded retries)")
+    # Generate next stage prompt and relaunch
+    prompt = generate_prompt(
+        next_stage, issue, worker_id, worker.worktree, repo, eff_cfg, eff_state,
+    )
+    _launch_claude(cfg.tmux_session, state, worker_id, worker.worktree, issue_num, next_stage,
+                   prompt, append=True, batch=batch)
 
-        # Update status in the correct project config
-        worker = state.load_worker(worker_id)
-        if worker and worker.source_config:
-            from .config import load_config as _load_config
-            try:
-                src_cfg = _load_config(worker.source_config)
-                src_state = StateManager(src_cfg)
-                src_state.update_issue_status(issue_num, "failed")
-            except (SystemExit, Exception):
-                state.update_issue_status(issue_num, "failed")
-        else:
+    state.log_event({
+        "action": "advance_stage", "worker": worker_id,
+        "issue": issue_num, "stage": next_stage,
+    })
+
+
+def _do_skip(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Mark the worker's issue failed and idle the worker."""
+    worker_id = decision.worker
+    issue_num = decision.issue
+    log_msg(f"Worker {worker_id}: skipping issue #{issue_num} (exceeded retries)")
+
+    # Update status in the correct project config
+    worker = state.load_worker(worker_id)
+    if worker and worker.source_config:
+        try:
+            src_cfg, src_state = load_source_config(worker.source_config)
+            src_state.update_issue_status(issue_num, "failed")
+        except (SystemExit, Exception):
             state.update_issue_status(issue_num, "failed")
-        state.clear_signal(worker_id)
+    else:
+        state.update_issue_status(issue_num, "failed")
+    state.clear_signal(worker_id)
+
+    if worker:
+        worker.status = "idle"
+        worker.issue_number = None
+        worker.stage = ""
+        worker.source_config = None
+        state.save_worker(worker)
 
-        if worker:
-            worker.status = "idle"
-            worker.issue_number = None
-            worker.stage = ""
-            worker.source_config = None
-            state.save_worker(worker)
+    state.log_event({"action": "skip", "worker": worker_id, "issue": issue_num})
 
-        state.log_event({"action": "skip", "worker": worker_id, "issue": issue_num})
 
-    elif action == "reassign_cross":
-        # Cross-project assignment: load the other project's config
-        from .config import load_config as _load_config
+def _do_reassign_cross(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Move the worker onto another project's issue and launch it."""
+    worker_id = decision.worker
+    # Cross-project assignment: load the other project's config
+    new_issue_num = decision.new_issue
+    source_config_path = decision.source_config
+    if not new_issue_num or not source_config_path:
+        log_msg(f"Worker {worker_id}: cross-project reassign missing issue or config")
+        return
 
-        new_issue_num = decision.new_issue
-        source_config_path = decision.source_config
-        if not new_issue_num or not source_config_path:
-            log_msg(f"Worker {worker_id}: cross-project reassign missing issue or config")
-            return
+    try:
+        other_cfg, other_state = load_source_config(source_config_path)
+    except (SystemExit, Exception) as e:
+        log_msg(f"Worker {worker_id}: failed to load cross-project config: {e}")
+        return
+
+    new_issue = other_cfg.get_issue(new_issue_num)
+    if new_issue is None:
+        log_msg(f"Worker {worker_id}: issue #{new_issue_num} not found in {other_cfg.project}")
+        return
+
+    repo = other_cfg.repo_for_issue(new_issue)
+    new_branch = f"{repo.branch_prefix}{new_issue_num}"
+    new_wt = f"{repo.worktree_base}/issue-{new_issue_num}"
+
+    log_msg(f"Worker {worker_id}: cross-project -> #{new_issue_num} ({other_cfg.project})")
 
+    # Create worktree if needed
+    git.create_worktree(
+        repo.path, new_wt, new_branch,
+        base_branch=f"origin/{repo.default_branch}",
+    )
+
+    # Determine pipeline stage
+    stage_name = other_cfg.pipeline[new_issue.pipeline_stage] if other_cfg.pipeline else "implement"
+
+    # Update worker state with source_config tracking
+    worker = state.load_worker(worker_id)
+    if worker:
+        worker.issue_number = new_issue_num
+        worker.branch = new_branch
+        worker.worktree = new_wt
+        worker.status = "running"
+        worker.started_at = now_iso()
+        worker.retry_count = 0
+        worker.last_log_size = 0
+        worker.commits = []
+        worker.source_config = source_config_path
+        worker.stage = stage_name
+        state.save_worker(worker)
+
+    # Update issue status in the OTHER project's config
+    other_state.update_issue_status(new_issue_num, "in_progress", assigned_worker=worker_id)
+
+    # Clear signal and truncate log
+    state.clear_signal(worker_id)
+    state.truncate_log(worker_id)
+
+    # Generate prompt using OTHER project's config/context
+    prompt = generate_prompt(
+        stage_name, new_issue, worker_id, new_wt, repo, other_cfg, other_state,
+    )
+    _launch_claude(cfg.tmux_session, state, worker_id, new_wt, new_issue_num, stage_name,
+                   prompt, batch=batch)
+
+    state.log_event({
+        "action": "reassign_cross", "worker": worker_id,
+        "new_issue": new_issue_num, "source_project": other_cfg.project,
+    })
+
+
+def _do_defer(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Put the worker's issue back to pending and idle the worker."""
+    worker_id = decision.worker
+    issue_num = decision.issue
+    log_msg(f"Worker {worker_id}: deferring issue #{issue_num} back to pending")
+
+    # Update status in the correct project config
+    if decision.source_config:
         try:
-            other_cfg = _load_config(source_config_path)
-        except (SystemExit, Exception) as e:
-            log_msg(f"Worker {worker_id}: failed to load cross-project config: {e}")
-            return
+            src_cfg, src_state = load_source_config(decision.source_config)
+            src_state.update_issue_status(issue_num, "pending", assigned_worker=None)
+        except (SystemExit, Exception):
+            state.update_issue_status(issue_num, "pending", assigned_worker=None)
+    else:
+        state.update_issue_status(issue_num, "pending", assigned_worker=None)
 
-        new_issue = other_cfg.get_issue(new_issue_num)
-        if new_issue is None:
-            log_msg(f"Worker {worker_id}: issue #{new_issue_num} not found in {other_cfg.project}")
-            return
+    state.clear_signal(worker_id)
+    worker = state.load_worker(worker_id)
+    if worker:
+        worker.status = "idle"
+        worker.issue_number = None
+        worker.stage = ""
+        worker.source_config = None
+        state.save_worker(worker)
 
-        repo = other_cfg.repo_for_issue(new_issue)
-        new_branch = f"{repo.branch_prefix}{new_issue_num}"
-        new_wt = f"{repo.worktree_base}/issue-{new_issue_num}"
+    state.log_event({"action": "defer", "worker": worker_id, "issue": issue_num})
 
-        log_msg(f"Worker {worker_id}: cross-project -> #{new_issue_num} ({other_cfg.project})")
 
-        # Create worktree if needed
-        git.create_worktree(
-            repo.path, new_wt, new_branch,
-            base_branch=f"origin/{repo.default_branch}",
-        )
+def _do_retry_failed(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Reopen another project's failed issue and start its analysis phase."""
+    worker_id = decision.worker
+    new_issue_num = decision.new_issue
+    source_config_path = decision.source_config
+    if not new_issue_num or not source_config_path:
+        log_msg(f"Worker {worker_id}: retry_failed missing issue or config")
+        return
 
-        # Update worker state with source_config tracking
-        worker = state.load_worker(worker_id)
-        if worker:
-            worker.issue_number = new_issue_num
-            worker.branch = new_branch
-            worker.worktree = new_wt
-            worker.status = "running"
-            worker.started_at = _now_iso()
-            worker.retry_count = 0
-            worker.last_log_size = 0
-            worker.commits = []
-            worker.source_config = source_config_path
-            state.save_worker(worker)
-
-        # Update issue status in the OTHER project's config
-        other_state = StateManager(other_cfg)
-        other_state.update_issue_status(new_issue_num, "in_progress", assigned_worker=worker_id)
-
-        # Clear signal and truncate log
-        state.clear_signal(worker_id)
-        state.truncate_log(worker_id)
+    try:
+        other_cfg, other_state = load_source_config(source_config_path)
+    except (SystemExit, Exception) as e:
+        log_msg(f"Worker {worker_id}: failed to load config for retry: {e}")
+        return
 
-        # Determine pipeline stage
-        stage_name = other_cfg.pipeline[new_issue.pipeline_stage] if other_cfg.pipeline else "implement"
+    new_issue = other_cfg.get_issue(new_issue_num)
+    if new_issue is None:
+        log_msg(f"Worker {worker_id}: issue #{new_issue_num} not found for retry")
+        return
 
-        if worker:
-            worker.stage = stage_name
-            state.save_worker(worker)
+    repo = other_cfg.repo_for_issue(new_issue)
+    new_branch = f"{repo.branch_prefix}{new_issue_num}"
+    new_wt = f"{repo.worktree_base}/issue-{new_issue_num}"
 
-        # Generate prompt using OTHER project's config/context
-        prompt_path = state.prompt_path(worker_id)
-        prompt = generate_prompt(
-            stage_name, new_issue, worker_id, new_wt, repo, other_cfg, other_state,
-        )
-        prompt_path.write_text(prompt)
+    log_msg(f"Worker {worker_id}: retrying failed #{new_issue_num} ({other_cfg.project})")
 
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
+    # Create worktree if needed
+    git.create_worktree(
+        repo.path, new_wt, new_branch,
+        base_branch=f"origin/{repo.default_branch}",
+    )
 
-        tmux.send_command(
-            cfg.tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(new_wt, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, new_issue_num, stage_name),
-        )
+    # Reset issue from failed to in_progress, reset pipeline_stage
+    other_state.update_issue_status(new_issue_num, "in_progress", assigned_worker=worker_id)
+    other_state.update_issue_stage(new_issue_num, 0)
 
-        state.log_event({
-            "action": "reassign_cross", "worker": worker_id,
-            "new_issue": new_issue_num, "source_project": other_cfg.project,
-        })
+    # Update worker state — start in retry_analyze phase
+    worker = state.load_worker(worker_id)
+    if worker:
+        worker.issue_number = new_issue_num
+        worker.branch = new_branch
+        worker.worktree = new_wt
+        worker.status = "running"
+        worker.started_at = now_iso()
+        worker.retry_count = 0
+        worker.last_log_size = 0
+        worker.commits = []
+        worker.source_config = source_config_path
+        worker.stage = "retry_analyze"
+        state.save_worker(worker)
 
-    elif action == "defer":
-        issue_num = decision.issue
-        log_msg(f"Worker {worker_id}: deferring issue #{issue_num} back to pending")
+    # Clear signal and truncate log
+    state.clear_signal(worker_id)
+    state.truncate_log(worker_id)
 
-        # Update status in the correct project config
-        if decision.source_config:
-            from .config import load_config as _load_config
-            try:
-                src_cfg = _load_config(decision.source_config)
-                src_state = StateManager(src_cfg)
-                src_state.update_issue_status(issue_num, "pending", assigned_worker=None)
-            except (SystemExit, Exception):
-                state.update_issue_status(issue_num, "pending", assigned_worker=None)
-        else:
-            state.update_issue_status(issue_num, "pending", assigned_worker=None)
+    # Kill existing process, send failure analysis prompt
+    tmux.send_ctrl_c(cfg.tmux_session, f"worker-{worker_id}")
+    time.sleep(1)
 
-        state.clear_signal(worker_id)
-        worker = state.load_worker(worker_id)
-        if worker:
-            worker.status = "idle"
-            worker.issue_number = None
-            worker.stage = ""
-            worker.source_config = None
-            state.save_worker(worker)
-
-        state.log_event({"action": "defer", "worker": worker_id, "issue": issue_num})
-
-    elif action == "retry_failed":
-        new_issue_num = decision.new_issue
-        source_config_path = decision.source_config
-        if not new_issue_num or not source_config_path:
-            log_msg(f"Worker {worker_id}: retry_failed missing issue or config")
-            return
-
-        from .config import load_config as _load_config
-        try:
-            other_cfg = _load_config(source_config_path)
-        except (SystemExit, Exception) as e:
-            log_msg(f"Worker {worker_id}: failed to load config for retry: {e}")
-            return
+    prompt = generate_failure_analysis_prompt(
+        new_issue, worker_id, new_wt, repo, other_cfg, other_state,
+    )
+    _launch_claude(cfg.tmux_session, state, worker_id, new_wt, new_issue_num,
+                   "retry_analyze", prompt, batch=batch)
 
-        new_issue = other_cfg.get_issue(new_issue_num)
-        if new_issue is None:
-            log_msg(f"Worker {worker_id}: issue #{new_issue_num} not found for retry")
-            return
+    state.log_event({
+        "action": "retry_failed", "worker": worker_id,
+        "issue": new_issue_num, "phase": "retry_analyze",
+    })
 
-        repo = other_cfg.repo_for_issue(new_issue)
-        new_branch = f"{repo.branch_prefix}{new_issue_num}"
-        new_wt = f"{repo.worktree_base}/issue-{new_issue_num}"
 
-        log_msg(f"Worker {worker_id}: retrying failed #{new_issue_num} ({other_cfg.project})")
+def _do_idle(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Idle the worker; there is nothing left for it."""
+    worker_id = decision.worker
+    log_msg(f"Worker {worker_id}: idle (no more issues)")
+    state.clear_signal(worker_id)
+    worker = state.load_worker(worker_id)
+    if worker:
+        worker.status = "idle"
+        worker.issue_number = None
+        worker.stage = ""
+        worker.source_config = None
+        state.save_worker(worker)
 
-        # Create worktree if needed
-        git.create_worktree(
-            repo.path, new_wt, new_branch,
-            base_branch=f"origin/{repo.default_branch}",
-        )
 
-        # Reset issue from failed to in_progress, reset pipeline_stage
-        other_state = StateManager(other_cfg)
-        other_state.update_issue_status(new_issue_num, "in_progress", assigned_worker=worker_id)
-        other_state.update_issue_stage(new_issue_num, 0)
-
-        # Update worker state — start in retry_analyze phase
-        worker = state.load_worker(worker_id)
-        if worker:
-            worker.issue_number = new_issue_num
-            worker.branch = new_branch
-            worker.worktree = new_wt
-            worker.status = "running"
-            worker.started_at = _now_iso()
-            worker.retry_count = 0
-            worker.last_log_size = 0
-            worker.commits = []
-            worker.source_config = source_config_path
-            worker.stage = "retry_analyze"
-            state.save_worker(worker)
-
-        # Clear signal and truncate log
-        state.clear_signal(worker_id)
-        state.truncate_log(worker_id)
+# decision.action -> the function that carries it out
+_ACTIONS: dict[str, Callable[..., None]] = {
+    "noop": _do_noop,
+    "push": _do_push,
+    "mark_complete": _do_mark_complete,
+    "reassign": _do_reassign,
+    "restart": _do_restart,
+    "advance_stage": _do_advance_stage,
+    "skip": _do_skip,
+    "reassign_cross": _do_reassign_cross,
+    "defer": _do_defer,
+    "retry_failed": _do_retry_failed,
+    "idle": _do_idle,
+}
 
-        # Kill existing process, send failure analysis prompt
-        tmux.send_ctrl_c(cfg.tmux_session, f"worker-{worker_id}")
-        time.sleep(1)
 
-        prompt_path = state.prompt_path(worker_id)
-        prompt = generate_failure_analysis_prompt(
-            new_issue, worker_id, new_wt, repo, other_cfg, other_state,
-        )
-        prompt_path.write_text(prompt)
+def execute_decision(
+    decision: Decision,
+    cfg: RunConfig,
+    state: StateManager,
+    batch: Optional[tmux.CommandBatch] = None,
+) -> None:
+    """Execute a single decision.
 
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
-
-        tmux.send_command(
-            cfg.tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(new_wt, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, new_issue_num,
-                              "retry_analyze"),
-        )
+    batch: queue tmux keystrokes here for the caller to flush once per
+    cycle; they're sent immediately when not given.
+    """
+    handler = _ACTIONS.get(decision.action)
+    if handler is None:
+        log_msg(f"WARNING: Unknown action '{decision.action}' for worker {decision.worker}")
+        return
+    handler(decision, cfg, state, batch)
 
-        state.log_event({
-            "action": "retry_failed", "worker": worker_id,
-            "issue": new_issue_num, "phase": "retry_analyze",
-        })
 
-    elif action == "idle":
-        log_msg(f"Worker {worker_id}: idle (no more issues)")
-        state.clear_signal(worker_id)
-        worker = state.load_worker(worker_id)
-        if worker:
-            worker.status = "idle"
-            worker.issue_number = None
-            worker.stage = ""
-            worker.source_config = None
-            state.save_worker(worker)
+def _prefetch_issue_bodies(decisions: list[Decision], configs: list[RunConfig]) -> None:
+    """Batch-fetch bodies for issues about to be assigned this cycle.
 
-    else:
-        log_msg(f"WARNING: Unknown action '{action}' for worker {worker_id}")
+    Prompt generation then hits the issue cache instead of fetching each
+    new issue with its own platform call.
+    """
+    by_path = {str(c.config_path): c for c in configs}
+    wanted: dict[str, list] = {}
+    for d in decisions:
+        if d.action in ("reassign_cross", "retry_failed") and d.new_issue and d.source_config:
+            cfg = by_path.get(d.source_config)
+            issue = cfg.get_issue(d.new_issue) if cfg else None
+            if issue:
+                wanted.setdefault(d.source_config, []).append(issue)
+    for path, issues in wanted.items():
+        cfg = by_path[path]
+        fetch_issue_bodies(issues, cfg, StateManager(cfg))
 
 
 def _handle_retry_phase(
@@ -659,6 +854,7 @@ def _handle_retry_phase(
     cfg: RunConfig,
     state: StateManager,
     tmux_session: str,
+    batch: Optional[tmux.CommandBatch] = None,
 ) -> bool:
     """Handle retry phase progression (analyze -> explore -> implement).
 
@@ -677,9 +873,8 @@ def _handle_retry_phase(
     if not worker.source_config or not worker.issue_number:
         return False
 
-    from .config import load_config as _load_config
     try:
-        eff_cfg = _load_config(worker.source_config)
+        eff_cfg, eff_state = load_source_config(worker.source_config)
     except (SystemExit, Exception):
         return False
 
@@ -688,7 +883,6 @@ def _handle_retry_phase(
         return False
 
     repo = eff_cfg.repo_for_issue(issue)
-    eff_state = StateManager(eff_cfg)
 
     if worker.stage == "retry_analyze":
         # Progress to retry_explore
@@ -698,23 +892,12 @@ def _handle_retry_phase(
         worker.stage = "retry_explore"
         state.save_worker(worker)
 
-        prompt_path = state.prompt_path(worker_id)
         prompt = generate_explore_options_prompt(
             issue, worker_id, worker.worktree, repo, eff_cfg, eff_state,
         )
-        prompt_path.write_text(prompt)
-
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
-
         # Append to log (keep analysis context)
-        tmux.send_command(
-            tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(worker.worktree, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, worker.issue_number,
-                              "retry_explore", append=True),
-        )
+        _launch_claude(tmux_session, state, worker_id, worker.worktree, worker.issue_number,
+                       "retry_explore", prompt, append=True, batch=batch)
 
         state.log_event({
             "action": "retry_phase", "worker": worker_id,
@@ -733,28 +916,16 @@ def _handle_retry_phase(
         state.save_worker(worker)
 
         # Extract the analysis+explore output from the log to feed into the prompt
-        from .prompt import extract_retry_context
         log_file = state.log_path(worker_id)
         retry_ctx = extract_retry_context(str(log_file))
 
-        prompt_path = state.prompt_path(worker_id)
         prompt = generate_prompt(
             stage_name, issue, worker_id, worker.worktree, repo, eff_cfg, eff_state,
             retry_context=retry_ctx,
         )
-        prompt_path.write_text(prompt)
-
-        log_file = state.log_path(worker_id)
-        signal_file = state.signal_path(worker_id)
-
         # Append to log (keep analysis + explore context)
-        tmux.send_command(
-            tmux_session,
-            f"worker-{worker_id}",
-            _build_claude_cmd(worker.worktree, str(prompt_path), str(log_file),
-                              str(signal_file), worker_id, worker.issue_number,
-                              stage_name, append=True),
-        )
+        _launch_claude(tmux_session, state, worker_id, worker.worktree, worker.issue_number,
+                       stage_name, prompt, append=True, batch=batch)
 
         state.log_event({
             "action": "retry_phase", "worker": worker_id,
@@ -765,10 +936,15 @@ def _handle_retry_phase(
     return False
 
 
-def all_done(cfg: RunConfig, state: StateManager) -> bool:
-    """Check if all work is complete."""
-    pending = get_pending_count(cfg)
-    if pending > 0:
+def all_done(cfg: RunConfig, state: StateManager,
+             counts: Optional[Counter[str]] = None) -> bool:
+    """Check if all work is complete.
+
+    counts: this cycle's status_counts(cfg), if the caller already has it.
+    """
+    if counts is None:
+        counts = status_counts(cfg)
+    if counts["pending"] + counts["in_progress"] > 0:
         return False
 
     # Check if any workers are still running
@@ -783,10 +959,16 @@ def all_done_global(
     configs: list[RunConfig],
     state: StateManager,
     num_workers: int,
+    counts: Optional[list[Counter[str]]] = None,
 ) -> bool:
-    """Check if all work is complete across all configs."""
-    for cfg in configs:
-        if get_pending_count(cfg) > 0:
+    """Check if all work is complete across all configs.
+
+    counts: this cycle's status_counts() for each config, in order.
+    """
+    if counts is None:
+        counts = [status_counts(cfg) for cfg in configs]
+    for c in counts:
+        if c["pending"] + c["in_progress"] > 0:
             return False
     # Check if any workers are still running
     for i in range(1, num_workers + 1):
@@ -796,12 +978,110 @@ def all_done_global(
     return True
 
 
+def _poll_interval(status: Optional[str]) -> int:
+    """Return how many cycles apart a worker in this status is snapshotted."""
+    if status in ("idle", "failed"):
+        return COLD_POLL_EVERY
+    if status == "unknown":
+        return WARM_POLL_EVERY
+    return 1
+
+
+def collect_snapshots(
+    worker_ids: range,
+    cfg: RunConfig,
+    state: StateManager,
+    cycle: int,
+    cache: dict[int, WorkerSnapshot],
+    tmux_session: Optional[str] = None,
+    pane_pids: Optional[dict[str, int]] = None,
+    pool: Optional[ThreadPoolExecutor] = None,
+) -> list[WorkerSnapshot]:
+    """Snapshot workers for this cycle, reusing cached snapshots of quiet ones.
+
+    A cached snapshot is only reused while the worker's status and issue in
+    state still match it, so any transition is picked up on the next cycle.
+    With `pool`, the fresh snapshots are collected concurrently; their
+    tmux/git subprocess calls are independent per worker.
+    """
+    snapshots: dict[int, WorkerSnapshot] = {}
+    due = []
+    for i in worker_ids:
+        worker = state.load_worker(i)
+        status = worker.status if worker else "unknown"
+        cached = cache.get(i)
+        if (cached is not None and cycle % _poll_interval(status) != 0
+                and cached.status == status
+                and cached.issue_number == (worker.issue_number if worker else None)):
+            snapshots[i] = cached
+        else:
+            due.append(i)
+
+    if pane_pids is not None:
+        git.prune_claude_pidfds(pane_pids.values())
+
+    # One ps call finds claude in every due pane not already tracked by pidfd
+    claude_children = None
+    if pane_pids is not None and due:
+        claude_children = git.find_claude_children(
+            pid for i in due if (pid := pane_pids.get(f"worker-{i}")) is not None
+        )
+
+    def collect(i: int) -> WorkerSnapshot:
+        return collect_worker_snapshot(i, cfg, state, tmux_session=tmux_session,
+                                       pane_pids=pane_pids, claude_children=claude_children,
+                                       prev=cache.get(i))
+
+    fresh = pool.map(collect, due) if pool is not None and len(due) > 1 else map(collect, due)
+    for i, snapshot in zip(due, fresh):
+        cache[i] = snapshots[i] = snapshot
+    return [snapshots[i] for i in worker_ids]
+
+
+def _flush_batch(batch: tmux.CommandBatch) -> None:
+    """Send the cycle's queued tmux keys, logging any worker they didn't reach."""
+    for target in batch.flush():
+        log_msg(f"WARNING: tmux keys for {target} were not delivered")
+
+
+def _wait_for_next_cycle(watcher: SignalWatcher, interval: float) -> bool:
+    """Sleep until the next cycle, waking early if a worker signals completion.
+
+    Besides signal files, the wait covers the pidfds of running claude
+    processes, so a claude that dies without its shell writing a signal
+    (pane or shell killed) is picked up right away too. Returns True if
+    the wait was cut short by one of those events.
+    """
+    sys.stdout.flush()
+    signalled = watcher.wait(interval, git.claude_exit_fds())
+    if signalled:
+        log_msg(f"Woken early by {', '.join(sorted(signalled))}")
+    return bool(signalled)
+
+
+def _next_sleep(sleep: float, base: float, busy: bool) -> float:
+    """Sleep before the next cycle: base after any action, else doubled up to QUIET_INTERVAL_MAX.
+
+    Never below base. Worker exits and signals still cut the sleep short.
+    """
+    if busy:
+        return base
+    return max(base, min(sleep * 2, QUIET_INTERVAL_MAX))
+
+
+def _log_wakeups(cycles: int, woken: int) -> None:
+    """Log how many cycles were started by a worker event vs the timer."""
+    log_msg(f"Cycles: {cycles} ({woken} woken by worker events, "
+            f"{cycles - 1 - woken} by timeout)")
+
+
 def run_monitor_loop(cfg: RunConfig, state: StateManager,
                      no_delay: bool = False) -> None:
     """Run the main monitor loop."""
-    log_msg("+" + "=" * 40 + "+")
+    _buffer_stdout()
+    log_msg(_HDR_BOX)
     log_msg("|  Orchestrator Monitor Loop Started     |")
-    log_msg("+" + "=" * 40 + "+")
+    log_msg(_HDR_BOX)
     log_msg(f"Cycle interval: {cfg.cycle_interval}s")
     log_msg(f"Stall timeout: {cfg.stall_timeout}s")
     log_msg(f"Max retries: {cfg.max_retries}")
@@ -809,66 +1089,95 @@ def run_monitor_loop(cfg: RunConfig, state: StateManager,
     log_msg(f"State dir: {cfg.state_dir}")
     log_msg("")
 
+    watcher = SignalWatcher(state.signal_path(i) for i in range(1, cfg.num_workers + 1))
     if not no_delay:
-        log_msg("Waiting 60s for workers to initialize...")
-        time.sleep(60)
+        # A worker that finishes (or dies) during warm-up starts the first cycle
+        log_msg(f"Waiting up to {WARMUP_SECONDS}s for workers to initialize...")
+        _wait_for_next_cycle(watcher, WARMUP_SECONDS)
     else:
         log_msg("Skipping initial delay (--no-delay)")
 
+    state.defer_events()
+
+    snapshot_cache: dict[int, WorkerSnapshot] = {}
+    pool = ThreadPoolExecutor(max_workers=min(cfg.num_workers, SNAPSHOT_WORKERS))
+    batch = tmux.CommandBatch()
     cycle = 0
+    woken = 0  # cycles started early by a signal file or claude exit
+    sleep = cfg.cycle_interval  # grows while cycles stay quiet, see _next_sleep
     while True:
         cycle += 1
         log_msg(f"==== Cycle {cycle} starting ====")
 
-        # 1. Collect snapshots
-        log_msg("Collecting worker state...")
-        snapshots = []
-        for i in range(1, cfg.num_workers + 1):
-            snapshots.append(collect_worker_snapshot(i, cfg, state))
-
-        # 2. Compute decisions for each worker
-        #    Track issues claimed during this cycle to prevent duplicates
-        claimed_issues: set[int] = set()
-        # Track cross-project claims as (config_path, issue_number) to prevent duplicates
-        claimed_cross: set[tuple[str, int]] = set()
-        all_decisions: list[Decision] = []
-        for snapshot in snapshots:
-            decisions = compute_decision(snapshot, cfg, state, claimed_issues, claimed_cross)
-            for d in decisions:
-                if d.action == "reassign" and d.new_issue is not None:
-                    claimed_issues.add(d.new_issue)
-                elif d.action == "reassign_cross" and d.new_issue is not None and d.source_config:
-                    claimed_cross.add((d.source_config, d.new_issue))
-            all_decisions.extend(decisions)
-
-        # Log decisions
-        action_summary = [d.action for d in all_decisions]
-        log_msg(f"Decisions: {action_summary}")
-
-        # 3. Execute decisions
-        log_msg(f"Executing {len(all_decisions)} decisions...")
-        for decision in all_decisions:
-            execute_decision(decision, cfg, state)
-
-        # 4. Check if all work is done
-        if all_done(cfg, state):
+        state.begin_cycle()
+        try:
+            # 1. Collect snapshots
+            log_msg("Collecting worker state...")
+            pane_pids = tmux.list_pane_pids(cfg.tmux_session)
+            snapshots = collect_snapshots(range(1, cfg.num_workers + 1), cfg, state, cycle,
+                                          snapshot_cache, pane_pids=pane_pids, pool=pool)
+
+            # 2. Compute decisions for each worker
+            #    Track issues claimed during this cycle to prevent duplicates
+            claimed_issues: set[int] = set()
+            # Track cross-project claims as (config_path, issue_number) to prevent duplicates
+            claimed_cross: set[tuple[str, int]] = set()
+            all_decisions: list[Decision] = []
+            for snapshot in snapshots:
+                decisions = compute_decision(snapshot, cfg, state, claimed_issues, claimed_cross)
+                for d in decisions:
+                    if d.action == "reassign" and d.new_issue is not None:
+                        claimed_issues.add(d.new_issue)
+                    elif d.action == "reassign_cross" and d.new_issue is not None and d.source_config:
+                        claimed_cross.add((d.source_config, d.new_issue))
+                all_decisions.extend(decisions)
+
+            # Log decisions (quiet cycles where every worker noops log nothing)
+            action_counts = Counter(d.action for d in all_decisions)
+            busy = bool(set(action_counts) - {"noop"})
+            if busy:
+                log_msg(f"Decisions: {dict(action_counts)}")
+
+            # 3. Execute decisions
+            log_msg(f"Executing {len(all_decisions)} decisions...")
+            for decision in all_decisions:
+                execute_decision(decision, cfg, state, batch)
+
+            # 4. Check if all work is done (one status scan serves the summary
+            #    too; worker reads still come from this cycle's snapshot)
+            counts = status_counts(cfg)
+            done = all_done(cfg, state, counts)
+        finally:
+            state.end_cycle()
+            state.flush_events()
+            _flush_batch(batch)
+
+        if done:
             log_msg("All issues completed or failed. Orchestrator shutting down.")
             state.log_event({"action": "shutdown", "reason": "all_done"})
-            _print_summary(cfg, state)
+            _print_summary(cfg, state, counts)
             break
 
         # 5. Status summary
-        completed = get_completed_count(cfg)
-        pending = get_pending_count(cfg)
-        failed = get_failed_count(cfg)
+        completed = counts["completed"]
+        pending = counts["pending"] + counts["in_progress"]
+        failed = counts["failed"]
         total = len(cfg.issues)
         log_msg(f"Progress: {completed}/{total} completed, {pending} pending, {failed} failed")
-        log_msg(f"==== Cycle {cycle} complete. Sleeping {cfg.cycle_interval}s ====")
+        sleep = _next_sleep(sleep, cfg.cycle_interval, busy)
+        log_msg(f"==== Cycle {cycle} complete. Sleeping {sleep}s ====")
         log_msg("")
 
-        time.sleep(cfg.cycle_interval)
+        if _wait_for_next_cycle(watcher, sleep):
+            woken += 1
+            sleep = cfg.cycle_interval
 
+    pool.shutdown()
+    watcher.close()
+    state.flush_events()
+    _log_wakeups(cycle, woken)
     log_msg("Orchestrator monitor exited.")
+    sys.stdout.flush()
 
 
 def run_monitor_loop_global(
@@ -879,12 +1188,13 @@ def run_monitor_loop_global(
     no_delay: bool = False,
 ) -> None:
     """Run the unified monitor loop across all configs."""
+    _buffer_stdout()
     cycle_interval = min(c.cycle_interval for c in configs)
     max_retries = max(c.max_retries for c in configs)
 
-    log_msg("+" + "=" * 40 + "+")
+    log_msg(_HDR_BOX)
     log_msg("|  Unified Orchestrator Monitor Started  |")
-    log_msg("+" + "=" * 40 + "+")
+    log_msg(_HDR_BOX)
     log_msg(f"Projects: {[c.project for c in configs]}")
     log_msg(f"Workers: {num_workers}")
     log_msg(f"Cycle interval: {cycle_interval}s")
@@ -892,102 +1202,152 @@ def run_monitor_loop_global(
     log_msg(f"State dir: {state.state_dir}")
     log_msg("")
 
+    watcher = SignalWatcher(state.signal_path(i) for i in range(1, num_workers + 1))
     if not no_delay:
-        log_msg("Waiting 60s for workers to initialize...")
-        time.sleep(60)
+        # A worker that finishes (or dies) during warm-up starts the first cycle
+        log_msg(f"Waiting up to {WARMUP_SECONDS}s for workers to initialize...")
+        _wait_for_next_cycle(watcher, WARMUP_SECONDS)
     else:
         log_msg("Skipping initial delay (--no-delay)")
 
+    state.defer_events()
+
+    configs = list(configs)  # reloads below replace entries in place
+    snapshot_cache: dict[int, WorkerSnapshot] = {}
+    pool = ThreadPoolExecutor(max_workers=min(num_workers, SNAPSHOT_WORKERS))
+    batch = tmux.CommandBatch()
     cycle = 0
+    woken = 0  # cycles started early by a signal file or claude exit
+    sleep = cycle_interval  # grows while cycles stay quiet, see _next_sleep
     while True:
         cycle += 1
         log_msg(f"==== Cycle {cycle} starting ====")
 
-        # Reload configs from disk to get fresh issue statuses
-        from .config import load_config
-        fresh_configs = []
-        for cfg in configs:
+        # Pick up fresh issue statuses; only configs whose file changed are re-parsed
+        for idx, cfg in enumerate(configs):
             try:
-                fresh = load_config(cfg.config_path)
+                fresh = load_config_cached(cfg.config_path)
+            except CONFIG_LOAD_ERRORS as e:
+                log_msg(f"WARNING: Keeping previous config for {cfg.config_path}: {e!r}")
+                continue
+            if fresh is not cfg:
                 fresh.tmux_session = tmux_session  # Override with unified session
                 fresh.num_workers = num_workers
-                fresh_configs.append(fresh)
-            except (SystemExit, Exception):
-                fresh_configs.append(cfg)
-        configs = fresh_configs
-
-        # 1. Handle retry phase transitions first
-        for i in range(1, num_workers + 1):
-            _handle_retry_phase(i, configs[0], state, tmux_session)
-
-        # 2. Collect snapshots
-        log_msg("Collecting worker state...")
-        snapshots = []
-        for i in range(1, num_workers + 1):
-            snapshots.append(collect_worker_snapshot(i, configs[0], state, tmux_session=tmux_session))
-
-        # 3. Compute decisions using global scheduling
-        claimed_issues: set[tuple[str, int]] = set()
-        all_decisions: list[Decision] = []
-        for snapshot in snapshots:
-            # Skip workers in retry phases (handled above)
-            worker = state.load_worker(snapshot.worker_id)
-            if worker and worker.stage in ("retry_analyze", "retry_explore"):
-                continue
+                configs[idx] = fresh
+        interval = min(c.cycle_interval for c in configs)
+        if interval != cycle_interval:
+            log_msg(f"Cycle interval changed: {cycle_interval}s -> {interval}s")
+            cycle_interval = sleep = interval
 
-            decisions = compute_decision_global(
-                snapshot, configs, state, claimed_issues,
-            )
-            for d in decisions:
-                if d.new_issue is not None and d.source_config:
-                    claimed_issues.add((d.source_config, d.new_issue))
-            all_decisions.extend(decisions)
-
-        # Log decisions
-        action_summary = [d.action for d in all_decisions]
-        log_msg(f"Decisions: {action_summary}")
-
-        # 4. Execute decisions (use first config for tmux session name)
-        log_msg(f"Executing {len(all_decisions)} decisions...")
-        for decision in all_decisions:
-            execute_decision(decision, configs[0], state)
-
-        # 5. Check if all work is done
-        if all_done_global(configs, state, num_workers):
+        state.begin_cycle()
+        try:
+            # 1. Handle retry phase transitions first
+            for i in range(1, num_workers + 1):
+                _handle_retry_phase(i, configs[0], state, tmux_session, batch)
+            # Send those launches now: their signal files are already cleared,
+            # and the snapshots below must not see a phase that hasn't started
+            _flush_batch(batch)
+
+            # 2. Collect snapshots
+            log_msg("Collecting worker state...")
+            pane_pids = tmux.list_pane_pids(tmux_session)
+            snapshots = collect_snapshots(range(1, num_workers + 1), configs[0], state, cycle,
+                                          snapshot_cache, tmux_session=tmux_session,
+                                          pane_pids=pane_pids, pool=pool)
+
+            # 3. Compute decisions using global scheduling
+            # Skip workers in retry phases (handled above)
+            active = [s for s in snapshots if s.stage not in ("retry_analyze", "retry_explore")]
+
+            # Idle workers get their issues from one dispatcher pass
+            claimed_issues: set[tuple[str, int]] = set()
+            idle_ids = [s.worker_id for s in active if s.status == "idle" or s.issue_number is None]
+            idle_assignments = {
+                worker_id: (cfg, issue)
+                for worker_id, cfg, issue in assign_issues(configs, idle_ids, claimed_issues)
+            }
+
+            all_decisions: list[Decision] = []
+            for snapshot in active:
+                decisions = compute_decision_global(
+                    snapshot, configs, state, claimed_issues,
+                    idle_assignments=idle_assignments,
+                )
+                for d in decisions:
+                    if d.new_issue is not None and d.source_config:
+                        claimed_issues.add((d.source_config, d.new_issue))
+                all_decisions.extend(decisions)
+
+            # Log decisions (quiet cycles where every worker noops log nothing)
+            action_counts = Counter(d.action for d in all_decisions)
+            busy = bool(set(action_counts) - {"noop"})
+            if busy:
+                log_msg(f"Decisions: {dict(action_counts)}")
+
+            # 4. Execute decisions (use first config for tmux session name)
+            _prefetch_issue_bodies(all_decisions, configs)
+            log_msg(f"Executing {len(all_decisions)} decisions...")
+            for decision in all_decisions:
+                execute_decision(decision, configs[0], state, batch)
+
+            # 5. Check if all work is done (one status scan serves the summary
+            #    too; worker reads still come from this cycle's snapshot)
+            all_counts = [status_counts(cfg) for cfg in configs]
+            done = all_done_global(configs, state, num_workers, all_counts)
+        finally:
+            state.end_cycle()
+            state.flush_events()
+            _flush_batch(batch)
+
+        if done:
             log_msg("All issues completed or failed. Orchestrator shutting down.")
             state.log_event({"action": "shutdown", "reason": "all_done"})
-            _print_summary_global(configs, state)
+            _print_summary_global(configs, state, all_counts)
             break
 
         # 6. Status summary
-        for cfg in configs:
-            completed = get_completed_count(cfg)
-            pending = get_pending_count(cfg)
-            failed = get_failed_count(cfg)
+        for cfg, counts in zip(configs, all_counts):
+            completed = counts["completed"]
+            pending = counts["pending"] + counts["in_progress"]
+            failed = counts["failed"]
             total = len(cfg.issues)
             log_msg(f"  {cfg.project}: {completed}/{total} completed, {pending} pending, {failed} failed")
-        log_msg(f"==== Cycle {cycle} complete. Sleeping {cycle_interval}s ====")
+        sleep = _next_sleep(sleep, cycle_interval, busy)
+        log_msg(f"==== Cycle {cycle} complete. Sleeping {sleep}s ====")
         log_msg("")
 
-        time.sleep(cycle_interval)
+        if _wait_for_next_cycle(watcher, sleep):
+            woken += 1
+            sleep = cycle_interval
 
+    pool.shutdown()
+    watcher.close()
+    state.flush_events()
+    _log_wakeups(cycle, woken)
     log_msg("Unified orchestrator monitor exited.")
+    sys.stdout.flush()
+
 
+def _print_summary_global(configs: list[RunConfig], state: StateManager,
+                          all_counts: Optional[list[Counter[str]]] = None) -> None:
+    """Print a final summary report across all configs.
 
-def _print_summary_global(configs: list[RunConfig], state: StateManager) -> None:
-    """Print a final summary report across all configs."""
+    all_counts: status_counts() for each config, if the caller has them.
+    """
+    if all_counts is None:
+        all_counts = [status_counts(cfg) for cfg in configs]
     log_msg("")
-    log_msg("=" * 50)
+    log_msg(_HR50)
     log_msg("  FINAL SUMMARY")
-    log_msg("=" * 50)
+    log_msg(_HR50)
 
     total_all = 0
     completed_all = 0
     failed_all = 0
 
-    for cfg in configs:
-        completed = get_completed_count(cfg)
-        failed = get_failed_count(cfg)
+    for cfg, counts in zip(configs, all_counts):
+        completed = counts["completed"]
+        failed = counts["failed"]
         total = len(cfg.issues)
         total_all += total
         completed_all += completed
@@ -999,23 +1359,30 @@ def _print_summary_global(configs: list[RunConfig], state: StateManager) -> None
     if failed_all > 0:
         log_msg("")
         log_msg("  Failed issues:")
-        for cfg in configs:
-            for issue in cfg.issues:
-                if issue.status == "failed":
-                    log_msg(f"    [{cfg.project}] #{issue.number}: {issue.title}")
-    log_msg("=" * 50)
+        for cfg, counts in zip(configs, all_counts):
+            if not counts["failed"]:
+                continue
+            for issue in cfg.issues_with_status("failed"):
+                log_msg(f"    [{cfg.project}] #{issue.number}: {issue.title}")
+    log_msg(_HR50)
 
 
-def _print_summary(cfg: RunConfig, state: StateManager) -> None:
-    """Print a final summary report."""
-    completed = get_completed_count(cfg)
-    failed = get_failed_count(cfg)
+def _print_summary(cfg: RunConfig, state: StateManager,
+                   counts: Optional[Counter[str]] = None) -> None:
+    """Print a final summary report.
+
+    counts: status_counts(cfg), if the caller has it.
+    """
+    if counts is None:
+        counts = status_counts(cfg)
+    completed = counts["completed"]
+    failed = counts["failed"]
     total = len(cfg.issues)
 
     log_msg("")
-    log_msg("=" * 50)
+    log_msg(_HR50)
     log_msg("  FINAL SUMMARY")
-    log_msg("=" * 50)
+    log_msg(_HR50)
     log_msg(f"  Total issues: {total}")
     log_msg(f"  Completed:    {completed}")
     log_msg(f"  Failed:       {failed}")
@@ -1023,11 +1390,6 @@ def _print_summary(cfg: RunConfig, state: StateManager) -> None:
 
     if failed > 0:
         log_msg("  Failed issues:")
-        for issue in cfg.issues:
-            if issue.status == "failed":
-                log_msg(f"    #{issue.number}: {issue.title}")
-    log_msg("=" * 50)
-
-
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for issue in cfg.issues_with_status("failed"):
+            log_msg(f"    #{issue.number}: {issue.title}")
+    log_msg(_HR50)
@@ -35,21 +35,7 @@ def generate_prompt(
     retry_context: optional analysis from a previous failed attempt,
     injected so the worker knows what went wrong and how to fix it.
     """
-    generators = {
-        # Code implementation stages
-        "implement": _generate_implement,
-        "optimize": _generate_optimize,
-        "write_tests": _generate_write_tests,
-        "run_tests_fix": _generate_run_tests_fix,
-        "document": _generate_document,
-        # Documentation research stages
-        "research": _generate_research,
-        "draft": _generate_draft,
-        "validate": _generate_validate,
-        "review": _generate_review,
-    }
-
-    generator = generators.get(stage)
+    generator = _STAGE_GENERATORS.get(stage)
     if generator is None:
         raise ValueError(f"Unknown pipeline stage: {stage!r}. Valid: {sorted(VALID_STAGES)}")
 
@@ -641,6 +627,22 @@ Create file: `docs-dev/reviews/issue-{issue.number}-review.md`
 """
 
 
+# Stage name -> body generator, for generate_prompt
+_STAGE_GENERATORS = {
+    # Code implementation stages
+    "implement": _generate_implement,
+    "optimize": _generate_optimize,
+    "write_tests": _generate_write_tests,
+    "run_tests_fix": _generate_run_tests_fix,
+    "document": _generate_document,
+    # Documentation research stages
+    "research": _generate_research,
+    "draft": _generate_draft,
+    "validate": _generate_validate,
+    "review": _generate_review,
+}
+
+
 # ── Retry context extraction ───────────────────────────────────────────────
 
 
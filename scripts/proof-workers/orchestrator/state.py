@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
-from datetime import datetime, timezone
+import os
+import time
 from pathlib import Path
 from typing import Optional
 
-from .config import RunConfig
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .config import RunConfig, read_json
 from .models import Worker
 
 
@@ -15,17 +22,80 @@ def atomic_write(path: Path, data: dict | list) -> None:
     """Write data to a file atomically using write-to-temp-then-rename."""
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        ))
+    else:
+        tmp.write_text(json.dumps(data, indent=2) + "\n")
     tmp.rename(path)
 
 
+def _event_line(record: dict) -> bytes:
+    """Encode one event log record as a JSONL line, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(record) + "\n").encode()
+
+
+# Bytes re-checked before the last tail offset to detect a rewritten log
+LOG_TAIL_GUARD = 64
+# Bytes tail_log() first reads back from the end of a log; grown as needed
+LOG_TAIL_WINDOW = 16 * 1024
+
+
+# (epoch second, formatted string) of the last now_iso() call
+_iso_stamp: tuple[int, str] = (-1, "")
+
+
 def now_iso() -> str:
-    """Return current UTC time as ISO 8601 string."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    """Return current UTC time as ISO 8601 string.
+
+    The string only changes once a second, so it's formatted at most that
+    often and shared by every caller within the same second.
+    """
+    global _iso_stamp
+    sec = int(time.time())
+    if _iso_stamp[0] != sec:
+        _iso_stamp = (sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec)))
+    return _iso_stamp[1]
+
+
+def _read_tail(fd: int, offset: int, kept: bytes, size: int,
+               lines: int) -> tuple[int, bytes, bytes]:
+    """Read the bytes between offset and size that can reach the last N lines.
+
+    Returns (offset, kept, chunk) for the caller to join. When whole lines
+    before the end were skipped, offset moves past them and kept is dropped.
+    """
+    window = LOG_TAIL_WINDOW
+    while size - window > offset:
+        # Read one byte early so a line cut by the window start can be dropped
+        start = size - window
+        parts = os.pread(fd, window + 1, start - 1).splitlines(keepends=True)[1:]
+        if len(parts) >= lines:
+            chunk = b"".join(parts)
+            return size - len(chunk), b"", chunk
+        window *= 4
+    return offset, kept, os.pread(fd, size - offset, offset) if size > offset else b""
+
+
+def _copy_worker(worker: Optional[Worker]) -> Optional[Worker]:
+    """Copy a worker so callers can't mutate the cycle snapshot in place."""
+    if worker is None:
+        return None
+    return dataclasses.replace(worker, commits=list(worker.commits))
 
 
 class StateManager:
-    """Manages all state files for an orchestrator run."""
+    """Manages all state files for an orchestrator run.
+
+    The per-worker reads the snapshot pool runs concurrently (load_worker,
+    read_signal, get_log_stats, tail_log) only touch that worker's files and
+    cache entries, so they are safe from threads as long as each worker id
+    is handled by one thread at a time. Everything else, including
+    save_worker and begin_cycle/end_cycle, belongs to the monitor thread.
+    """
 
     def __init__(self, cfg: RunConfig):
         self.cfg = cfg
@@ -33,6 +103,19 @@ class StateManager:
         self.workers_dir = self.state_dir / "workers"
         self.event_log_path = self.state_dir / "orchestrator-log.jsonl"
         self.issue_cache_dir = self.state_dir / "issue-cache"
+        # worker_id -> (bytes read so far, lines kept, kept tail bytes,
+        #               caller's (size, mtime) at that read, rendered tail)
+        self._log_tails: dict[int, tuple[int, int, bytes, Optional[tuple], str]] = {}
+        # Event lines awaiting flush_events(); None means write immediately
+        self._pending_events: Optional[list[bytes]] = None
+        self._event_dir_ready = False
+        # Workers read or saved since begin_cycle(); None means no cycle open
+        self._cycle_workers: Optional[dict[int, Optional[Worker]]] = None
+        self._dirty_workers: set[int] = set()
+        # (name pattern, worker_id) -> path under /tmp, see _tmp_path()
+        self._tmp_paths: dict[tuple[str, int], Path] = {}
+        # worker_id -> (prompt bytes, file (size, mtime_ns)) of the last write
+        self._prompt_writes: dict[int, tuple[bytes, tuple[int, int]]] = {}
 
     def ensure_dirs(self) -> None:
         """Create all state directories."""
@@ -45,20 +128,53 @@ class StateManager:
         return self.workers_dir / f"worker-{worker_id}.json"
 
     def load_worker(self, worker_id: int) -> Optional[Worker]:
-        """Load worker state from disk."""
+        """Load worker state from disk (or from the open cycle's snapshot)."""
+        if self._cycle_workers is not None:
+            if worker_id not in self._cycle_workers:
+                self._cycle_workers[worker_id] = self._read_worker(worker_id)
+            return _copy_worker(self._cycle_workers[worker_id])
+        return self._read_worker(worker_id)
+
+    def _read_worker(self, worker_id: int) -> Optional[Worker]:
         path = self.worker_path(worker_id)
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text())
+            data = read_json(path)
             return Worker.from_dict(data)
         except (json.JSONDecodeError, KeyError):
             return None
 
     def save_worker(self, worker: Worker) -> None:
-        """Save worker state atomically."""
+        """Save worker state atomically.
+
+        While a cycle is open the write is held until end_cycle(), so a
+        worker saved several times in one cycle is written once.
+        """
+        if self._cycle_workers is not None:
+            self._cycle_workers[worker.worker_id] = _copy_worker(worker)
+            self._dirty_workers.add(worker.worker_id)
+            return
         atomic_write(self.worker_path(worker.worker_id), worker.to_dict())
 
+    def begin_cycle(self) -> None:
+        """Serve load_worker() from memory until end_cycle().
+
+        Each worker file is read at most once per cycle; later loads get a
+        copy of that read or of the last save_worker() in the cycle.
+        """
+        if self._cycle_workers is None:
+            self._cycle_workers = {}
+
+    def end_cycle(self) -> None:
+        """Write the workers saved during the cycle and drop the snapshot."""
+        workers, self._cycle_workers = self._cycle_workers, None
+        if workers is None:
+            return
+        for worker_id in sorted(self._dirty_workers):
+            atomic_write(self.worker_path(worker_id), workers[worker_id].to_dict())
+        self._dirty_workers.clear()
+
     def init_worker(self, worker_id: int, issue_number: int,
                     branch: str, worktree: str) -> Worker:
         """Initialize a new worker state file."""
@@ -90,8 +206,7 @@ class StateManager:
         if not config_path:
             return
 
-        with open(config_path) as f:
-            raw = json.load(f)
+        raw = read_json(config_path)
 
         for issue_data in raw.get("issues", []):
             if issue_data["number"] == issue_number:
@@ -103,12 +218,11 @@ class StateManager:
         atomic_write(config_path, raw)
 
         # Also update in-memory config
-        for issue in self.cfg.issues:
-            if issue.number == issue_number:
-                issue.status = status
-                if assigned_worker is not None:
-                    issue.assigned_worker = assigned_worker
-                break
+        issue = self.cfg.get_issue(issue_number)
+        if issue is not None:
+            self.cfg.set_issue_status(issue, status)
+            if assigned_worker is not None:
+                issue.assigned_worker = assigned_worker
 
     def update_issue_stage(self, issue_number: int, pipeline_stage: int) -> None:
         """Update an issue's pipeline_stage in the config file and in-memory."""
@@ -116,8 +230,7 @@ class StateManager:
         if not config_path:
             return
 
-        with open(config_path) as f:
-            raw = json.load(f)
+        raw = read_json(config_path)
 
         for issue_data in raw.get("issues", []):
             if issue_data["number"] == issue_number:
@@ -127,23 +240,45 @@ class StateManager:
         atomic_write(config_path, raw)
 
         # Also update in-memory config
-        for issue in self.cfg.issues:
-            if issue.number == issue_number:
-                issue.pipeline_stage = pipeline_stage
-                break
+        issue = self.cfg.get_issue(issue_number)
+        if issue is not None:
+            issue.pipeline_stage = pipeline_stage
 
     def get_completed_issues(self) -> set[int]:
         """Return set of completed issue numbers."""
-        return {i.number for i in self.cfg.issues if i.status == "completed"}
+        return self.cfg.issue_numbers_with_status("completed")
 
     # ── Event log ──────────────────────────────────────────────────────────
 
     def log_event(self, event: dict) -> None:
-        """Append an event to the orchestrator event log."""
-        self.event_log_path.parent.mkdir(parents=True, exist_ok=True)
-        entry = {"timestamp": now_iso(), "event": event}
-        with open(self.event_log_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        """Append an event to the orchestrator event log.
+
+        While events are deferred (see defer_events) the line is held until
+        the next flush_events() instead of being written right away.
+        """
+        line = _event_line({"timestamp": now_iso(), "event": event})
+        if self._pending_events is not None:
+            self._pending_events.append(line)
+            return
+        self._append_events(line)
+
+    def defer_events(self) -> None:
+        """Buffer log_event() lines until flush_events() is called."""
+        if self._pending_events is None:
+            self._pending_events = []
+
+    def flush_events(self) -> None:
+        """Write any buffered events to the event log in one append."""
+        if self._pending_events:
+            self._append_events(b"".join(self._pending_events))
+            self._pending_events.clear()
+
+    def _append_events(self, data: bytes) -> None:
+        if not self._event_dir_ready:
+            self.event_log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._event_dir_ready = True
+        with open(self.event_log_path, "ab") as f:
+            f.write(data)
 
     # ── Issue cache ────────────────────────────────────────────────────────
 
@@ -154,34 +289,78 @@ class StateManager:
             return cache_file.read_text()
         return None
 
-    def cache_issue(self, issue_number: int, body: str) -> None:
-        """Cache an issue body to disk."""
+    def cache_issue(self, issue_number: int, body: str,
+                    etag: Optional[str] = None) -> None:
+        """Cache an issue body to disk, with its HTTP ETag if known."""
         self.issue_cache_dir.mkdir(parents=True, exist_ok=True)
         cache_file = self.issue_cache_dir / f"issue-{issue_number}.md"
         cache_file.write_text(body)
+        meta_file = self.issue_cache_dir / f"issue-{issue_number}.meta.json"
+        if etag:
+            atomic_write(meta_file, {"etag": etag, "fetched_at": now_iso()})
+        else:
+            meta_file.unlink(missing_ok=True)
+
+    def get_cached_etag(self, issue_number: int) -> Optional[str]:
+        """Return the ETag the cached issue body was fetched with, if any."""
+        meta_file = self.issue_cache_dir / f"issue-{issue_number}.meta.json"
+        try:
+            return read_json(meta_file).get("etag")
+        except (OSError, ValueError, AttributeError):
+            return None
 
     # ── Signal files ───────────────────────────────────────────────────────
 
+    def _tmp_path(self, name: str, worker_id: int) -> Path:
+        """Return /tmp/{project}-{name} for a worker, built once per worker.
+
+        These are looked up several times per worker every cycle, and
+        building the Path costs more than the stat done with it.
+        """
+        key = (name, worker_id)
+        path = self._tmp_paths.get(key)
+        if path is None:
+            project = self.cfg.project or "default"
+            path = self._tmp_paths[key] = Path(f"/tmp/{project}-{name.format(worker_id)}")
+        return path
+
     def signal_path(self, worker_id: int) -> Path:
-        project = self.cfg.project or "default"
-        return Path(f"/tmp/{project}-signal-{worker_id}")
+        return self._tmp_path("signal-{}", worker_id)
 
     def log_path(self, worker_id: int) -> Path:
-        project = self.cfg.project or "default"
-        return Path(f"/tmp/{project}-worker-{worker_id}.log")
+        return self._tmp_path("worker-{}.log", worker_id)
 
     def prompt_path(self, worker_id: int) -> Path:
-        project = self.cfg.project or "default"
-        return Path(f"/tmp/{project}-worker-prompt-{worker_id}.md")
+        return self._tmp_path("worker-prompt-{}.md", worker_id)
+
+    def write_prompt(self, worker_id: int, prompt: str) -> Path:
+        """Write a worker's prompt file (UTF-8 regardless of locale).
+
+        The file is replaced atomically, so a launch never reads a
+        half-written prompt. Rewriting the prompt this StateManager last
+        wrote is skipped while the file's stat still matches that write.
+        """
+        path = self.prompt_path(worker_id)
+        data = prompt.encode("utf-8")
+        prev = self._prompt_writes.get(worker_id)
+        if prev is not None and prev[0] == data:
+            try:
+                st = os.stat(path)
+                if (st.st_size, st.st_mtime_ns) == prev[1]:
+                    return path
+            except OSError:
+                pass
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        st = os.stat(path)
+        self._prompt_writes[worker_id] = (data, (st.st_size, st.st_mtime_ns))
+        return path
 
     def read_signal(self, worker_id: int) -> Optional[int]:
         """Read exit code from signal file, or None if not present."""
-        path = self.signal_path(worker_id)
-        if not path.exists():
-            return None
         try:
-            text = path.read_text().strip()
-            return int(text)
+            return int(self.signal_path(worker_id).read_text().strip())
         except (ValueError, OSError):
             return None
 
@@ -195,11 +374,8 @@ class StateManager:
 
     def get_log_stats(self, worker_id: int) -> tuple[int, Optional[float]]:
         """Return (size_bytes, mtime_unix) for a worker's log file."""
-        path = self.log_path(worker_id)
-        if not path.exists():
-            return 0, None
         try:
-            st = path.stat()
+            st = self.log_path(worker_id).stat()
             return st.st_size, st.st_mtime
         except OSError:
             return 0, None
@@ -216,8 +392,49 @@ class StateManager:
         except OSError:
             return ""
 
+    def tail_log(self, worker_id: int, lines: int = 50,
+                 stat: Optional[tuple[int, Optional[float]]] = None) -> str:
+        """Return the last N lines of a worker's log, reading only new bytes.
+
+        Same result as get_log_tail(), but remembers where the previous call
+        stopped and reads from there. If the bytes just before that offset no
+        longer match what was kept (log truncated or rewritten), the file is
+        read again from the start. Either way only the end of the new bytes
+        is read, LOG_TAIL_WINDOW at a time, until it holds `lines` lines.
+
+        stat: the log's (size, mtime) from get_log_stats(). When it matches
+        the previous call's, that call's tail is returned without opening
+        the file.
+        """
+        prev = self._log_tails.get(worker_id)
+        if stat is not None and prev is not None and prev[3] == stat and prev[1] == lines:
+            return prev[4]
+        try:
+            fd = os.open(self.log_path(worker_id), os.O_RDONLY)
+        except OSError:
+            self._log_tails.pop(worker_id, None)
+            return ""
+        try:
+            size = os.fstat(fd).st_size
+            offset, kept = 0, b""
+            if prev is not None and prev[0] <= size and prev[1] >= lines:
+                guard = prev[2][-LOG_TAIL_GUARD:]
+                if os.pread(fd, len(guard), prev[0] - len(guard)) == guard:
+                    offset, kept = prev[0], prev[2]
+            offset, kept, chunk = _read_tail(fd, offset, kept, size, lines)
+        except OSError:
+            return ""
+        finally:
+            os.close(fd)
+
+        kept = b"".join((kept + chunk).splitlines(keepends=True)[-lines:])
+        text = "\n".join(kept.decode(errors="replace").splitlines())
+        self._log_tails[worker_id] = (offset + len(chunk), lines, kept, stat, text)
+        return text
+
     def truncate_log(self, worker_id: int) -> None:
         """Truncate a worker's log file."""
+        self._log_tails.pop(worker_id, None)
         path = self.log_path(worker_id)
         try:
             path.write_text("")
@@ -47,10 +47,20 @@ def new_window(session: str, name: str, working_dir: str = "") -> None:
     _run(cmd)
 
 
+def _command_keys(target: str, command: str) -> list[str]:
+    """tmux args that type `command` literally into `target` and press Enter."""
+    if command.endswith(";"):
+        command = command[:-1] + "\\;"  # a bare trailing ; would end the tmux command
+    return ["send-keys", "-t", target, "-l", command, ";", "send-keys", "-t", target, "Enter"]
+
+
 def send_command(session: str, window: str, command: str) -> None:
-    """Send a command to a tmux window via send-keys."""
-    target = f"{session}:{window}"
-    _run(["tmux", "send-keys", "-t", target, command, "Enter"])
+    """Type a command into a tmux window and press Enter.
+
+    The text goes in with send-keys -l so it's never parsed as key names,
+    and Enter follows in the same tmux invocation.
+    """
+    _run(["tmux", *_command_keys(f"{session}:{window}", command)])
 
 
 def send_ctrl_c(session: str, window: str) -> None:
@@ -62,6 +72,60 @@ def send_ctrl_c(session: str, window: str) -> None:
         pass
 
 
+class CommandBatch:
+    """Queue send_command/send_ctrl_c calls and run them as one tmux process.
+
+    flush() chains everything queued with tmux's ";" separator. tmux stops
+    a chain at the first command that fails (e.g. a missing window); flush()
+    then sends the rest one by one and reports what couldn't be delivered.
+    """
+
+    def __init__(self) -> None:
+        # (session, window, tmux args) per queued call
+        self._entries: list[tuple[str, str, list[str]]] = []
+
+    def send_command(self, session: str, window: str, command: str) -> None:
+        self._entries.append((session, window, _command_keys(f"{session}:{window}", command)))
+
+    def send_ctrl_c(self, session: str, window: str) -> None:
+        self._entries.append((session, window, ["send-keys", "-t", f"{session}:{window}", "C-c"]))
+
+    def flush(self) -> list[str]:
+        """Send everything queued so far in a single tmux invocation.
+
+        Returns the "session:window" targets whose keys were not delivered.
+        """
+        if not self._entries:
+            return []
+        entries, self._entries = self._entries, []
+        args: list[str] = []
+        for _, _, entry_args in entries:
+            if args:
+                args.append(";")
+            args.extend(entry_args)
+        try:
+            _run(["tmux", *args])
+            return []
+        except subprocess.CalledProcessError:
+            # Everything before the first missing window went through
+            windows = {session: list_pane_pids(session) or {} for session, _, _ in entries}
+            start = next((i for i, (session, window, _) in enumerate(entries)
+                          if window not in windows[session]), None)
+        except (subprocess.SubprocessError, OSError):
+            start = None
+        if start is None:
+            # How far the chain got is unknown; resending could launch twice
+            return [f"{session}:{window}" for session, window, _ in entries]
+
+        failed = []
+        for session, window, entry_args in entries[start:]:
+            try:
+                _run(["tmux", *entry_args])
+            except (subprocess.SubprocessError, OSError):
+                failed.append(f"{session}:{window}")
+        return failed
+
+
 def get_pane_pid(session: str, window: str) -> Optional[int]:
     """Get the PID of the shell process in a tmux pane."""
     target = f"{session}:{window}"
@@ -77,6 +141,29 @@ def get_pane_pid(session: str, window: str) -> Optional[int]:
     return None
 
 
+def list_pane_pids(session: str) -> Optional[dict[str, int]]:
+    """Map each window in a session to the PID of its first pane's shell.
+
+    One tmux call instead of a get_pane_pid per window. Returns None if
+    tmux couldn't be queried (e.g. the session doesn't exist).
+    """
+    try:
+        result = _run(
+            ["tmux", "list-panes", "-s", "-t", session, "-F", "#{window_name} #{pane_pid}"],
+            check=False,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0:
+        return None
+    pids: dict[str, int] = {}
+    for line in result.stdout.splitlines():
+        name, _, pid = line.rpartition(" ")
+        if name and pid.isdigit():
+            pids.setdefault(name, int(pid))
+    return pids
+
+
 def kill_session(session: str) -> bool:
     """Kill a tmux session. Returns True if it existed and was killed."""
     if not session_exists(session):
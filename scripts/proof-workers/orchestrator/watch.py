@@ -0,0 +1,118 @@
+"""Wake the monitor loop early when a worker writes its signal file.
+
+Uses Linux inotify through ctypes. Where that isn't available (non-Linux,
+no libc symbol, watch limit reached) SignalWatcher.wait() degrades to a
+plain sleep, which is the old fixed-interval behaviour.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# Reported by SignalWatcher.wait() when one of its exit_fds fires
+PROCESS_EXITED = "process-exited"
+
+
+def _load_libc():
+    """Return libc with the inotify calls bound, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+class SignalWatcher:
+    """Block until one of the given files is written, or a timeout passes."""
+
+    def __init__(self, paths: Iterable[Path]):
+        paths = list(paths)
+        self._names = {p.name for p in paths}
+        self._fd: Optional[int] = None
+        if _libc is None or not paths:
+            return
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        for directory in {p.parent for p in paths}:
+            if _libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+                os.close(fd)
+                return
+        self._fd = fd
+
+    @property
+    def active(self) -> bool:
+        """True if waits are event-driven rather than plain sleeps."""
+        return self._fd is not None
+
+    def wait(self, timeout: float, exit_fds: Iterable[int] = ()) -> set[str]:
+        """Sleep up to `timeout` seconds; return the watched file names written.
+
+        exit_fds: pidfds of processes to watch as well. One becoming readable
+        (its process exited) ends the wait with PROCESS_EXITED in the result.
+        Fds that are already readable on entry are ignored, so an exit the
+        caller hasn't consumed yet can't turn the wait into a busy loop.
+        """
+        exit_fds = list(exit_fds)
+        if exit_fds:
+            done, _, _ = select.select(exit_fds, [], [], 0)
+            exit_fds = [fd for fd in exit_fds if fd not in done]
+        if self._fd is None and not exit_fds:
+            time.sleep(timeout)
+            return set()
+
+        fds = exit_fds if self._fd is None else [self._fd, *exit_fds]
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            ready, _, _ = select.select(fds, [], [], remaining)
+            if not ready:
+                return set()
+            hits = set()
+            if self._fd in ready:
+                hits = {name for name in self._read_names() if name in self._names}
+            if any(fd in ready for fd in exit_fds):
+                hits.add(PROCESS_EXITED)
+            if hits:
+                return hits
+
+    def _read_names(self) -> list[str]:
+        """Drain pending events and return the file names they refer to."""
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            _, _, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            names.append(os.fsdecode(buf[offset:offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -41,9 +41,19 @@ class TestConfigLoading:
     def test_issue_dependencies_loaded(self, tmp_config):
         cfg = load_config(tmp_config)
         by_num = {i.number: i for i in cfg.issues}
-        assert by_num[8].depends_on == [1, 2]
-        assert by_num[40].depends_on == [37, 38, 39]
-        assert by_num[1].depends_on == []
+        assert by_num[8].depends_on == frozenset({1, 2})
+        assert by_num[40].depends_on == frozenset({37, 38, 39})
+        assert by_num[1].depends_on == frozenset()
+
+    def test_issue_dependencies_serialize_sorted(self, tmp_config):
+        cfg = load_config(tmp_config)
+        assert cfg.get_issue(40).to_dict()["depends_on"] == [37, 38, 39]
+
+    def test_issue_sort_key(self, tmp_config):
+        cfg = load_config(tmp_config)
+        issue = cfg.get_issue(22)
+        assert issue.sort_key == (issue.wave, issue.priority) == (5, 2)
+        assert "sort_key" not in issue.to_dict()
 
     def test_get_issue_by_number(self, tmp_config):
         cfg = load_config(tmp_config)
@@ -55,6 +65,22 @@ class TestConfigLoading:
         cfg = load_config(tmp_config)
         assert cfg.get_issue(9999) is None
 
+    def test_get_issue_sees_added_and_replaced_issues(self, tmp_config):
+        from orchestrator.models import Issue
+        cfg = load_config(tmp_config)
+        assert cfg.get_issue(9999) is None
+        cfg.issues.append(Issue(number=9999, title="late"))
+        assert cfg.get_issue(9999).title == "late"
+        cfg.issues = [Issue(number=1, title="replaced")]
+        assert cfg.get_issue(1).title == "replaced"
+        assert cfg.get_issue(9999) is None
+
+    def test_next_stage_name(self, tmp_config):
+        cfg = load_config(tmp_config)
+        cfg.pipeline = ["implement", "document"]
+        assert cfg.next_stage_name(0) == "document"
+        assert cfg.next_stage_name(1) is None
+
     def test_missing_config_file_exits(self, tmp_path):
         with pytest.raises(SystemExit):
             load_config(tmp_path / "nonexistent.json")
@@ -391,3 +391,119 @@ class TestCrashedWorkerWithCommits:
         decisions = compute_decision(snapshot, loaded_config, state_manager, set())
         actions = [d.action for d in decisions]
         assert "skip" in actions, f"Expected skip after max retries with no commits, got: {actions}"
+
+
+class TestLogHeuristics:
+    """Error/crash signal detection in log tails."""
+
+    def test_error_signal_detected(self):
+        from orchestrator.decisions import _log_has_errors
+        assert _log_has_errors("compiling...\nbuild failed\n")
+        assert not _log_has_errors("all good\n")
+
+    def test_crash_signal_means_no_meaningful_output(self):
+        from orchestrator.decisions import _has_meaningful_output
+        assert _has_meaningful_output("x" * 300)
+        assert not _has_meaningful_output("x" * 300 + "\nENOMEM\n")
+
+    def test_short_output_not_meaningful(self):
+        from orchestrator.decisions import _has_meaningful_output
+        assert not _has_meaningful_output("short")
+        assert not _has_meaningful_output("   \n")
+
+    def test_checks_see_whole_tail_not_just_last_4k(self, loaded_config, state_manager):
+        from orchestrator.models import LOG_TAIL_MAX_CHARS
+        tail = "[DEADMAN] EXIT worker=1 issue=#1 stage=implement code=0\n" + "x" * LOG_TAIL_MAX_CHARS
+        snapshot = make_snapshot(log_tail="  " + tail + "  ")
+        assert snapshot.log_tail_stripped_len == len(tail)
+        assert len(snapshot.log_tail_tail) == LOG_TAIL_MAX_CHARS
+
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="/tmp/wt/1")
+        snapshot = make_snapshot(log_tail=tail, elapsed_seconds=loaded_config.wall_clock_timeout + 60)
+        decisions = compute_decision(snapshot, loaded_config, state_manager, set())
+        assert [d.action for d in decisions] == ["noop"]
+        assert "DEADMAN" in decisions[0].reason
+
+
+class TestDecisionSkipCache:
+    """Unchanged snapshots reuse the previous noop decision."""
+
+    def test_unchanged_running_worker_not_recomputed(self, loaded_config, state_manager):
+        state_manager.save_worker(Worker(worker_id=1, issue_number=1, status="running"))
+        snapshot = make_snapshot(claude_running=True, signal_exists=False)
+        first = compute_decision(snapshot, loaded_config, state_manager, set())
+        assert [d.action for d in first] == ["noop"]
+
+        with patch("orchestrator.decisions._handle_running_worker") as mock_handle:
+            second = compute_decision(snapshot, loaded_config, state_manager, set())
+        mock_handle.assert_not_called()
+        assert second == first
+
+    def test_changed_snapshot_recomputed(self, loaded_config, state_manager):
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="/tmp/wt/1")
+        running = make_snapshot(claude_running=True, signal_exists=False)
+        compute_decision(running, loaded_config, state_manager, set())
+
+        finished = make_snapshot(claude_running=False, signal_exists=True, exit_code=0)
+        actions = [d.action for d in compute_decision(finished, loaded_config, state_manager, set())]
+        assert "noop" not in actions
+
+    def test_quiet_running_noop_held_until_next_timeout(self, loaded_config, state_manager):
+        import time
+        from orchestrator.decisions import LOG_ACTIVE_WINDOW
+        state_manager.save_worker(Worker(worker_id=1, issue_number=1, status="running"))
+        # Written 10s ago: the 2-minute log-activity window is the nearest clock
+        snapshot = make_snapshot(log_mtime=time.time() - 10)
+
+        def decide_at(mono):
+            with patch("orchestrator.decisions.time.monotonic", return_value=mono), \
+                 patch("orchestrator.decisions._handle_running_worker",
+                       return_value=[Decision(action="noop", worker=1)]) as mock_handle:
+                compute_decision(snapshot, loaded_config, state_manager, set())
+            return mock_handle.called
+
+        assert decide_at(1000.0)
+        assert not decide_at(1000.0 + 60)
+        assert decide_at(1000.0 + LOG_ACTIVE_WINDOW)
+
+    def test_idle_noop_keeps_short_ttl(self, loaded_config):
+        from orchestrator.decisions import DECISION_CACHE_TTL, _quiet_noop_ttl
+        idle = make_snapshot(status="idle", claude_running=False, issue_number=None)
+        assert _quiet_noop_ttl(idle, [loaded_config]) == DECISION_CACHE_TTL
+
+
+class TestGlobalIdleAssignments:
+
+    def test_idle_worker_uses_dispatcher_assignment(self, loaded_config, state_manager):
+        from orchestrator.decisions import compute_decision_global
+        issue = loaded_config.get_issue(21)
+        snap = make_snapshot(worker_id=4, issue_number=None, status="idle", claude_running=False)
+        with patch("orchestrator.decisions.next_available_issue_global") as mock_global:
+            ds = compute_decision_global(snap, [loaded_config], state_manager, set(),
+                                         idle_assignments={4: (loaded_config, issue)})
+        mock_global.assert_not_called()
+        assert [(d.action, d.new_issue) for d in ds] == [("reassign_cross", 21)]
+
+    def test_cached_idle_noop_does_not_hide_new_assignment(self, loaded_config, state_manager):
+        from orchestrator.decisions import compute_decision_global
+        snap = make_snapshot(worker_id=4, issue_number=None, status="idle", claude_running=False)
+        with patch("orchestrator.decisions.next_retriable_issue_global", return_value=None):
+            first = compute_decision_global(snap, [loaded_config], state_manager, set(),
+                                            idle_assignments={})
+            second = compute_decision_global(snap, [loaded_config], state_manager, set(),
+                                             idle_assignments={4: (loaded_config, loaded_config.get_issue(21))})
+        assert [d.action for d in first] == ["noop"]
+        assert [(d.action, d.new_issue) for d in second] == [("reassign_cross", 21)]
+
+
+class TestCrossProjectResolution:
+
+    def test_unloadable_source_config_falls_back(self, loaded_config, state_manager, tmp_path):
+        from orchestrator.decisions import _find_owning_config, _resolve_effective_config
+        w = state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="")
+        w.source_config = str(tmp_path / "gone.json")
+        state_manager.save_worker(w)
+
+        assert _resolve_effective_config(1, loaded_config, state_manager) == \
+            (loaded_config, state_manager, False)
+        assert _find_owning_config(1, [loaded_config], state_manager, 1) is loaded_config
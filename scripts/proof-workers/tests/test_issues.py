@@ -1,13 +1,21 @@
 """Tests for issue selection and dependency resolution."""
 
+import json
+import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from orchestrator.issues import (
+    FETCH_RETRIES,
+    FETCH_TIMEOUT,
+    _fetch_from_platform,
+    _remaining_indegree,
+    fetch_issue_bodies,
     next_available_issue,
     get_completed_count,
     get_pending_count,
@@ -17,6 +25,13 @@ from orchestrator.issues import (
 from orchestrator.models import Issue
 
 
+@pytest.fixture
+def fake_cli():
+    """Pretend gh/glab are installed, resolving to their bare names."""
+    with patch.dict("orchestrator.issues._CLI", {"github": "gh", "gitlab": "glab"}):
+        yield
+
+
 def make_issue(number, depends_on=None, status="pending", wave=1, priority=1):
     return Issue(
         number=number,
@@ -45,7 +60,7 @@ class TestNextAvailableIssue:
     def test_returns_dependent_after_completion(self, loaded_config):
         """Issue 6 depends on 1 - once 1 is completed, 6 is eligible."""
         by_num = {i.number: i for i in loaded_config.issues}
-        by_num[1].status = "completed"
+        loaded_config.set_issue_status(by_num[1], "completed")
         # All wave-1 no-dep issues gone, wave-2 dep-1 should be eligible
         completed = {1, 2, 3, 4, 5, 14, 21, 22, 23, 24, 26, 27, 28, 29, 31, 34, 36}
         issue = next_available_issue(loaded_config, completed=completed, in_progress=set())
@@ -76,7 +91,7 @@ class TestNextAvailableIssue:
         # Mark everything else complete/in_progress to isolate wave 5
         for i in loaded_config.issues:
             if i.wave < 5 and i.number not in (21, 22, 23):
-                i.status = "completed"
+                loaded_config.set_issue_status(i, "completed")
         completed = {i.number for i in loaded_config.issues if i.status == "completed"}
         issue = next_available_issue(loaded_config, completed=completed, in_progress=set())
         if issue and issue.wave == 5:
@@ -103,7 +118,7 @@ class TestNextAvailableIssue:
 
     def test_returns_none_when_all_completed(self, loaded_config):
         for i in loaded_config.issues:
-            i.status = "completed"
+            loaded_config.set_issue_status(i, "completed")
         issue = next_available_issue(loaded_config, completed={i.number for i in loaded_config.issues}, in_progress=set())
         assert issue is None
 
@@ -154,6 +169,126 @@ class TestNextAvailableIssue:
         assert len(issues_found) >= 1, "At least one fan-out child should be available"
 
 
+class TestDependencyTable:
+
+    def _cfg(self, issues):
+        from orchestrator.config import RunConfig
+        cfg = RunConfig()
+        cfg.issues = issues
+        return cfg
+
+    def test_completion_decrements_dependents(self):
+        cfg = self._cfg([make_issue(1), make_issue(2, depends_on=[1]),
+                         make_issue(3, depends_on=[1, 2])])
+        assert _remaining_indegree(cfg, set()) == {1: 0, 2: 1, 3: 2}
+        table = cfg._dep_table
+        assert _remaining_indegree(cfg, {1}) == {1: 0, 2: 0, 3: 1}
+        assert cfg._dep_table is table  # updated in place, not rebuilt
+
+    def test_rebuilds_when_issue_leaves_completed(self):
+        cfg = self._cfg([make_issue(1), make_issue(2, depends_on=[1])])
+        _remaining_indegree(cfg, {1})
+        assert _remaining_indegree(cfg, set()) == {1: 0, 2: 1}
+
+    def test_rebuilds_when_issue_list_changes(self):
+        cfg = self._cfg([make_issue(1)])
+        _remaining_indegree(cfg, set())
+        cfg.issues.append(make_issue(2, depends_on=[1]))
+        assert _remaining_indegree(cfg, set()) == {1: 0, 2: 1}
+
+    def test_next_available_follows_completions(self):
+        cfg = self._cfg([make_issue(1, status="completed"),
+                         make_issue(2, depends_on=[1], wave=2)])
+        assert next_available_issue(cfg, completed=set()) is None
+        assert next_available_issue(cfg, completed={1}).number == 2
+
+    def test_ready_heap_matches_full_scan(self):
+        import random
+        rng = random.Random(7)
+        issues = []
+        for n in range(1, 60):
+            deps = rng.sample(range(1, n), min(n - 1, rng.randint(0, 3)))
+            issues.append(make_issue(n, depends_on=deps, wave=rng.randint(1, 4),
+                                     priority=rng.randint(1, 3)))
+        cfg = self._cfg(issues)
+        completed: set[int] = set()
+        for _ in range(80):
+            in_progress = set(rng.sample(range(1, 60), 5))
+            expected = next(
+                (i for i in sorted(issues, key=lambda i: (i.wave, i.priority))
+                 if i.status == "pending" and i.number not in in_progress
+                 and all(d in completed for d in i.depends_on)),
+                None)
+            assert next_available_issue(cfg, completed, in_progress) is expected
+            if expected is not None:
+                cfg.set_issue_status(expected, "completed")
+                completed = completed | {expected.number}
+
+    def test_retry_prefers_most_direct_dependents(self):
+        from orchestrator.issues import next_retriable_issue_global
+        # 1 blocks one issue directly (three transitively); 4 blocks two directly
+        cfg = self._cfg([make_issue(1, status="failed"), make_issue(2, depends_on=[1]),
+                         make_issue(3, depends_on=[2]), make_issue(7, depends_on=[3]),
+                         make_issue(4, status="failed"), make_issue(5, depends_on=[4]),
+                         make_issue(6, depends_on=[4])])
+        _, issue = next_retriable_issue_global([cfg])
+        assert issue.number == 4
+        assert cfg._dep_table is not None  # scored from the cached table
+
+    def test_retry_skips_issues_claimed_from_same_config(self):
+        from orchestrator.issues import next_retriable_issue_global
+        cfg = self._cfg([make_issue(1, status="failed"), make_issue(2, depends_on=[1]),
+                         make_issue(4, status="failed")])
+        cfg.config_path = Path("/cfg/a.json")
+        _, issue = next_retriable_issue_global([cfg], {("/cfg/a.json", 1), ("/cfg/b.json", 4)})
+        assert issue.number == 4
+
+    def test_global_skips_configs_that_cannot_win(self):
+        from orchestrator import issues as issues_mod
+        early = self._cfg([make_issue(1, wave=1)])
+        late = self._cfg([make_issue(2, wave=7), make_issue(3, wave=1, depends_on=[2])])
+        with patch.object(issues_mod, "next_available_issue",
+                          wraps=issues_mod.next_available_issue) as spy:
+            cfg, issue = issues_mod.next_available_issue_global([early, late])
+        assert (cfg, issue.number) == (early, 1)
+        assert [c.args[0] for c in spy.call_args_list] == [early]
+
+    def test_assign_issues_matches_sequential_global_picks(self):
+        from orchestrator.issues import assign_issues, next_available_issue_global
+        from pathlib import Path
+
+        def build():
+            a = self._cfg([make_issue(1, wave=2), make_issue(2, wave=1, priority=2),
+                           make_issue(3, depends_on=[1])])
+            b = self._cfg([make_issue(1, wave=1), make_issue(5, wave=2),
+                           make_issue(6, wave=1, status="in_progress")])
+            a.config_path, b.config_path = Path("/cfg/a.json"), Path("/cfg/b.json")
+            return [a, b]
+
+        expected, claimed = [], set()
+        configs = build()
+        for worker_id in (1, 2, 3, 4, 5):
+            result = next_available_issue_global(configs, claimed)
+            if result is None:
+                break
+            cfg, issue = result
+            claimed.add((str(cfg.config_path), issue.number))
+            expected.append((worker_id, configs.index(cfg), issue.number))
+
+        configs = build()
+        claimed_batch: set = set()
+        got = [(w, configs.index(c), i.number)
+               for w, c, i in assign_issues(configs, [1, 2, 3, 4, 5], claimed_batch)]
+        assert got == expected == [(1, 1, 1), (2, 0, 2), (3, 0, 1), (4, 1, 5)]
+        assert claimed_batch == claimed
+
+    def test_assign_issues_without_idle_workers_scans_nothing(self, loaded_config):
+        from orchestrator import issues as issues_mod
+        with patch.object(issues_mod, "next_available_issue") as spy:
+            assert issues_mod.assign_issues([loaded_config], []) == []
+        spy.assert_not_called()
+
+
 class TestIssueCounts:
 
     def test_completed_count(self, loaded_config):
@@ -180,3 +315,340 @@ class TestIssueCounts:
         failed = get_failed_count(loaded_config)
         pending = get_pending_count(loaded_config)
         assert completed + failed + pending == len(loaded_config.issues)
+
+    def test_status_counts_single_pass(self, loaded_config):
+        from orchestrator.issues import status_counts
+        counts = status_counts(loaded_config)
+        assert counts["completed"] == 1
+        assert counts["failed"] == 1
+        assert counts["in_progress"] == 1
+        assert counts["pending"] == 37
+        assert counts["unknown"] == 0
+
+    def test_status_change_updates_counts_without_rescan(self, loaded_config, state_manager):
+        from orchestrator.issues import status_counts
+        before = status_counts(loaded_config)
+        index = loaded_config._status_index
+        state_manager.update_issue_status(1, "completed")
+        after = status_counts(loaded_config)
+        assert loaded_config._status_index is index
+        assert after["completed"] == before["completed"] + 1
+        assert after["pending"] == before["pending"] - 1
+        assert before["completed"] == 1  # callers get a copy, not the live tally
+        assert 1 in loaded_config.issue_numbers_with_status("completed")
+
+    def test_issues_with_status_keeps_config_order(self, loaded_config):
+        assert [i.number for i in loaded_config.issues_with_status("failed")] == [27]
+        loaded_config.set_issue_status(loaded_config.get_issue(1), "failed")
+        assert [i.number for i in loaded_config.issues_with_status("failed")] == [1, 27]
+
+    def test_status_change_leaves_other_configs_index(self, loaded_config):
+        from orchestrator.config import RunConfig
+        other = RunConfig()
+        other.issues = [make_issue(1), make_issue(2, status="failed")]
+        assert other.issue_numbers_with_status("failed") == {2}
+        other_index = other._status_index
+
+        loaded_config.set_issue_status(loaded_config.get_issue(1), "completed")
+        loaded_config.set_issue_status(loaded_config.get_issue(2), "failed")
+
+        assert other.issue_numbers_with_status("failed") == {2}
+        assert other._status_index is other_index
+        assert loaded_config.issue_numbers_with_status("failed") == {2, 27}
+
+    def test_replaced_issue_list_recounted(self, loaded_config):
+        from orchestrator.issues import status_counts
+        status_counts(loaded_config)
+        loaded_config.issues = [make_issue(1, status="failed")]
+        assert status_counts(loaded_config) == {"failed": 1}
+
+    def test_same_length_replacement_rebuilds_index(self, loaded_config):
+        loaded_config.issues = [make_issue(1)]
+        assert loaded_config.issue_numbers_with_status("pending") == {1}
+        loaded_config.issues = [make_issue(2)]
+        assert loaded_config.issue_numbers_with_status("pending") == {2}
+
+    def test_set_status_after_direct_assignment_rebuilds(self, loaded_config):
+        issue = loaded_config.get_issue(1)
+        loaded_config.issue_numbers_with_status("pending")
+        issue.status = "in_progress"  # bypasses the index
+        loaded_config.set_issue_status(issue, "completed")
+        assert 1 in loaded_config.issue_numbers_with_status("completed")
+        assert 1 not in loaded_config.issue_numbers_with_status("pending")
+
+
+@pytest.mark.usefixtures("fake_cli")
+class TestBatchedIssueFetch:
+
+    def test_github_batch_uses_single_call_and_caches(self, loaded_config, state_manager):
+        issues = [loaded_config.get_issue(1), loaded_config.get_issue(2)]
+        payload = {"data": {"repository": {
+            "i1": {"number": 1, "title": "A", "state": "OPEN", "body": "body one"},
+            "i2": {"number": 2, "title": "B", "state": "OPEN", "body": "body two"},
+        }}}
+        with patch("orchestrator.issues.git.get_remote_url",
+                   return_value="git@github.com:acme/widgets.git"), \
+             patch("orchestrator.issues.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(payload), stderr="")
+            bodies = fetch_issue_bodies(issues, loaded_config, state_manager)
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["gh", "api", "graphql"]
+        assert "owner=acme" in cmd and "name=widgets" in cmd
+        assert "body one" in bodies[1] and "body two" in bodies[2]
+        assert "body two" in state_manager.get_cached_issue(2)
+
+    def test_missing_from_batch_falls_back_to_single_fetch(self, loaded_config, state_manager):
+        issues = [loaded_config.get_issue(1), loaded_config.get_issue(2)]
+        payload = {"data": {"repository": {
+            "i1": {"number": 1, "title": "A", "state": "OPEN", "body": "body one"},
+            "i2": None,
+        }}}
+        with patch("orchestrator.issues.git.get_remote_url",
+                   return_value="https://github.com/acme/widgets"), \
+             patch("orchestrator.issues.http_client.available", return_value=False), \
+             patch("orchestrator.issues.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                MagicMock(returncode=1, stdout=json.dumps(payload), stderr=""),
+                MagicMock(returncode=0, stdout="single body", stderr=""),
+            ]
+            bodies = fetch_issue_bodies(issues, loaded_config, state_manager)
+
+        assert mock_run.call_count == 2
+        assert mock_run.call_args[0][0][:3] == ["gh", "issue", "view"]
+        assert bodies[2] == "single body"
+
+    def test_local_description_skips_fetch(self, loaded_config, state_manager):
+        issue = Issue(number=500, title="local", description="local body")
+        with patch("orchestrator.issues.subprocess.run") as mock_run:
+            bodies = fetch_issue_bodies([issue], loaded_config, state_manager)
+        mock_run.assert_not_called()
+        assert bodies == {500: "local body"}
+
+    def test_single_fetch_prefers_http_client(self, loaded_config, state_manager):
+        issue = loaded_config.get_issue(1)
+        with patch("orchestrator.issues.git.get_remote_url",
+                   return_value="git@github.com:acme/widgets.git"), \
+             patch("orchestrator.issues.http_client.available", return_value=True), \
+             patch("orchestrator.issues.http_client.get_issue",
+                   return_value={"title": "A", "state": "open", "body": "rest body"}) as mock_get, \
+             patch("orchestrator.issues.subprocess.run") as mock_run:
+            bodies = fetch_issue_bodies([issue], loaded_config, state_manager)
+
+        mock_get.assert_called_once_with("github", "github.com", "acme/widgets", 1)
+        mock_run.assert_not_called()
+        assert "rest body" in bodies[1]
+
+    def test_unbatchable_fetches_run_in_parallel(self, loaded_config, state_manager):
+        import threading
+        issues = [loaded_config.get_issue(n) for n in (1, 2, 3)]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_fetch(number, repo_path, platform):
+            barrier.wait()  # only passes if all three run concurrently
+            return f"body {number}"
+
+        with patch("orchestrator.issues._fetch_batch_from_platform", return_value={}), \
+             patch("orchestrator.issues._fetch_from_platform", side_effect=fake_fetch):
+            bodies = fetch_issue_bodies(issues, loaded_config, state_manager)
+
+        assert bodies == {1: "body 1", 2: "body 2", 3: "body 3"}
+        assert state_manager.get_cached_issue(3) == "body 3"
+
+
+class TestRevalidateCachedBodies:
+
+    def _patches(self, get_issue):
+        return (patch("orchestrator.issues.git.get_remote_url",
+                      return_value="https://github.com/acme/widgets.git"),
+                patch("orchestrator.issues.http_client.available", return_value=True),
+                patch("orchestrator.issues.http_client.get_issue", side_effect=get_issue))
+
+    def test_not_modified_keeps_cached_body(self, loaded_config, state_manager):
+        from orchestrator import http_client
+        state_manager.cache_issue(1, "old body", etag='"abc"')
+        remote, avail, get = self._patches(lambda *a, **kw: http_client.NOT_MODIFIED)
+        with remote, avail, get as mock_get:
+            bodies = fetch_issue_bodies([loaded_config.get_issue(1)], loaded_config,
+                                        state_manager, revalidate=True)
+        assert mock_get.call_args.kwargs["etag"] == '"abc"'
+        assert bodies == {1: "old body"}
+
+    def test_changed_issue_refreshes_cache_and_etag(self, loaded_config, state_manager):
+        state_manager.cache_issue(1, "old body")
+        new = {"title": "A", "state": "open", "body": "new body", "etag": '"v2"'}
+        remote, avail, get = self._patches(lambda *a, **kw: new)
+        with remote, avail, get:
+            bodies = fetch_issue_bodies([loaded_config.get_issue(1)], loaded_config,
+                                        state_manager, revalidate=True)
+        assert "new body" in bodies[1]
+        assert state_manager.get_cached_issue(1) == bodies[1]
+        assert state_manager.get_cached_etag(1) == '"v2"'
+
+    def test_cached_bodies_not_checked_by_default(self, loaded_config, state_manager):
+        state_manager.cache_issue(1, "old body")
+        with patch("orchestrator.issues.http_client.get_issue") as mock_get:
+            fetch_issue_bodies([loaded_config.get_issue(1)], loaded_config, state_manager)
+        mock_get.assert_not_called()
+
+
+class TestHttpClient:
+
+    def test_low_remaining_backs_off_without_sleeping(self):
+        from orchestrator import http_client
+        resp = MagicMock(status_code=200, headers={"X-RateLimit-Remaining": "3"})
+        resp.json.return_value = {"title": "A", "state": "open", "body": "b"}
+        session = MagicMock()
+        session.get.return_value = resp
+        with patch.object(http_client, "requests", MagicMock()), \
+             patch.object(http_client, "_token", return_value="t"), \
+             patch.object(http_client, "_get_session", return_value=session), \
+             patch.dict(http_client._backoff_until, clear=True), \
+             patch("orchestrator.http_client.time.sleep") as mock_sleep:
+            first = http_client.get_issue("github", "github.com", "acme/widgets", 1)
+            second = http_client.get_issue("github", "github.com", "acme/widgets", 2)
+
+        mock_sleep.assert_not_called()
+        assert first["body"] == "b"
+        assert second is None
+        assert session.get.call_count == 1
+
+    def test_token_read_once_across_threads(self):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from orchestrator import http_client
+
+        def slow_read(platform, host):
+            time.sleep(0.05)
+            return "t"
+
+        with patch.dict(http_client._tokens, clear=True), \
+             patch.object(http_client, "_read_cli_token", side_effect=slow_read) as mock_read, \
+             ThreadPoolExecutor(max_workers=4) as pool:
+            tokens = list(pool.map(lambda _: http_client._token("github", "github.com"), range(4)))
+
+        assert tokens == ["t"] * 4
+        mock_read.assert_called_once()
+
+
+@pytest.mark.usefixtures("fake_cli")
+class TestFetchRetries:
+    def _result(self, returncode, stdout="", stderr=""):
+        return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr=stderr)
+
+    def test_missing_cli_skips_subprocess(self):
+        with patch.dict("orchestrator.issues._CLI", {"github": None}), \
+             patch("orchestrator.issues.http_client.available", return_value=False), \
+             patch("orchestrator.issues.subprocess.run") as mock_run:
+            body = _fetch_from_platform(7, "/tmp", "github")
+
+        mock_run.assert_not_called()
+        assert "gh is not installed" in body
+
+    def test_timeout_is_retried(self):
+        timeout = subprocess.TimeoutExpired(["gh"], FETCH_TIMEOUT)
+        with patch("orchestrator.issues.http_client.available", return_value=False), \
+             patch("orchestrator.issues.time.sleep") as mock_sleep, \
+             patch("orchestrator.issues.subprocess.run",
+                   side_effect=[timeout, self._result(0, stdout="body")]) as mock_run:
+            body = _fetch_from_platform(7, "/tmp", "github")
+
+        assert body == "body"
+        assert mock_run.call_count == 2
+        assert mock_run.call_args.kwargs["timeout"] == FETCH_TIMEOUT
+        mock_sleep.assert_called_once()
+
+    def test_gives_up_after_retries(self):
+        with patch("orchestrator.issues.http_client.available", return_value=False), \
+             patch("orchestrator.issues.time.sleep"), \
+             patch("orchestrator.issues.subprocess.run",
+                   return_value=self._result(1, stderr="connection reset")) as mock_run:
+            body = _fetch_from_platform(7, "/tmp", "github")
+
+        assert mock_run.call_count == FETCH_RETRIES + 1
+        assert "connection reset" in body
+
+    def test_not_found_is_not_retried(self):
+        with patch("orchestrator.issues.http_client.available", return_value=False), \
+             patch("orchestrator.issues.time.sleep") as mock_sleep, \
+             patch("orchestrator.issues.subprocess.run",
+                   return_value=self._result(1, stderr="GraphQL: Could not resolve to an issue")) as mock_run:
+            body = _fetch_from_platform(7, "/tmp", "github")
+
+        assert mock_run.call_count == 1
+        mock_sleep.assert_not_called()
+        assert "Could not fetch issue #7" in body
+
+
+class TestCrossProject:
+
+    def _write(self, tmp_path, name, issues):
+        path = tmp_path / f"{name}-issues.json"
+        path.write_text(json.dumps({"project": name, "repo_path": str(tmp_path),
+                                    "issues": issues}))
+        return path
+
+    def test_skips_own_config_and_claimed(self, tmp_path):
+        from orchestrator.config import load_config
+        from orchestrator.issues import next_available_cross_project
+        own = self._write(tmp_path, "a", [{"number": 1, "title": "a1"}])
+        other = self._write(tmp_path, "b", [{"number": 1, "title": "b1", "priority": 1},
+                                            {"number": 2, "title": "b2", "priority": 2}])
+        cfg = load_config(own)
+
+        other_cfg, issue = next_available_cross_project(cfg, exclude_config=str(own))
+        assert other_cfg.config_path == other.resolve()
+        assert issue.number == 1
+
+        # Claims are matched by resolved path, so a relative spelling still counts
+        claim = (str(tmp_path / "." / other.name), 1)
+        _, issue = next_available_cross_project(cfg, exclude_config=str(own),
+                                                claimed_cross={claim})
+        assert issue.number == 2
+
+    def test_config_reparsed_only_when_file_changes(self, tmp_path):
+        import os
+        from orchestrator.issues import load_config_cached
+        path = self._write(tmp_path, "c", [{"number": 1, "title": "c1"}])
+        first = load_config_cached(path)
+        assert load_config_cached(path) is first
+
+        self._write(tmp_path, "c", [{"number": 1, "title": "c1", "status": "completed"}])
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+        reloaded = load_config_cached(path)
+        assert reloaded is not first
+        assert reloaded.issues[0].status == "completed"
+
+    def test_source_config_state_reused_until_file_changes(self, tmp_path):
+        import os
+        from orchestrator.issues import load_source_config
+        path = self._write(tmp_path, "s", [{"number": 1, "title": "s1"}])
+        cfg, state = load_source_config(str(path))
+        assert state.cfg is cfg
+        assert load_source_config(str(path)) == (cfg, state)
+
+        state.update_issue_status(1, "completed")
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+        cfg2, state2 = load_source_config(str(path))
+        assert cfg2 is not cfg and state2.cfg is cfg2
+        assert cfg2.issues[0].status == "completed"
+
+    def test_effective_config_falls_back_to_home(self, tmp_path):
+        from orchestrator.issues import effective_config, load_source_config
+        path = self._write(tmp_path, "s", [{"number": 1, "title": "s1"}])
+        home = (object(), object())
+        assert effective_config(str(path), *home) == load_source_config(str(path))
+        assert effective_config(None, *home) == home
+        assert effective_config(str(tmp_path / "gone-issues.json"), *home) == home
+
+    def test_config_listing_refreshes_when_directory_changes(self, tmp_path):
+        import os
+        from orchestrator.issues import _list_configs
+        a = self._write(tmp_path, "a", [])
+        assert _list_configs(tmp_path) == [(a, a.resolve())]
+        assert _list_configs(tmp_path) is _list_configs(tmp_path)
+
+        b = self._write(tmp_path, "b", [])
+        os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1))
+        assert [p for p, _ in _list_configs(tmp_path)] == [a, b]
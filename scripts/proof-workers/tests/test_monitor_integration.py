@@ -1,5 +1,6 @@
 """Integration tests for the monitor loop - tests full cycles without tmux/Claude."""
 
+import dataclasses
 import json
 import sys
 import time
@@ -11,7 +12,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from orchestrator.models import Worker, WorkerSnapshot
-from orchestrator.monitor import collect_worker_snapshot
+from orchestrator.monitor import collect_snapshots, collect_worker_snapshot
 from orchestrator.state import StateManager
 
 
@@ -34,6 +35,32 @@ class TestWorkerSnapshotCollection:
         assert snap.status == "idle"
         assert not snap.claude_running
 
+    def test_terminal_worker_skips_probes(self, loaded_config, state_manager):
+        state_manager.save_worker(Worker(worker_id=1, status="failed", issue_number=4, retry_count=2))
+
+        with patch("orchestrator.monitor.tmux") as mock_tmux, \
+             patch("orchestrator.monitor.git") as mock_git:
+            snap = collect_worker_snapshot(1, loaded_config, state_manager, "test-session")
+            again = collect_worker_snapshot(1, loaded_config, state_manager, "test-session")
+
+        assert mock_tmux.method_calls == []
+        assert mock_git.method_calls == []
+        assert (snap.status, snap.issue_number, snap.retry_count) == ("failed", 4, 2)
+        assert again is snap
+
+    def test_snapshot_carries_worker_stage(self, loaded_config, state_manager):
+        w = state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="")
+        w.status, w.stage = "running", "retry_explore"
+        state_manager.save_worker(w)
+
+        with patch("orchestrator.monitor.tmux") as mock_tmux, \
+             patch("orchestrator.monitor.git") as mock_git:
+            mock_tmux.get_pane_pid.return_value = None
+            mock_git.is_claude_running.return_value = True
+            snap = collect_worker_snapshot(1, loaded_config, state_manager, "test-session")
+
+        assert snap.stage == "retry_explore"
+
     def test_snapshot_detects_signal_file(self, loaded_config, state_manager, tmp_path):
         state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="/tmp/wt/1")
         sig = state_manager.signal_path(1)
@@ -69,6 +96,567 @@ class TestWorkerSnapshotCollection:
 
         assert "[DEADMAN]" in snap.log_tail
 
+    def test_snapshot_uses_cycle_pane_pid_map(self, loaded_config, state_manager):
+        state_manager.init_worker(2, issue_number=1, branch="fix/issue-1", worktree="/tmp/wt/1")
+
+        with patch("orchestrator.monitor.tmux") as mock_tmux, \
+             patch("orchestrator.monitor.git") as mock_git:
+            mock_git.is_claude_running.return_value = True
+            mock_git.get_status.return_value = ""
+            mock_git.get_recent_commits.return_value = ""
+
+            snap = collect_worker_snapshot(2, loaded_config, state_manager, "test-session",
+                                           pane_pids={"worker-1": 111, "worker-2": 222})
+
+        mock_tmux.get_pane_pid.assert_not_called()
+        mock_git.is_claude_running.assert_called_once_with(222, None)
+        assert snap.claude_running
+
+    def test_list_pane_pids_parses_one_tmux_call(self):
+        import subprocess
+        from orchestrator import tmux
+        out = "orchestrator 100\nworker-1 201\nworker-1 202\nmy window 300\n"
+        with patch("orchestrator.tmux._run",
+                   return_value=subprocess.CompletedProcess([], 0, stdout=out)) as mock_run:
+            pids = tmux.list_pane_pids("sess")
+        mock_run.assert_called_once()
+        assert pids == {"orchestrator": 100, "worker-1": 201, "my window": 300}
+
+        with patch("orchestrator.tmux._run",
+                   return_value=subprocess.CompletedProcess([], 1, stdout="")):
+            assert tmux.list_pane_pids("missing") is None
+
+
+class TestPollingTiers:
+
+    def _collect(self, cfg, state, cycle, cache):
+        with patch("orchestrator.monitor.collect_worker_snapshot",
+                   side_effect=collect_worker_snapshot) as spy, \
+             patch("orchestrator.monitor.tmux"), \
+             patch("orchestrator.monitor.git") as mock_git:
+            mock_git.is_claude_running.return_value = False
+            mock_git.get_status.return_value = ""
+            mock_git.get_recent_commits.return_value = ""
+            snaps = collect_snapshots(range(1, 3), cfg, state, cycle, cache)
+        return snaps, [c.args[0] for c in spy.call_args_list]
+
+    def test_running_polled_every_cycle_idle_reused(self, loaded_config, state_manager):
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="")
+        state_manager.save_worker(Worker(worker_id=2, status="idle", issue_number=None))
+        cache = {}
+
+        _, polled = self._collect(loaded_config, state_manager, 1, cache)
+        assert polled == [1, 2]
+        snaps, polled = self._collect(loaded_config, state_manager, 2, cache)
+        assert polled == [1]
+        assert snaps[1] is cache[2]
+        _, polled = self._collect(loaded_config, state_manager, 60, cache)
+        assert polled == [1, 2]
+
+    def test_pool_collects_in_worker_order(self, loaded_config, state_manager):
+        from concurrent.futures import ThreadPoolExecutor
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="")
+        state_manager.init_worker(2, issue_number=2, branch="fix/issue-2", worktree="")
+
+        with ThreadPoolExecutor(max_workers=2) as pool, \
+             patch("orchestrator.monitor.tmux"), \
+             patch("orchestrator.monitor.git") as mock_git:
+            mock_git.is_claude_running.return_value = True
+            snaps = collect_snapshots(range(1, 3), loaded_config, state_manager, 1, {}, pool=pool)
+
+        assert [s.worker_id for s in snaps] == [1, 2]
+        assert [s.issue_number for s in snaps] == [1, 2]
+
+    def test_pool_reads_each_worker_once_per_cycle(self, loaded_config, state_manager):
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        for i in (1, 2, 3):
+            state_manager.init_worker(i, issue_number=i, branch=f"fix/issue-{i}", worktree="")
+
+        state_manager.begin_cycle()
+        with ThreadPoolExecutor(max_workers=3) as pool, \
+             patch("orchestrator.state.read_json",
+                   side_effect=lambda p: json.loads(p.read_text())) as mock_read, \
+             patch("orchestrator.monitor.tmux"), \
+             patch("orchestrator.monitor.git") as mock_git:
+            mock_git.is_claude_running.return_value = True
+            snaps = collect_snapshots(range(1, 4), loaded_config, state_manager, 1, {}, pool=pool)
+        state_manager.end_cycle()
+
+        assert [s.issue_number for s in snaps] == [1, 2, 3]
+        assert sorted(c.args[0].name for c in mock_read.call_args_list) == [
+            "worker-1.json", "worker-2.json", "worker-3.json",
+        ]
+
+    def test_status_change_forces_fresh_snapshot(self, loaded_config, state_manager):
+        state_manager.save_worker(Worker(worker_id=1, status="idle", issue_number=None))
+        state_manager.save_worker(Worker(worker_id=2, status="failed", issue_number=3))
+        cache = {}
+        self._collect(loaded_config, state_manager, 1, cache)
+
+        state_manager.init_worker(1, issue_number=2, branch="fix/issue-2", worktree="")
+        snaps, polled = self._collect(loaded_config, state_manager, 2, cache)
+        assert polled == [1]
+        assert snaps[0].status == "pending"
+        assert snaps[0].issue_number == 2
+
+
+class TestGitSnapshotCache:
+
+    @pytest.fixture
+    def worktree(self, tmp_path):
+        import subprocess
+        repo = tmp_path / "repo"
+        def run(*args, cwd=repo):
+            subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                           cwd=cwd, check=True, capture_output=True)
+        repo.mkdir()
+        run("init", "-q", "-b", "main")
+        (repo / "a.txt").write_text("a\n")
+        run("add", "a.txt")
+        run("commit", "-q", "-m", "base")
+        run("update-ref", "refs/remotes/origin/main", "HEAD")
+        wt = tmp_path / "wt"
+        run("worktree", "add", "-q", "-b", "fix/issue-1", str(wt))
+        return wt, run
+
+    def test_rev_parse_reads_linked_worktree_refs(self, worktree):
+        import subprocess
+        from orchestrator import git
+        wt, run = worktree
+        (wt / "b.txt").write_text("b\n")
+        run("add", "b.txt", cwd=wt)
+        run("commit", "-q", "-m", "work", cwd=wt)
+        run("pack-refs", "--all")
+
+        expected = subprocess.run(["git", "rev-parse", "HEAD", "origin/main"], cwd=wt,
+                                  capture_output=True, text=True).stdout.split()
+        assert git.rev_parse(str(wt)) == expected[0]
+        assert git.rev_parse(str(wt), "origin/main") == expected[1]
+        assert git.rev_parse(str(wt), "no/such/ref") is None
+
+    def test_unchanged_worktree_skips_git_log(self, worktree, loaded_config, state_manager):
+        from orchestrator import git
+        wt, run = worktree
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree=str(wt))
+
+        with patch("orchestrator.monitor.tmux"), \
+             patch("orchestrator.git.get_recent_commits",
+                   wraps=git.get_recent_commits) as spy:
+            first = collect_worker_snapshot(1, loaded_config, state_manager)
+            second = collect_worker_snapshot(1, loaded_config, state_manager)
+            assert first.new_commits == second.new_commits == ""
+            assert spy.call_count == 1
+
+            (wt / "b.txt").write_text("b\n")
+            run("add", "b.txt", cwd=wt)
+            run("commit", "-q", "-m", "work", cwd=wt)
+            after = collect_worker_snapshot(1, loaded_config, state_manager)
+            assert "work" in after.new_commits
+
+        assert spy.call_count == 2
+
+    def test_running_worker_defers_log_and_git_reads(self, worktree, loaded_config, state_manager):
+        wt, _ = worktree
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree=str(wt))
+
+        with patch("orchestrator.monitor.tmux"), \
+             patch("orchestrator.monitor.git.is_claude_running", return_value=True), \
+             patch("orchestrator.git.get_recent_commits", return_value="") as commits, \
+             patch.object(state_manager, "tail_log", return_value="working") as tail:
+            snap = collect_worker_snapshot(1, loaded_config, state_manager)
+            assert tail.call_count == 0 and commits.call_count == 0
+
+            assert snap.log_tail == "working"
+            assert snap.new_commits == ""
+            assert snap.new_commits == ""
+            assert tail.call_count == 1 and commits.call_count == 1
+
+    def test_deleted_file_refreshes_git_status(self, worktree, loaded_config, state_manager):
+        import os
+        wt, _ = worktree
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree=str(wt))
+        tracked = next(p for p in wt.iterdir() if p.is_file() and p.name != ".git")
+        # The file is too old to count; only the directory's mtime can move
+        os.utime(tracked, (time.time() - 7200,) * 2)
+        os.utime(wt, (time.time() - 60,) * 2)
+
+        with patch("orchestrator.monitor.tmux"):
+            first = collect_worker_snapshot(1, loaded_config, state_manager)
+            tracked.unlink()
+            after = collect_worker_snapshot(1, loaded_config, state_manager, prev=first)
+
+        assert first.git_status == ""
+        assert after.git_status == f"D {tracked.name}"
+
+    def test_edit_below_scan_depth_refreshes_git_status(self, worktree, loaded_config, state_manager):
+        wt, run = worktree
+        deep = wt / "pkg" / "a" / "b" / "c" / "d"
+        deep.mkdir(parents=True)
+        (deep / "f.txt").write_text("f\n")
+        run("add", ".", cwd=wt)
+        run("commit", "-q", "-m", "deep", cwd=wt)
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree=str(wt))
+
+        with patch("orchestrator.monitor.tmux"):
+            first = collect_worker_snapshot(1, loaded_config, state_manager)
+            (deep / "f.txt").write_text("changed\n")
+            after = collect_worker_snapshot(1, loaded_config, state_manager, prev=first)
+
+        assert after.worktree_mtime == first.worktree_mtime
+        assert first.git_status == ""
+        assert after.git_status == "M pkg/a/b/c/d/f.txt"
+
+    def test_quiet_worker_reuses_previous_snapshot(self, worktree, loaded_config, state_manager):
+        wt, run = worktree
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree=str(wt))
+        state_manager.clear_signal(1)
+        state_manager.log_path(1).unlink(missing_ok=True)
+        try:
+            with patch("orchestrator.monitor.tmux"):
+                first = collect_worker_snapshot(1, loaded_config, state_manager)
+                with patch.object(state_manager, "tail_log") as mock_tail, \
+                     patch("orchestrator.monitor.git.is_claude_running", return_value=True):
+                    again = collect_worker_snapshot(1, loaded_config, state_manager, prev=first)
+                mock_tail.assert_not_called()
+                assert again.claude_running and not first.claude_running
+                assert again.git_stamp == first.git_stamp
+
+                self._append_log(state_manager, "progress\n")
+                grown = collect_worker_snapshot(1, loaded_config, state_manager, prev=again)
+            assert grown.log_tail == "progress"
+        finally:
+            state_manager.log_path(1).unlink(missing_ok=True)
+
+    def _append_log(self, state, text):
+        with open(state.log_path(1), "a") as f:
+            f.write(text)
+
+
+class TestClaudeRunningCheck:
+
+    def test_pidfd_replaces_pgrep_until_exit(self):
+        import os
+        import subprocess
+        from orchestrator import git
+        if not hasattr(os, "pidfd_open"):
+            pytest.skip("pidfd_open not available")
+        child = subprocess.Popen(["sh", "-c", "sleep 30; true claude"])
+        try:
+            time.sleep(0.1)
+            assert git.is_claude_running(os.getpid())
+            with patch("orchestrator.git.subprocess.run") as mock_run:
+                assert git.is_claude_running(os.getpid())
+            mock_run.assert_not_called()
+
+            child.kill()
+            child.wait()
+            assert not git.is_claude_running(os.getpid())
+            assert os.getpid() not in git._claude_pidfds
+        finally:
+            child.kill()
+            child.wait()
+
+    def test_pidfd_of_vanished_pane_is_closed(self):
+        import os
+        import subprocess
+        from orchestrator import git
+        if not hasattr(os, "pidfd_open"):
+            pytest.skip("pidfd_open not available")
+        child = subprocess.Popen(["sh", "-c", "sleep 30; true claude"])
+        try:
+            time.sleep(0.1)
+            me = os.getpid()
+            assert git.is_claude_running(me)
+            fd = git._claude_pidfds[me][1]
+
+            git.prune_claude_pidfds([me])
+            assert fd in git.claude_exit_fds()
+            git.prune_claude_pidfds([])
+            assert me not in git._claude_pidfds
+            with pytest.raises(OSError):
+                os.fstat(fd)
+        finally:
+            child.kill()
+            child.wait()
+
+    def test_batched_lookup_matches_pgrep(self):
+        import os
+        import subprocess
+        from orchestrator import git
+        child = subprocess.Popen(["sh", "-c", "sleep 30; true claude"])
+        try:
+            time.sleep(0.1)
+            me = os.getpid()
+            assert me not in git._claude_pidfds
+            children = git.find_claude_children([me, child.pid])
+            assert children == {me: child.pid}
+            with patch("orchestrator.git._find_claude") as mock_find:
+                assert git.is_claude_running(child.pid, children) is False
+            mock_find.assert_not_called()
+        finally:
+            child.kill()
+            child.wait()
+
+
+class TestReassignExecution:
+
+    def test_reassign_saves_worker_once_with_stage(self, loaded_config, state_manager):
+        from orchestrator.models import Decision
+        from orchestrator.monitor import execute_decision
+        state_manager.save_worker(Worker(worker_id=1, status="idle"))
+        issue = next(i for i in loaded_config.issues if i.status == "pending")
+
+        with patch("orchestrator.monitor.git"), \
+             patch("orchestrator.monitor.tmux"), \
+             patch("orchestrator.monitor.generate_prompt", return_value="prompt"), \
+             patch.object(state_manager, "save_worker", wraps=state_manager.save_worker) as spy:
+            execute_decision(Decision(action="reassign", worker=1, new_issue=issue.number,
+                                      reason="test"), loaded_config, state_manager)
+
+        spy.assert_called_once()
+        worker = state_manager.load_worker(1)
+        assert (worker.status, worker.issue_number) == ("running", issue.number)
+        assert worker.stage == loaded_config.pipeline[issue.pipeline_stage]
+        state_manager.prompt_path(1).unlink(missing_ok=True)
+
+
+class TestActionDispatch:
+
+    def test_every_action_has_a_handler(self):
+        import inspect
+        from orchestrator.models import Decision
+        from orchestrator.monitor import _ACTIONS
+        # The action field's comment lists every action decisions can emit
+        source = inspect.getsource(Decision)
+        comment = source.split("action: str  # ", 1)[1].splitlines()[0]
+        assert {a.strip() for a in comment.split("|")} == set(_ACTIONS)
+
+    def test_unknown_action_is_logged_and_ignored(self, loaded_config, state_manager, capsys):
+        from orchestrator.models import Decision
+        from orchestrator.monitor import execute_decision
+        execute_decision(Decision(action="bogus", worker=1), loaded_config, state_manager)
+        assert "Unknown action 'bogus' for worker 1" in capsys.readouterr().out
+
+    def test_handler_runs_on_its_own(self, loaded_config, state_manager):
+        from orchestrator.models import Decision
+        from orchestrator.monitor import _do_idle
+        state_manager.save_worker(Worker(worker_id=1, status="running", issue_number=3, stage="implement"))
+        _do_idle(Decision(action="idle", worker=1), loaded_config, state_manager)
+        worker = state_manager.load_worker(1)
+        assert (worker.status, worker.issue_number, worker.stage) == ("idle", None, "")
+
+
+class TestLogOutput:
+
+    def test_stamp_formatted_once_per_second_and_not_flushed(self, capsys):
+        from orchestrator import monitor
+        with patch("orchestrator.monitor.time.time", return_value=1_700_000_000.5), \
+             patch("orchestrator.monitor.time.strftime", wraps=time.strftime) as spy, \
+             patch("orchestrator.monitor.sys.stdout.flush") as mock_flush:
+            monitor.log_msg("one")
+            monitor.log_msg("two")
+        assert spy.call_count == 1
+        mock_flush.assert_not_called()
+        stamp = time.strftime("%H:%M:%S", time.localtime(1_700_000_000))
+        assert capsys.readouterr().out == f"[{stamp}] one\n[{stamp}] two\n"
+
+    def test_line_buffered_stdout_written_once_per_flush(self):
+        import io
+        from orchestrator import monitor
+        raw = io.BytesIO()
+        tty_like = io.TextIOWrapper(raw, encoding="utf-8", line_buffering=True)
+        with patch.object(monitor.sys, "stdout", tty_like):
+            monitor._buffer_stdout()
+            monitor.log_msg("one")
+            monitor.log_msg("two")
+            assert raw.getvalue() == b""
+            tty_like.flush()
+        assert raw.getvalue().count(b"\n") == 2
+
+    def test_wait_reports_event_wakeups(self, capsys):
+        from orchestrator import monitor
+        watcher = MagicMock()
+        with patch("orchestrator.monitor.git.claude_exit_fds", return_value=[]):
+            watcher.wait.return_value = {"proj-signal-2"}
+            assert monitor._wait_for_next_cycle(watcher, 30) is True
+            watcher.wait.return_value = set()
+            assert monitor._wait_for_next_cycle(watcher, 30) is False
+        monitor._log_wakeups(3, 1)
+        out = capsys.readouterr().out
+        assert "Woken early by proj-signal-2" in out
+        assert "Cycles: 3 (1 woken by worker events, 1 by timeout)" in out
+
+    def test_quiet_cycles_back_off_and_actions_reset(self):
+        from orchestrator.monitor import QUIET_INTERVAL_MAX, _next_sleep
+        sleeps = [30]
+        for _ in range(4):
+            sleeps.append(_next_sleep(sleeps[-1], 30, busy=False))
+        assert sleeps == [30, 60, QUIET_INTERVAL_MAX, QUIET_INTERVAL_MAX, QUIET_INTERVAL_MAX]
+        assert _next_sleep(QUIET_INTERVAL_MAX, 30, busy=True) == 30
+        assert _next_sleep(300, 300, busy=False) == 300  # never below the configured interval
+
+    def test_warm_up_waits_on_signal_watcher(self, loaded_config, state_manager):
+        from orchestrator import monitor
+        with patch.object(monitor, "_wait_for_next_cycle", return_value=True) as mock_wait, \
+             patch.object(monitor.time, "sleep") as mock_sleep, \
+             patch.object(monitor, "collect_snapshots", side_effect=KeyboardInterrupt), \
+             patch("orchestrator.monitor.tmux"):
+            with pytest.raises(KeyboardInterrupt):
+                monitor.run_monitor_loop(loaded_config, state_manager)
+        watcher, timeout = mock_wait.call_args.args
+        assert isinstance(watcher, monitor.SignalWatcher)
+        assert timeout == monitor.WARMUP_SECONDS
+        mock_sleep.assert_not_called()
+
+    def test_global_loop_picks_up_reloaded_cycle_interval(self, loaded_config, state_manager, capsys):
+        import dataclasses
+        from orchestrator import monitor
+        reloaded = dataclasses.replace(loaded_config, cycle_interval=loaded_config.cycle_interval + 7)
+        with patch.object(monitor, "load_config_cached", return_value=reloaded), \
+             patch.object(monitor, "collect_snapshots", side_effect=KeyboardInterrupt), \
+             patch("orchestrator.monitor.tmux"):
+            with pytest.raises(KeyboardInterrupt):
+                monitor.run_monitor_loop_global([loaded_config], state_manager, 2, "sess",
+                                                no_delay=True)
+        out = capsys.readouterr().out
+        assert (f"Cycle interval changed: {loaded_config.cycle_interval}s -> "
+                f"{reloaded.cycle_interval}s") in out
+
+    def test_global_loop_keeps_config_that_fails_to_reload(self, loaded_config, state_manager, capsys):
+        import json
+        from orchestrator import monitor
+        err = json.JSONDecodeError("Expecting value", "", 0)
+        with patch.object(monitor, "load_config_cached", side_effect=err), \
+             patch.object(monitor, "collect_snapshots", side_effect=KeyboardInterrupt) as mock_collect, \
+             patch("orchestrator.monitor.tmux"):
+            with pytest.raises(KeyboardInterrupt):
+                monitor.run_monitor_loop_global([loaded_config], state_manager, 2, "sess",
+                                                no_delay=True)
+        assert mock_collect.call_args.args[1] is loaded_config
+        assert f"WARNING: Keeping previous config for {loaded_config.config_path}" in capsys.readouterr().out
+
+    def test_global_loop_sends_retry_launches_before_snapshots(self, loaded_config, state_manager):
+        from orchestrator import monitor
+        events = []
+
+        def collect(*args, **kwargs):
+            events.append("collect")
+            raise KeyboardInterrupt
+
+        with patch.object(monitor, "_handle_retry_phase"), \
+             patch.object(monitor, "_flush_batch", side_effect=lambda b: events.append("flush")), \
+             patch.object(monitor, "collect_snapshots", side_effect=collect), \
+             patch("orchestrator.monitor.tmux"):
+            with pytest.raises(KeyboardInterrupt):
+                monitor.run_monitor_loop_global([loaded_config], state_manager, 2, "sess",
+                                                no_delay=True)
+        assert events[:2] == ["flush", "collect"]
+
+    def test_global_loop_does_not_swallow_unexpected_reload_errors(self, loaded_config, state_manager):
+        from orchestrator import monitor
+        with patch.object(monitor, "load_config_cached", side_effect=RuntimeError("bug")), \
+             patch("orchestrator.monitor.tmux"):
+            with pytest.raises(RuntimeError):
+                monitor.run_monitor_loop_global([loaded_config], state_manager, 2, "sess",
+                                                no_delay=True)
+
+
+class TestLaunchCommand:
+
+    def test_launch_uses_worker_state_paths(self, state_manager):
+        from orchestrator.monitor import _launch_claude
+        with patch("orchestrator.monitor.tmux") as mock_tmux:
+            _launch_claude("sess", state_manager, 3, "/tmp/wt/7", 7, "review", "do the review",
+                           append=True)
+
+        session, window, cmd = mock_tmux.send_command.call_args.args
+        assert (session, window) == ("sess", "worker-3")
+        assert cmd.startswith("cd /tmp/wt/7 && ")
+        assert f'"$(cat {state_manager.prompt_path(3)})"' in cmd
+        assert f">> {state_manager.log_path(3)} " in cmd
+        assert cmd.endswith(f"echo $EC > {state_manager.signal_path(3)}")
+        assert "issue=#7 stage=review" in cmd
+        assert cmd.count("$(date ") == 2  # START and EXIT are stamped when they run
+        assert state_manager.prompt_path(3).read_text() == "do the review"
+
+    def test_send_command_is_literal_with_enter_in_one_call(self):
+        import subprocess
+        from orchestrator import tmux
+        with patch("orchestrator.tmux._run",
+                   return_value=subprocess.CompletedProcess([], 0)) as mock_run:
+            tmux.send_command("sess", "worker-1", "echo Enter; true;")
+
+        mock_run.assert_called_once_with([
+            "tmux", "send-keys", "-t", "sess:worker-1", "-l", "echo Enter; true\\;",
+            ";", "send-keys", "-t", "sess:worker-1", "Enter",
+        ])
+
+    def test_batch_sends_queued_keys_in_one_call(self):
+        import subprocess
+        from orchestrator import tmux
+        batch = tmux.CommandBatch()
+        with patch("orchestrator.tmux._run",
+                   return_value=subprocess.CompletedProcess([], 0)) as mock_run:
+            batch.flush()  # nothing queued: no tmux call
+            batch.send_command("sess", "worker-1", "echo one")
+            batch.send_ctrl_c("sess", "worker-2")
+            batch.send_command("sess", "worker-2", "echo two;")
+            mock_run.assert_not_called()
+            batch.flush()
+            batch.flush()
+
+        mock_run.assert_called_once_with([
+            "tmux", "send-keys", "-t", "sess:worker-1", "-l", "echo one",
+            ";", "send-keys", "-t", "sess:worker-1", "Enter",
+            ";", "send-keys", "-t", "sess:worker-2", "C-c",
+            ";", "send-keys", "-t", "sess:worker-2", "-l", "echo two\\;",
+            ";", "send-keys", "-t", "sess:worker-2", "Enter",
+        ])
+
+    def test_batch_resends_past_a_missing_window(self, capsys):
+        import subprocess
+        from orchestrator import monitor, tmux
+        batch = tmux.CommandBatch()
+        batch.send_command("sess", "worker-1", "echo one")
+        batch.send_command("sess", "worker-2", "echo two")
+        batch.send_command("sess", "worker-3", "echo three")
+
+        def run(args, **kwargs):
+            if "sess:worker-2" in args:  # the whole chain, or worker-2 alone
+                raise subprocess.CalledProcessError(1, args)
+            return subprocess.CompletedProcess(args, 0)
+
+        with patch("orchestrator.tmux._run", side_effect=run) as mock_run, \
+             patch("orchestrator.tmux.list_pane_pids", return_value={"worker-1": 11, "worker-3": 33}):
+            monitor._flush_batch(batch)
+
+        resent = [c.args[0][3] for c in mock_run.call_args_list[1:]]
+        assert resent == ["sess:worker-2", "sess:worker-3"]  # worker-1 went through the chain
+        out = capsys.readouterr().out
+        assert "WARNING: tmux keys for sess:worker-2 were not delivered" in out
+        assert "worker-3 were not" not in out
+        assert batch.flush() == []
+
+    def test_batch_failure_of_unknown_extent_is_not_resent(self):
+        import subprocess
+        from orchestrator import tmux
+        batch = tmux.CommandBatch()
+        batch.send_command("sess", "worker-1", "echo one")
+        batch.send_ctrl_c("sess", "worker-2")
+        with patch("orchestrator.tmux._run",
+                   side_effect=subprocess.TimeoutExpired("tmux", 30)) as mock_run:
+            assert batch.flush() == ["sess:worker-1", "sess:worker-2"]
+        mock_run.assert_called_once()
+
+    def test_launch_queues_on_batch(self, state_manager):
+        from orchestrator.monitor import _launch_claude
+        batch = MagicMock()
+        with patch("orchestrator.monitor.tmux") as mock_tmux:
+            _launch_claude("sess", state_manager, 3, "/tmp/wt/7", 7, "review", "p", batch=batch)
+        mock_tmux.send_command.assert_not_called()
+        assert batch.send_command.call_args.args[:2] == ("sess", "worker-3")
+
 
 class TestMonitorCycleExecution:
 
@@ -122,7 +710,7 @@ class TestMonitorCycleExecution:
 
         from orchestrator.decisions import compute_decision
         snap = self._make_finished_snapshot(1, 24, exit_code=1, has_commits=False)
-        snap = WorkerSnapshot(**{**snap.__dict__, 'retry_count': loaded_config.max_retries + 1})
+        snap = dataclasses.replace(snap, retry_count=loaded_config.max_retries + 1)
 
         decisions = compute_decision(snap, loaded_config, state_manager, set())
         actions = [d.action for d in decisions]
@@ -136,6 +724,37 @@ class TestMonitorCycleExecution:
             assert failed >= 2  # Issue 27 was already failed + issue 24
 
 
+class TestAllDone:
+
+    def test_pending_issue_short_circuits_worker_scan(self, loaded_config, state_manager):
+        from orchestrator.monitor import all_done
+        with patch.object(state_manager, "load_worker") as mock_load:
+            assert not all_done(loaded_config, state_manager)
+        mock_load.assert_not_called()
+
+    def test_uses_given_counts(self, loaded_config, state_manager):
+        from collections import Counter
+        from orchestrator.monitor import all_done, all_done_global
+        done = Counter(completed=len(loaded_config.issues))
+        with patch("orchestrator.monitor.status_counts") as mock_counts:
+            assert all_done(loaded_config, state_manager, done)
+            assert all_done_global([loaded_config], state_manager, 2, [done])
+        mock_counts.assert_not_called()
+
+    def test_worker_scan_served_from_cycle_snapshot(self, loaded_config, state_manager):
+        from collections import Counter
+        from orchestrator.monitor import all_done
+        done = Counter(completed=len(loaded_config.issues))
+        state_manager.save_worker(Worker(worker_id=1, status="running", issue_number=1))
+        state_manager.begin_cycle()
+        for i in range(1, loaded_config.num_workers + 1):
+            state_manager.load_worker(i)  # as collect_snapshots does
+        with patch("orchestrator.state.read_json") as mock_read:
+            assert not all_done(loaded_config, state_manager, done)
+        state_manager.end_cycle()
+        mock_read.assert_not_called()
+
+
 class TestDeadmanRecovery:
     """Tests for auto-recovery of missing signal file from DEADMAN EXIT in log."""
 
@@ -198,6 +817,34 @@ class TestDeadmanRecovery:
         assert snap.signal_exists, "Signal should be recovered"
         assert snap.exit_code == 1, f"Exit code should be 1, got: {snap.exit_code}"
 
+    def test_exit_from_earlier_phase_is_not_recovered(self, loaded_config, state_manager):
+        """An EXIT followed by a newer START belongs to the previous phase's run."""
+        state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="/tmp/wt/1")
+
+        log_path = state_manager.log_path(1)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(
+            "[DEADMAN] START worker=1 issue=#1 stage=retry_analyze time=2024-01-01T11:00:00\n"
+            "[DEADMAN] EXIT worker=1 issue=#1 stage=retry_analyze code=0 time=2024-01-01T12:00:00\n"
+            "[DEADMAN] START worker=1 issue=#1 stage=retry_explore time=2024-01-01T12:00:01\n"
+        )
+
+        sig_path = state_manager.signal_path(1)
+        if sig_path.exists():
+            sig_path.unlink()
+
+        with patch("orchestrator.monitor.tmux") as mock_tmux, \
+             patch("orchestrator.monitor.git") as mock_git:
+            mock_tmux.get_pane_pid.return_value = None
+            mock_git.is_claude_running.return_value = False
+            mock_git.get_status.return_value = ""
+            mock_git.get_recent_commits.return_value = ""
+
+            snap = collect_worker_snapshot(1, loaded_config, state_manager, "test-session")
+
+        assert not snap.signal_exists
+        assert not sig_path.exists()
+
     def test_no_deadman_no_recovery(self, loaded_config, state_manager):
         """Without DEADMAN EXIT in log, no recovery happens."""
         state_manager.init_worker(1, issue_number=1, branch="fix/issue-1", worktree="/tmp/wt/1")
@@ -51,6 +51,10 @@ class TestValidStages:
         }
         assert expected == VALID_STAGES
 
+    def test_every_stage_has_a_generator(self):
+        from orchestrator.prompt import _STAGE_GENERATORS
+        assert set(_STAGE_GENERATORS) == VALID_STAGES
+
 
 class TestGeneratePrompt:
 
@@ -1,15 +1,18 @@
 """Tests for state persistence and edge cases."""
 
 import json
+import os
 import sys
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from orchestrator.models import Worker
-from orchestrator.state import StateManager, now_iso
+from orchestrator.state import LOG_TAIL_GUARD, LOG_TAIL_WINDOW, StateManager, now_iso
 
 
 class TestWorkerState:
@@ -49,6 +52,53 @@ class TestWorkerState:
         assert w.issue_number == 5
         assert w.branch == "fix/issue-5"
 
+    def test_optional_fields_omitted_when_empty(self, state_manager):
+        state_manager.save_worker(Worker(worker_id=1, status="idle"))
+        raw = json.loads(state_manager.worker_path(1).read_text())
+        assert "stage" not in raw and "source_config" not in raw
+        assert raw["issue_number"] is None
+
+        state_manager.save_worker(Worker(worker_id=1, stage="review", source_config="/c.json"))
+        loaded = state_manager.load_worker(1)
+        assert (loaded.stage, loaded.source_config) == ("review", "/c.json")
+
+
+class TestCycleSnapshot:
+
+    def test_worker_read_once_and_written_once_per_cycle(self, state_manager):
+        state_manager.save_worker(Worker(worker_id=1, issue_number=5, status="running"))
+        state_manager.begin_cycle()
+        with patch("orchestrator.state.read_json", side_effect=lambda p: json.loads(p.read_text())) as mock_read, \
+             patch("orchestrator.state.atomic_write") as mock_write:
+            for retry in (1, 2):
+                w = state_manager.load_worker(1)
+                w.retry_count = retry
+                state_manager.save_worker(w)
+            assert state_manager.load_worker(1).retry_count == 2
+            mock_write.assert_not_called()
+            state_manager.end_cycle()
+        assert mock_read.call_count == 1
+        assert mock_write.call_count == 1
+        state_manager.end_cycle()  # no cycle open: nothing to do
+
+    def test_unsaved_changes_do_not_leak_into_snapshot(self, state_manager):
+        state_manager.save_worker(Worker(worker_id=1, status="running", commits=["a"]))
+        state_manager.begin_cycle()
+        w = state_manager.load_worker(1)
+        w.status = "idle"
+        w.commits.append("b")
+        again = state_manager.load_worker(1)
+        assert again.status == "running"
+        assert again.commits == ["a"]
+        state_manager.end_cycle()
+
+    def test_saves_reach_disk_at_end_of_cycle(self, state_manager):
+        state_manager.begin_cycle()
+        state_manager.save_worker(Worker(worker_id=2, status="running"))
+        assert not state_manager.worker_path(2).exists()
+        state_manager.end_cycle()
+        assert state_manager.load_worker(2).status == "running"
+
 
 class TestIssueStatusUpdates:
 
@@ -157,6 +207,40 @@ class TestSignalFiles:
         """Clearing a signal that doesn't exist should not crash."""
         state_manager.clear_signal(99)  # Should not raise
 
+    def test_worker_paths_built_once(self, state_manager):
+        project = state_manager.cfg.project or "default"
+        assert str(state_manager.signal_path(2)) == f"/tmp/{project}-signal-2"
+        assert str(state_manager.log_path(2)) == f"/tmp/{project}-worker-2.log"
+        assert str(state_manager.prompt_path(2)) == f"/tmp/{project}-worker-prompt-2.md"
+        assert state_manager.log_path(2) is state_manager.log_path(2)
+
+
+class TestPromptFiles:
+
+    def test_write_prompt_is_utf8(self, state_manager):
+        path = state_manager.write_prompt(97, "Fix \u2192 r\u00e9sum\u00e9 \u2713\n")
+        try:
+            assert path == state_manager.prompt_path(97)
+            assert path.read_bytes().decode("utf-8") == "Fix \u2192 r\u00e9sum\u00e9 \u2713\n"
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_identical_prompt_not_rewritten(self, state_manager):
+        path = state_manager.write_prompt(97, "same prompt\n")
+        try:
+            with patch("pathlib.Path.write_bytes") as mock_write:
+                state_manager.write_prompt(97, "same prompt\n")
+            mock_write.assert_not_called()
+
+            path.write_text("edited elsewhere\n")
+            state_manager.write_prompt(97, "same prompt\n")
+            assert path.read_text() == "same prompt\n"
+            state_manager.write_prompt(97, "new prompt\n")
+            assert path.read_text() == "new prompt\n"
+            assert not path.with_suffix(".tmp").exists()
+        finally:
+            path.unlink(missing_ok=True)
+
 
 class TestEventLogging:
 
@@ -178,3 +262,112 @@ class TestEventLogging:
         log_path = state_manager.cfg.state_dir / "orchestrator-log.jsonl"
         lines = [l for l in log_path.read_text().strip().split("\n") if l]
         assert len(lines) >= 2
+
+    def test_deferred_events_written_on_flush(self, state_manager):
+        log_path = state_manager.event_log_path
+        state_manager.defer_events()
+        state_manager.log_event({"action": "action1"})
+        state_manager.log_event({"action": "action2"})
+        assert not log_path.exists()
+
+        state_manager.flush_events()
+        actions = [json.loads(l)["event"]["action"] for l in log_path.read_text().splitlines()]
+        assert actions == ["action1", "action2"]
+        state_manager.flush_events()
+        assert len(log_path.read_text().splitlines()) == 2
+
+    def test_event_lines_same_with_and_without_orjson(self, state_manager):
+        from orchestrator import state as state_mod
+        state_manager.log_event({"action": "fast", "worker": 1})
+        with patch.object(state_mod, "orjson", None):
+            state_manager.log_event({"action": "plain", "worker": 1})
+        lines = state_manager.event_log_path.read_text().splitlines()
+        assert [json.loads(l)["event"] for l in lines] == [
+            {"action": "fast", "worker": 1}, {"action": "plain", "worker": 1}]
+
+
+class TestIncrementalLogTail:
+
+    @pytest.fixture(autouse=True)
+    def clean_log(self, state_manager):
+        # Worker logs live in /tmp, outside the per-test state dir
+        state_manager.log_path(1).unlink(missing_ok=True)
+        yield
+        state_manager.log_path(1).unlink(missing_ok=True)
+
+    def _append(self, state, worker_id, text):
+        path = state.log_path(worker_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            f.write(text)
+
+    def test_matches_full_read_as_log_grows(self, state_manager):
+        assert state_manager.tail_log(1, lines=3) == ""
+        for chunk in ["a\nb\n", "c", "ont\nd\ne\n", "", "f"]:
+            self._append(state_manager, 1, chunk)
+            assert state_manager.tail_log(1, lines=3) == state_manager.get_log_tail(1, lines=3)
+        assert state_manager.tail_log(1, lines=3) == "d\ne\nf"
+
+    def test_rewritten_log_is_reread(self, state_manager):
+        self._append(state_manager, 1, "old line 1\nold line 2\n")
+        state_manager.tail_log(1, lines=5)
+        state_manager.log_path(1).write_text("new run line 1\nnew run line 2\nnew run line 3\n")
+        assert state_manager.tail_log(1, lines=5) == "new run line 1\nnew run line 2\nnew run line 3"
+
+    def test_only_new_bytes_are_read(self, state_manager):
+        self._append(state_manager, 1, "x" * 1000 + "\n")
+        state_manager.tail_log(1, lines=2)
+        self._append(state_manager, 1, "tail\n")
+        with patch("orchestrator.state.os.pread", wraps=os.pread) as spy:
+            assert state_manager.tail_log(1, lines=2) == "x" * 1000 + "\ntail"
+        assert sum(c.args[1] for c in spy.call_args_list) <= LOG_TAIL_GUARD + len("tail\n")
+
+    def test_large_log_reads_only_its_end(self, state_manager):
+        self._append(state_manager, 1, "".join(f"line {i}\n" for i in range(200_000)))
+        with patch("orchestrator.state.os.pread", wraps=os.pread) as spy:
+            assert state_manager.tail_log(1, lines=3) == "line 199997\nline 199998\nline 199999"
+        assert sum(c.args[1] for c in spy.call_args_list) <= LOG_TAIL_WINDOW + 1
+
+        self._append(state_manager, 1, "y" * 100 + "\n" + "z" * 100)
+        with patch("orchestrator.state.LOG_TAIL_WINDOW", 64):
+            assert state_manager.tail_log(1, lines=3) == state_manager.get_log_tail(1, lines=3)
+
+    def test_unchanged_stat_skips_reading(self, state_manager):
+        self._append(state_manager, 1, "a\nb\n")
+        stat = state_manager.get_log_stats(1)
+        assert state_manager.tail_log(1, lines=5, stat=stat) == "a\nb"
+        with patch("orchestrator.state.os.open") as mock_open:
+            assert state_manager.tail_log(1, lines=5, stat=stat) == "a\nb"
+        mock_open.assert_not_called()
+
+        state_manager.truncate_log(1)
+        self._append(state_manager, 1, "c\n")
+        assert state_manager.tail_log(1, lines=5, stat=stat) == "c"
+
+
+class TestNowIso:
+
+    def test_format_and_per_second_reuse(self):
+        from datetime import datetime, timezone
+        with patch("orchestrator.state.time.time", return_value=1_700_000_000.9), \
+             patch("orchestrator.state.time.strftime", wraps=time.strftime) as spy:
+            first, second = now_iso(), now_iso()
+        assert first == second == datetime.fromtimestamp(
+            1_700_000_000, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        assert spy.call_count == 1
+
+
+class TestJsonBackend:
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_atomic_write_round_trip(self, tmp_path, use_orjson):
+        from unittest.mock import patch
+        from orchestrator import state as state_mod
+        if use_orjson and state_mod.orjson is None:
+            pytest.skip("orjson not installed")
+        data = {"issues": [{"number": 1, "depends_on": [], "title": "é"}], "extra": {}}
+        path = tmp_path / "cfg.json"
+        with patch.object(state_mod, "orjson", state_mod.orjson if use_orjson else None):
+            state_mod.atomic_write(path, data)
+            assert state_mod.read_json(path) == data
+        assert path.read_text(encoding="utf-8").endswith("}\n")
@@ -0,0 +1,83 @@
+"""Tests for signal-file wakeups."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from orchestrator import watch
+from orchestrator.watch import PROCESS_EXITED, SignalWatcher
+
+needs_inotify = pytest.mark.skipif(watch._libc is None or not sys.platform.startswith("linux"),
+                                   reason="inotify not available")
+needs_pidfd = pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd_open not available")
+
+
+def write_later(path, delay=0.1, text="0\n"):
+    t = threading.Timer(delay, path.write_text, args=(text,))
+    t.start()
+    return t
+
+
+class TestSignalWatcher:
+
+    @needs_inotify
+    def test_wakes_when_signal_written(self, tmp_path):
+        signal = tmp_path / "proj-signal-1"
+        watcher = SignalWatcher([signal, tmp_path / "proj-signal-2"])
+        assert watcher.active
+        write_later(signal)
+        start = time.monotonic()
+        assert watcher.wait(5) == {"proj-signal-1"}
+        assert time.monotonic() - start < 2
+        watcher.close()
+
+    @needs_inotify
+    def test_ignores_unrelated_files(self, tmp_path):
+        watcher = SignalWatcher([tmp_path / "proj-signal-1"])
+        write_later(tmp_path / "other-file")
+        assert watcher.wait(0.5) == set()
+        watcher.close()
+
+    def test_falls_back_to_sleep_without_inotify(self, tmp_path):
+        with patch.object(watch, "_libc", None), \
+             patch("orchestrator.watch.time.sleep") as mock_sleep:
+            watcher = SignalWatcher([tmp_path / "proj-signal-1"])
+            assert not watcher.active
+            assert watcher.wait(30) == set()
+        mock_sleep.assert_called_once_with(30)
+
+    @needs_pidfd
+    def test_wakes_when_watched_process_exits(self, tmp_path):
+        proc = subprocess.Popen(["sleep", "0.2"])
+        fd = os.pidfd_open(proc.pid)
+        try:
+            watcher = SignalWatcher([tmp_path / "proj-signal-1"])
+            start = time.monotonic()
+            assert watcher.wait(5, [fd]) == {PROCESS_EXITED}
+            assert time.monotonic() - start < 2
+            watcher.close()
+        finally:
+            proc.wait()
+            os.close(fd)
+
+    @needs_pidfd
+    def test_already_exited_process_does_not_cut_wait_short(self, tmp_path):
+        proc = subprocess.Popen(["true"])
+        fd = os.pidfd_open(proc.pid)
+        proc.wait()
+        try:
+            watcher = SignalWatcher([tmp_path / "proj-signal-1"])
+            start = time.monotonic()
+            assert watcher.wait(0.3, [fd]) == set()
+            assert time.monotonic() - start >= 0.25
+            watcher.close()
+        finally:
+            os.close(fd)